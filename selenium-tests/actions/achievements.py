@@ -1,6 +1,9 @@
 """
 Ações de conquistas (achievements) - DailyQuest
 """
+import asyncio
+import json
+import logging
 import sys
 from pathlib import Path
 
@@ -14,10 +17,12 @@ from utils import (
     wait_for_element,
     wait_for_clickable,
     safe_click,
+    find_element,
+    find_elements,
     find_element_safe,
     log_action
 )
-from config import DEFAULT_DELAY
+from config import DEFAULT_DELAY, DEFAULT_TIMEOUT
 import ui_selectors as selectors
 
 
@@ -34,7 +39,7 @@ def open_achievements_modal(driver):
             except Exception:
                 driver.execute_script("arguments[0].click();", btn)
         except Exception:
-            btn = wait_for_clickable(driver, (By.XPATH, "//button[contains(., 'Conquistas') or contains(., 'Achievements') or contains(., 'Ver Todas')]"), timeout=4)
+            btn = wait_for_clickable(driver, selectors.ACHIEVEMENTS_BUTTON_FALLBACK, timeout=4)
             try:
                 btn.click()
             except Exception:
@@ -44,21 +49,18 @@ def open_achievements_modal(driver):
         wait(0.3)
 
         # Verifica se modal abriu
-        modal = wait_for_element(driver, (
-            By.CSS_SELECTOR,
-            "[role='dialog'], [class*='modal']"
-        ), timeout=6)
+        modal = wait_for_element(driver, selectors.MODAL, timeout=6)
 
         log_action("Modal de conquistas aberto")
         return True
     except Exception as e:
         log_action("Erro ao abrir modal de conquistas", str(e)[:120])
         try:
-            alt = driver.find_element(By.XPATH, "//a[contains(., 'Conquistas') or contains(., 'Achievements')]")
+            alt = find_element(driver, selectors.ACHIEVEMENTS_LINK)
             driver.execute_script("arguments[0].click();", alt)
             wait(0.3)
-            modal = wait_for_element(driver, (By.CSS_SELECTOR, "[role='dialog'], [class*='modal']"), timeout=5)
-            log_action("Modal de conquistas aberto via fallback")
+            modal = wait_for_element(driver, selectors.MODAL, timeout=5)
+            log_action("Modal de conquistas aberto via fallback", level=logging.DEBUG)
             return True
         except Exception as e2:
             log_action("Falha ao abrir modal mesmo com fallback", str(e2)[:120])
@@ -79,10 +81,7 @@ def close_achievements_modal(driver):
     
     try:
         # Procura botão de fechar (X, Close, Fechar)
-        close_button = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(@aria-label, 'Close') or contains(@aria-label, 'Fechar') or contains(text(), '×')]"
-        ), timeout=4)
+        close_button = wait_for_clickable(driver, selectors.CLOSE_BUTTON, timeout=4)
         try:
             close_button.click()
         except Exception:
@@ -122,13 +121,11 @@ def count_achievements(driver):
     
     try:
         # Conta todas as conquistas
-        all_achievements = driver.find_elements(By.CSS_SELECTOR, "[class*='achievement'], [data-achievement]")
+        all_achievements = find_elements(driver, selectors.ACHIEVEMENT_ITEMS)
         total = len(all_achievements)
         
         # Conta conquistas desbloqueadas (não locked/grayscale)
-        unlocked_achievements = driver.find_elements(By.XPATH, 
-            "//div[contains(@class, 'achievement') and not(contains(@class, 'locked')) and not(contains(@class, 'grayscale'))]"
-        )
+        unlocked_achievements = find_elements(driver, selectors.UNLOCKED_ACHIEVEMENTS)
         unlocked = len(unlocked_achievements)
         
         log_action("Conquistas", f"{unlocked}/{total} desbloqueadas")
@@ -144,10 +141,7 @@ def search_achievement(driver, search_term):
     
     try:
         # Procura campo de busca
-        search_field = wait_for_clickable(driver, (
-            By.CSS_SELECTOR,
-            "input[type='search'], input[placeholder*='Buscar'], input[placeholder*='Search']"
-        ), timeout=5)
+        search_field = wait_for_clickable(driver, selectors.ACHIEVEMENT_SEARCH, timeout=5)
         
         search_field.clear()
         search_field.send_keys(search_term)
@@ -185,7 +179,7 @@ def scroll_achievements(driver):
     
     try:
         # Procura container de conquistas
-        modal = driver.find_element(By.CSS_SELECTOR, "[role='dialog'], [class*='modal']")
+        modal = find_element(driver, selectors.MODAL)
         
         # Scroll rápido dentro do modal
         driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight / 2", modal)
@@ -199,3 +193,44 @@ def scroll_achievements(driver):
     except Exception as e:
         log_action("Modal não encontrado")
         return False
+
+
+# ===== Versões assíncronas (cdp_async.Page, executadas em abas paralelas) =====
+
+async def open_achievements_modal_async(page):
+    """Abre o modal de conquistas em uma aba CDP (esperas por evento)"""
+    log_action("Abrindo modal de conquistas (aba assíncrona)")
+    await page.click(selectors.ACHIEVEMENTS_BUTTON)
+    await page.wait_for(selectors.MODAL_DIALOG)
+    return True
+
+
+async def count_achievements_async(page, timeout=DEFAULT_TIMEOUT):
+    """
+    Abre o modal e conta os cards de conquistas em uma única avaliação
+
+    O modal só lista as conquistas do usuário (todas desbloqueadas) e mostra
+    um spinner enquanto as busca; a contagem espera o fim do carregamento.
+    Falha se o modal não terminar de carregar ou não tiver nenhuma conquista.
+    """
+    await open_achievements_modal_async(page)
+    counts = await page.evaluate("""(function (cards, loading, timeoutMs) {
+      return new Promise(function (resolve) {
+        var start = performance.now();
+        (function check() {
+          var busy = !!document.querySelector(loading);
+          if (busy && performance.now() - start < timeoutMs) return setTimeout(check, 50);
+          var total = document.querySelectorAll(cards).length;
+          resolve({total: total, unlocked: total, loaded: !busy});
+        })();
+      });
+    })(%s, %s, %d)""" % (
+        json.dumps(selectors.ACHIEVEMENT_CARDS[1]), json.dumps(selectors.ACHIEVEMENTS_LOADING[1]),
+        int(timeout * 1000)
+    ), timeout)
+    if not counts["loaded"]:
+        raise asyncio.TimeoutError("Modal de conquistas não terminou de carregar")
+    if not counts["total"]:
+        raise RuntimeError("Nenhuma conquista no modal")
+    log_action("Conquistas", f"{counts['unlocked']}/{counts['total']} desbloqueadas")
+    return counts
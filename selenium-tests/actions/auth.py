@@ -7,7 +7,6 @@ from pathlib import Path
 # Adiciona diretório pai ao path para imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from selenium.webdriver.common.by import By
 from utils import (
     wait,
     wait_for_element,
@@ -17,7 +16,9 @@ from utils import (
     slow_type,
     log_action
 )
-from config import BASE_URL, DEFAULT_DELAY
+from config import BASE_URL, DEFAULT_DELAY, SESSION_CACHE_ENABLED
+import session_cache
+import ui_selectors as selectors
 from validators import validate_username, validate_email, validate_password, ValidationError
 
 
@@ -29,8 +30,8 @@ def navigate_to_login(driver):
     wait_for_url_contains(driver, "/login")
 
 
-def login(driver, username, password):
-    """Realiza login no sistema"""
+def login(driver, username, password, use_cache=SESSION_CACHE_ENABLED):
+    """Realiza login no sistema (reaproveita sessão em cache quando válida)"""
     # Valida campos antes de preencher
     try:
         username = validate_username(username)
@@ -41,22 +42,25 @@ def login(driver, username, password):
     
     log_action("Login", f"Usuário: {username}")
     
+    if use_cache and session_cache.restore(driver, username):
+        return True
+    
     # Navega para login se não estiver lá
     if "/login" not in driver.current_url:
         navigate_to_login(driver)
     
     # Preenche username
-    username_field = wait_for_clickable(driver, (By.ID, "username"))
+    username_field = wait_for_clickable(driver, selectors.USERNAME)
     username_field.clear()
     username_field.send_keys(username)
     
     # Preenche password
-    password_field = wait_for_clickable(driver, (By.ID, "password"))
+    password_field = wait_for_clickable(driver, selectors.PASSWORD)
     password_field.clear()
     password_field.send_keys(password)
     
     # Clica em entrar
-    login_button = wait_for_clickable(driver, (By.CSS_SELECTOR, "button[type='submit']"))
+    login_button = wait_for_clickable(driver, selectors.SUBMIT_BUTTON)
     login_button.click()
     wait(0.3)
     
@@ -64,6 +68,8 @@ def login(driver, username, password):
     success = wait_for_url_contains(driver, "/dashboard", timeout=5)
     if success:
         log_action("Login realizado com sucesso")
+        if use_cache:
+            session_cache.save(driver, username)
     
     return success
 
@@ -93,25 +99,25 @@ def register(driver, username, email, password):
         navigate_to_register(driver)
     
     # Preenche name (campo do registro é "name", não "username")
-    name_field = wait_for_clickable(driver, (By.ID, "name"))
+    name_field = wait_for_clickable(driver, selectors.REGISTER_NAME)
     name_field.clear()
     slow_type(name_field, username)
     wait(0.3)  # Reduzido de DEFAULT_DELAY (2.0)
     
     # Preenche email
-    email_field = wait_for_clickable(driver, (By.ID, "email"))
+    email_field = wait_for_clickable(driver, selectors.EMAIL)
     email_field.clear()
     slow_type(email_field, email)
     wait(0.3)  # Reduzido de DEFAULT_DELAY (2.0)
     
     # Preenche password
-    password_field = wait_for_clickable(driver, (By.ID, "password"))
+    password_field = wait_for_clickable(driver, selectors.PASSWORD)
     password_field.clear()
     slow_type(password_field, password)
     wait(0.3)  # Reduzido de DEFAULT_DELAY (2.0)
     
     # Clica em registrar
-    register_button = wait_for_clickable(driver, (By.CSS_SELECTOR, "button[type='submit']"))
+    register_button = wait_for_clickable(driver, selectors.SUBMIT_BUTTON)
     register_button.click()
     wait(0.4)
     
@@ -129,19 +135,31 @@ def logout(driver):
     """Realiza logout do sistema"""
     log_action("Logout")
     
+    try:
+        username = driver.execute_script(
+            "try { return JSON.parse(localStorage.getItem(arguments[0]) || '{}').username || ''; }"
+            " catch (e) { return ''; }",
+            session_cache.USER_KEY
+        )
+    except Exception:
+        username = ""
+    
     try:
         # Tenta clicar no botão de profile/menu
-        profile_button = safe_click(driver, (By.CSS_SELECTOR, "button[aria-label='Profile']"))
+        profile_button = safe_click(driver, selectors.PROFILE_BUTTON)
         wait(0.25)
         
         # Clica em logout
-        logout_button = safe_click(driver, (By.XPATH, "//button[contains(text(), 'Sair') or contains(text(), 'Logout')]"))
+        logout_button = safe_click(driver, selectors.LOGOUT_BUTTON)
         wait(0.25)
         
         # Verifica se voltou para login
         success = wait_for_url_contains(driver, "/login", timeout=5)
         if success:
             log_action("Logout realizado com sucesso")
+            # Sessão encerrada explicitamente: não reaproveitar o token
+            if username:
+                session_cache.invalidate(username)
         return success
         
     except Exception as e:
@@ -16,6 +16,7 @@ from utils import (
     log_action
 )
 from config import BASE_URL, DEFAULT_DELAY
+import ui_selectors as selectors
 
 
 def navigate_to_dashboard(driver):
@@ -48,3 +49,10 @@ def scroll_dashboard(driver):
     # Volta para o topo
     driver.execute_script("window.scrollTo({top: 0, behavior: 'smooth'});")
     wait(0.4)
+
+
+async def verify_dashboard_elements_async(page):
+    """Verifica o dashboard em uma aba CDP: espera o botão "Nova Tarefa" por evento"""
+    await page.wait_for(selectors.NEW_TASK_BUTTON)
+    log_action("Dashboard carregado (aba assíncrona)")
+    return {"dashboard": True}
@@ -1,6 +1,7 @@
 """
 Ações de hábitos - DailyQuest
 """
+import logging
 import sys
 from pathlib import Path
 
@@ -8,8 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from selenium.webdriver.common.by import By
-from utils import wait, wait_for_clickable, safe_click, log_action
+from utils import wait, wait_for_clickable, safe_click, log_action, find_element
 import ui_selectors as selectors
+import batch
 from datetime import datetime, timedelta
 from validators import (
     validate_title, 
@@ -19,6 +21,14 @@ from validators import (
     ValidationError
 )
 
+def _tag_row(tag_name):
+    """Locator da linha de uma tag no gerenciador"""
+    return (
+        By.XPATH,
+        f"//div[@role='dialog']//div[contains(@class, 'glass') and .//span[contains(text(), '{tag_name}')]]"
+    )
+
+
 def create_habit(driver, title, description="", difficulty="medium"):
     """Cria um novo hábito (padrão tipo 'habit')"""
     # Valida campos antes de preencher
@@ -43,9 +53,9 @@ def create_habit(driver, title, description="", difficulty="medium"):
         except Exception:
             driver.execute_script("arguments[0].click();", btn)
     except Exception:
-        log_action("Não encontrou botão 'Nova Tarefa', tentando alternativa")
+        log_action("Não encontrou botão 'Nova Tarefa', tentando alternativa", level=logging.DEBUG)
         try:
-            btn = driver.find_element(By.XPATH, "//button[contains(., 'Nova')]")
+            btn = find_element(driver, selectors.NEW_TASK_FALLBACK)
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", btn)
             driver.execute_script("arguments[0].click();", btn)
         except Exception:
@@ -96,9 +106,9 @@ def create_todo(driver, title, description="", deadline=""):
         except Exception:
             driver.execute_script("arguments[0].click();", btn)
     except Exception:
-        log_action("Botão 'Nova Tarefa' não encontrado, tentando alternativa")
+        log_action("Botão 'Nova Tarefa' não encontrado, tentando alternativa", level=logging.DEBUG)
         try:
-            btn = driver.find_element(By.XPATH, "//button[contains(., 'Nova')]")
+            btn = find_element(driver, selectors.NEW_TASK_FALLBACK)
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", btn)
             driver.execute_script("arguments[0].click();", btn)
         except Exception:
@@ -146,7 +156,7 @@ def create_todo(driver, title, description="", deadline=""):
         submit = wait_for_clickable(driver, selectors.MODAL_SUBMIT, timeout=5)
         submit.click()
     except Exception:
-        submit = driver.find_element(By.CSS_SELECTOR, "[role='dialog'] button[type='submit']")
+        submit = find_element(driver, selectors.MODAL_SUBMIT)
         driver.execute_script("arguments[0].click();", submit)
     
     wait(0.3)
@@ -159,10 +169,7 @@ def complete_first_habit(driver):
     log_action("Completando primeiro hábito")
     try:
         # Procura primeiro checkbox não marcado na aba de hábitos
-        checkbox = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(@class, 'rounded-full') and contains(@class, 'border-2') and not(contains(@class, 'bg-green'))]"
-        ), timeout=5)
+        checkbox = wait_for_clickable(driver, selectors.HABIT_UNCHECKED, timeout=5)
         checkbox.click()
         wait(0.3)
         log_action("Hábito completado")
@@ -173,35 +180,18 @@ def complete_first_habit(driver):
 
 
 def complete_multiple_habits(driver, count=2):
-    """Completa os primeiros N hábitos visíveis"""
+    """Completa os primeiros N hábitos visíveis (um único round-trip via JS)"""
     log_action(f"Completando {count} hábitos")
     completed = 0
     
-    for i in range(count):
-        try:
-            # Busca novamente os checkboxes a cada iteração para evitar stale element
-            checkboxes = driver.find_elements(By.XPATH,
-                "//button[contains(@class, 'rounded-full') and contains(@class, 'border-2') and not(contains(@class, 'bg-green'))]"
-            )
-            
-            if len(checkboxes) == 0:
-                log_action(f"Nenhum hábito não-completado encontrado (completados: {completed})")
-                break
-            
-            # Clica no primeiro checkbox disponível
-            try:
-                checkboxes[0].click()
-            except Exception:
-                # Se o click falhar, tenta JS
-                driver.execute_script("arguments[0].click();", checkboxes[0])
-            
-            completed += 1
-            wait(0.3)
-            log_action(f"Hábito {completed} completado")
-            
-        except Exception as e:
-            log_action(f"Erro ao completar hábito {i+1}: {str(e)[:50]}")
-            break
+    try:
+        # Re-localiza os checkboxes dentro do navegador após cada clique
+        completed = batch.click_each(driver, selectors.HABIT_UNCHECKED, count)
+        if completed < count:
+            log_action(f"Nenhum hábito não-completado encontrado (completados: {completed})")
+        wait(0.3)
+    except Exception as e:
+        log_action(f"Erro ao completar hábitos: {str(e)[:50]}")
     
     log_action(f"Total: {completed} hábitos completados")
     return True if completed > 0 else False
@@ -212,10 +202,7 @@ def uncomplete_first_habit(driver):
     log_action("Desmarcando hábito")
     try:
         # Procura checkbox marcado (verde com check)
-        checkbox = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(@class, 'bg-green-500')]"
-        ), timeout=5)
+        checkbox = wait_for_clickable(driver, selectors.HABIT_CHECKED, timeout=5)
         checkbox.click()
         wait(0.25)
         log_action("Hábito desmarcado")
@@ -229,10 +216,7 @@ def switch_to_todos_tab(driver):
     """Alterna para aba de Afazeres"""
     log_action("Alternando para aba Afazeres")
     try:
-        tab_button = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[@role='tab' and contains(., 'Afazeres')]"
-        ), timeout=5)
+        tab_button = wait_for_clickable(driver, selectors.TODOS_TAB, timeout=5)
         tab_button.click()
         wait(0.3)
         log_action("Aba Afazeres selecionada")
@@ -288,9 +272,9 @@ def create_habit_with_specific_days(driver, title, description="", difficulty="m
         except Exception:
             driver.execute_script("arguments[0].click();", btn)
     except Exception:
-        log_action("Não encontrou botão 'Nova Tarefa', tentando alternativa")
+        log_action("Não encontrou botão 'Nova Tarefa', tentando alternativa", level=logging.DEBUG)
         try:
-            btn = driver.find_element(By.XPATH, "//button[contains(., 'Nova')]")
+            btn = find_element(driver, selectors.NEW_TASK_FALLBACK)
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", btn)
             driver.execute_script("arguments[0].click();", btn)
         except Exception:
@@ -312,10 +296,7 @@ def create_habit_with_specific_days(driver, title, description="", difficulty="m
 
     # Seleciona frequência "Dias específicos"
     try:
-        specific_days_card = wait_for_clickable(driver, (
-            By.XPATH,
-            "//div[contains(., 'Dias específicos') and contains(@class, 'cursor-pointer')]"
-        ), timeout=4)
+        specific_days_card = wait_for_clickable(driver, selectors.SPECIFIC_DAYS_OPTION, timeout=4)
         try:
             specific_days_card.click()
         except Exception:
@@ -325,24 +306,17 @@ def create_habit_with_specific_days(driver, title, description="", difficulty="m
     except Exception as e:
         log_action(f"Erro ao selecionar frequência: {str(e)[:50]}")
 
-    # Seleciona os dias da semana
+    # Seleciona os dias da semana (todos em um único round-trip)
     day_labels = ["D", "S", "T", "Q", "Q", "S", "S"]  # Dom, Seg, Ter, Qua, Qui, Sex, Sáb
     
-    for day_index in days:
-        try:
-            day_buttons = driver.find_elements(By.XPATH, 
-                "//div[@role='dialog']//div[contains(@class, 'grid-cols-7')]//button[not(@disabled)]"
-            )
-            
-            if day_index < len(day_buttons):
-                day_btn = day_buttons[day_index]
-                try:
-                    day_btn.click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", day_btn)
-                log_action(f"Dia {day_labels[day_index]} selecionado")
-        except Exception as e:
-            log_action(f"Erro ao selecionar dia {day_index}: {str(e)[:50]}")
+    try:
+        outcome = batch.click(driver, selectors.DAY_BUTTONS, indices=[d for d in days if 0 <= d < 7])
+        if outcome["found"] >= 7:
+            log_action(f"Dias selecionados: {', '.join(day_labels[d] for d in days if 0 <= d < 7)}")
+        else:
+            log_action(f"Botões de dia encontrados: {outcome['found']} (cliques: {outcome['clicked']})")
+    except Exception as e:
+        log_action(f"Erro ao selecionar dias: {str(e)[:50]}")
 
     # Submete
     submit = wait_for_clickable(driver, selectors.MODAL_SUBMIT, timeout=5)
@@ -367,17 +341,14 @@ def open_tag_manager(driver):
         except Exception:
             driver.execute_script("arguments[0].click();", btn)
     except Exception:
-        btn = driver.find_element(By.XPATH, "//button[contains(., 'Nova')]")
+        btn = find_element(driver, selectors.NEW_TASK_FALLBACK)
         driver.execute_script("arguments[0].click();", btn)
     
     wait(0.4)
     
     # Clica no botão "Gerenciar Tags" dentro do modal
     try:
-        manage_tags_btn = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(., 'Gerenciar') or contains(., 'Gerenciar Tags')]"
-        ), timeout=5)
+        manage_tags_btn = wait_for_clickable(driver, selectors.MANAGE_TAGS_BUTTON, timeout=5)
         try:
             manage_tags_btn.click()
         except Exception:
@@ -399,29 +370,17 @@ def create_tag(driver, tag_name, color_index=0):
     
     try:
         # Preenche o nome da tag
-        tag_input = wait_for_clickable(driver, (
-            By.ID, "tag-name"
-        ), timeout=5)
+        tag_input = wait_for_clickable(driver, selectors.TAG_NAME, timeout=5)
         tag_input.clear()
         tag_input.send_keys(tag_name)
         
         # Seleciona a cor (se especificado um índice diferente de 0)
         if color_index > 0:
-            color_buttons = driver.find_elements(By.XPATH, 
-                "//div[@role='dialog']//button[contains(@class, 'rounded-full') and contains(@class, 'w-8')]"
-            )
-            if color_index < len(color_buttons):
-                try:
-                    color_buttons[color_index].click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", color_buttons[color_index])
+            if batch.click(driver, selectors.COLOR_BUTTONS, indices=[color_index])["clicked"]:
                 log_action(f"Cor {color_index} selecionada")
         
         # Clica no botão "Criar Tag"
-        create_btn = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(., 'Criar Tag')]"
-        ), timeout=5)
+        create_btn = wait_for_clickable(driver, selectors.CREATE_TAG_BUTTON, timeout=5)
         try:
             create_btn.click()
         except Exception:
@@ -441,41 +400,26 @@ def edit_tag(driver, tag_name, new_name="", new_color_index=-1):
     log_action(f"Editando tag: {tag_name}")
     
     try:
-        # Encontra a tag na lista e clica no botão de edição
-        tag_row = driver.find_element(By.XPATH, 
-            f"//div[@role='dialog']//div[contains(@class, 'glass') and .//span[contains(text(), '{tag_name}')]]"
-        )
-        edit_btn = tag_row.find_element(By.XPATH, ".//button[.//*[name()='svg']]")
-        try:
-            edit_btn.click()
-        except Exception:
-            driver.execute_script("arguments[0].click();", edit_btn)
+        # Encontra a tag na lista e clica no botão de edição (primeiro ícone da linha)
+        outcome = batch.click(driver, _tag_row(tag_name), indices=[0], within=selectors.ROW_ICON_BUTTONS)
+        if not outcome["clicked"]:
+            raise Exception(f"Tag '{tag_name}' não encontrada")
         wait(0.2)
         
         # Atualiza o nome se fornecido
         if new_name:
-            tag_input = wait_for_clickable(driver, (By.ID, "tag-name"), timeout=3)
+            tag_input = wait_for_clickable(driver, selectors.TAG_NAME, timeout=3)
             tag_input.clear()
             tag_input.send_keys(new_name)
             log_action(f"Nome alterado para: {new_name}")
         
         # Atualiza a cor se fornecido
         if new_color_index >= 0:
-            color_buttons = driver.find_elements(By.XPATH, 
-                "//div[@role='dialog']//button[contains(@class, 'rounded-full') and contains(@class, 'w-8')]"
-            )
-            if new_color_index < len(color_buttons):
-                try:
-                    color_buttons[new_color_index].click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", color_buttons[new_color_index])
+            if batch.click(driver, selectors.COLOR_BUTTONS, indices=[new_color_index])["clicked"]:
                 log_action(f"Nova cor {new_color_index} selecionada")
         
         # Clica no botão "Atualizar Tag"
-        update_btn = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(., 'Atualizar Tag')]"
-        ), timeout=5)
+        update_btn = wait_for_clickable(driver, selectors.UPDATE_TAG_BUTTON, timeout=5)
         try:
             update_btn.click()
         except Exception:
@@ -494,16 +438,8 @@ def delete_tag(driver, tag_name):
     
     try:
         # Encontra a tag na lista e clica no botão de deleção (segundo botão)
-        tag_row = driver.find_element(By.XPATH, 
-            f"//div[@role='dialog']//div[contains(@class, 'glass') and .//span[contains(text(), '{tag_name}')]]"
-        )
-        buttons = tag_row.find_elements(By.XPATH, ".//button[.//*[name()='svg']]")
-        if len(buttons) >= 2:
-            delete_btn = buttons[1]  # O segundo botão é o de deleção
-            try:
-                delete_btn.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", delete_btn)
+        outcome = batch.click(driver, _tag_row(tag_name), indices=[1], within=selectors.ROW_ICON_BUTTONS)
+        if outcome["clicked"]:
             wait(0.2)
             
             # Confirma a deleção no alert
@@ -1,6 +1,7 @@
 """
 Ações de perfil (profile) - DailyQuest
 """
+import logging
 import sys
 from pathlib import Path
 
@@ -14,10 +15,14 @@ from utils import (
     wait_for_element,
     wait_for_clickable,
     safe_click,
+    find_element,
+    find_elements,
     find_element_safe,
     log_action
 )
 from config import DEFAULT_DELAY
+import batch
+import ui_selectors as selectors
 
 
 def open_profile_modal(driver):
@@ -30,10 +35,7 @@ def open_profile_modal(driver):
     try:
         # O avatar é um SPAN com texto (iniciais do usuário) e cursor-pointer
         try:
-            avatar = wait_for_clickable(driver, (
-                By.XPATH,
-                "//span[contains(@class, 'cursor-pointer') and contains(@class, 'rounded-full') and contains(@class, 'border-2')]"
-            ), timeout=5)
+            avatar = wait_for_clickable(driver, selectors.AVATAR, timeout=5)
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", avatar)
             try:
                 avatar.click()
@@ -43,33 +45,27 @@ def open_profile_modal(driver):
             log_action("Avatar clicado, aguardando dropdown")
         except Exception as e:
             log_action(f"Erro ao clicar no avatar: {str(e)[:50]}")
-            avatar = driver.find_element(By.XPATH, "//span[string-length(text())=2 and contains(@class, 'rounded-full')]")
+            avatar = find_element(driver, selectors.AVATAR_FALLBACK)
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", avatar)
             driver.execute_script("arguments[0].click();", avatar)
             wait(0.2)
         
         # Clica em "Ver Perfil" no menu dropdown
         try:
-            profile_item = wait_for_clickable(driver, (
-                By.XPATH,
-                "//div[contains(text(), 'Ver Perfil')]"
-            ), timeout=5)
+            profile_item = wait_for_clickable(driver, selectors.PROFILE_MENU_ITEM, timeout=5)
             try:
                 profile_item.click()
             except Exception:
                 driver.execute_script("arguments[0].click();", profile_item)
         except Exception:
-            log_action("Tentando encontrar item 'Ver Perfil' por ícone")
-            profile_item = driver.find_element(By.XPATH, "//div[.//svg and contains(., 'Ver Perfil')]")
+            log_action("Tentando encontrar item 'Ver Perfil' por ícone", level=logging.DEBUG)
+            profile_item = find_element(driver, selectors.PROFILE_MENU_ITEM_FALLBACK)
             driver.execute_script("arguments[0].click();", profile_item)
         
         wait(0.2)
         
         # Verifica se modal abriu
-        modal = wait_for_element(driver, (
-            By.CSS_SELECTOR,
-            "[role='dialog'], [class*='modal']"
-        ), timeout=5)
+        modal = wait_for_element(driver, selectors.MODAL, timeout=5)
         
         log_action("Modal de perfil aberto")
         return True
@@ -91,10 +87,7 @@ def close_profile_modal(driver):
         pass
     
     try:
-        close_button = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(@aria-label, 'Close') or contains(@aria-label, 'Fechar') or contains(text(), '×') or @data-state='open']"
-        ), timeout=4)
+        close_button = wait_for_clickable(driver, selectors.PROFILE_CLOSE_BUTTON, timeout=4)
         try:
             close_button.click()
         except Exception:
@@ -120,10 +113,7 @@ def toggle_theme(driver):
     
     try:
         # Procura botão de tema
-        theme_button = safe_click(driver, (
-            By.XPATH,
-            "//button[contains(@aria-label, 'theme') or contains(@aria-label, 'tema') or contains(@title, 'Theme')]"
-        ))
+        theme_button = safe_click(driver, selectors.THEME_BUTTON)
         wait(DEFAULT_DELAY)
         
         log_action("Tema alternado")
@@ -140,36 +130,20 @@ def navigate_calendar_next(driver):
     try:
         # Primeiro, precisa ir para a aba "Progresso" onde está o calendário
         try:
-            progress_tab = wait_for_clickable(driver, (
-                By.XPATH,
-                "//button[contains(text(), 'Progresso')]"
-            ), timeout=3)
+            progress_tab = wait_for_clickable(driver, selectors.PROGRESS_TAB, timeout=3)
             progress_tab.click()
             wait(0.2)
         except Exception as e:
             log_action(f"Não conseguiu abrir aba Progresso: {str(e)[:50]}")
         
-        # Busca diretamente os botões de navegação
-        calendar_nav_buttons = driver.find_elements(By.XPATH, 
-            "//div[@role='dialog']//button[@class and contains(@class, 'p-1')]//*[name()='svg']/.."
-        )
-        
-        # Fallback: busca qualquer button pequeno no modal
-        if not calendar_nav_buttons:
-            calendar_nav_buttons = [btn for btn in driver.find_elements(By.XPATH, "//div[@role='dialog']//button[contains(@class, 'p-1')]") 
-                                   if btn.find_elements(By.TAG_NAME, 'svg')]
-        
-        # O último deve ser "próximo" (seta direita)
-        if len(calendar_nav_buttons) >= 2:
-            next_button = calendar_nav_buttons[-1]
-            try:
-                next_button.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", next_button)
+        # Localiza os botões de navegação (com ícone) e clica no último ("próximo")
+        # dentro do navegador, em um único round-trip
+        outcome = batch.click(driver, selectors.CALENDAR_NAV_BUTTONS, indices=[-1], has_svg=True)
+        if outcome["found"] >= 2 and outcome["clicked"]:
             log_action("✓ Próximo mês selecionado")
             return True
         else:
-            log_action(f"Botões de navegação não encontrados (encontrou {len(calendar_nav_buttons)})")
+            log_action(f"Botões de navegação não encontrados (encontrou {outcome['found']})")
             return False
             
     except Exception as e:
@@ -184,34 +158,20 @@ def navigate_calendar_previous(driver):
     try:
         # A aba Progresso já deve estar aberta do passo anterior
         try:
-            progress_tab = driver.find_element(By.XPATH, "//button[contains(text(), 'Progresso')]")
+            progress_tab = find_element(driver, selectors.PROGRESS_TAB)
             if 'data-state=active' not in (progress_tab.get_attribute('data-state') or ''):
                 progress_tab.click()
                 wait(0.2)
         except Exception:
             pass
         
-        # Busca diretamente os botões de navegação com SVG
-        calendar_nav_buttons = driver.find_elements(By.XPATH, 
-            "//div[@role='dialog']//button[@class and contains(@class, 'p-1')]//*[name()='svg']/.."
-        )
-        
-        # Fallback: busca qualquer button pequeno no modal com SVG
-        if not calendar_nav_buttons:
-            calendar_nav_buttons = [btn for btn in driver.find_elements(By.XPATH, "//div[@role='dialog']//button[contains(@class, 'p-1')]") 
-                                   if btn.find_elements(By.TAG_NAME, 'svg')]
-        
-        # O penúltimo deve ser "anterior" (seta esquerda)
-        if len(calendar_nav_buttons) >= 2:
-            prev_button = calendar_nav_buttons[-2]
-            try:
-                prev_button.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", prev_button)
+        # O penúltimo botão com ícone é "anterior" (seta esquerda)
+        outcome = batch.click(driver, selectors.CALENDAR_NAV_BUTTONS, indices=[-2], has_svg=True)
+        if outcome["found"] >= 2 and outcome["clicked"]:
             log_action("✓ Mês anterior selecionado")
             return True
         else:
-            log_action(f"Botões de navegação não encontrados (encontrou {len(calendar_nav_buttons)})")
+            log_action(f"Botões de navegação não encontrados (encontrou {outcome['found']})")
             return False
             
     except Exception as e:
@@ -232,10 +192,7 @@ def edit_character(driver, avatar_index=None):
     try:
         # Navega para a aba de Configurações
         try:
-            settings_tab = wait_for_clickable(driver, (
-                By.XPATH,
-                "//button[@role='tab' and (contains(text(), 'Config') or contains(text(), 'Configurações'))]"
-            ), timeout=5)
+            settings_tab = wait_for_clickable(driver, selectors.SETTINGS_TAB, timeout=5)
             try:
                 settings_tab.click()
             except Exception:
@@ -247,10 +204,7 @@ def edit_character(driver, avatar_index=None):
         
         # Clica no botão "Editar" para entrar em modo de edição
         try:
-            edit_btn = wait_for_clickable(driver, (
-                By.XPATH,
-                "//button[contains(., 'Editar')]"
-            ), timeout=5)
+            edit_btn = wait_for_clickable(driver, selectors.EDIT_BUTTON, timeout=5)
             try:
                 edit_btn.click()
             except Exception:
@@ -262,15 +216,11 @@ def edit_character(driver, avatar_index=None):
             return False
         
         # Encontra todos os botões de avatar
-        avatar_buttons = driver.find_elements(By.XPATH, 
-            "//div[@role='dialog']//button[contains(@class, 'rounded-lg') and contains(@class, 'border-2')]"
-        )
+        avatar_buttons = find_elements(driver, selectors.AVATAR_OPTIONS)
         
         if not avatar_buttons:
             # Fallback: busca por div com emojis
-            avatar_buttons = driver.find_elements(By.XPATH, 
-                "//div[@role='dialog']//div[contains(@class, 'grid')]//button"
-            )
+            avatar_buttons = find_elements(driver, selectors.AVATAR_OPTIONS_FALLBACK)
         
         log_action(f"Encontrados {len(avatar_buttons)} avatares")
         
@@ -303,10 +253,7 @@ def edit_character(driver, avatar_index=None):
         
         # Clica no botão "Salvar"
         try:
-            save_btn = wait_for_clickable(driver, (
-                By.XPATH,
-                "//button[contains(., 'Salvar')]"
-            ), timeout=5)
+            save_btn = wait_for_clickable(driver, selectors.SAVE_BUTTON, timeout=5)
             try:
                 save_btn.click()
             except Exception:
@@ -334,10 +281,7 @@ def edit_profile_name(driver, new_name):
     try:
         # Navega para a aba de Configurações
         try:
-            settings_tab = wait_for_clickable(driver, (
-                By.XPATH,
-                "//button[@role='tab' and (contains(text(), 'Config') or contains(text(), 'Configurações'))]"
-            ), timeout=5)
+            settings_tab = wait_for_clickable(driver, selectors.SETTINGS_TAB, timeout=5)
             try:
                 settings_tab.click()
             except Exception:
@@ -347,10 +291,7 @@ def edit_profile_name(driver, new_name):
             pass
         
         # Clica no botão "Editar" para entrar em modo de edição
-        edit_btn = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(., 'Editar')]"
-        ), timeout=5)
+        edit_btn = wait_for_clickable(driver, selectors.EDIT_BUTTON, timeout=5)
         try:
             edit_btn.click()
         except Exception:
@@ -358,18 +299,13 @@ def edit_profile_name(driver, new_name):
         wait(0.2)
         
         # Encontra e preenche o campo de nome
-        name_field = wait_for_clickable(driver, (
-            By.ID, "name"
-        ), timeout=5)
+        name_field = wait_for_clickable(driver, selectors.PROFILE_NAME, timeout=5)
         name_field.clear()
         name_field.send_keys(new_name)
         log_action(f"Nome alterado para: {new_name}")
         
         # Clica no botão "Salvar"
-        save_btn = wait_for_clickable(driver, (
-            By.XPATH,
-            "//button[contains(., 'Salvar')]"
-        ), timeout=5)
+        save_btn = wait_for_clickable(driver, selectors.SAVE_BUTTON, timeout=5)
         try:
             save_btn.click()
         except Exception:
@@ -382,3 +318,15 @@ def edit_profile_name(driver, new_name):
     except Exception as e:
         log_action(f"Erro ao editar nome: {str(e)[:80]}")
         return False
+
+
+# ===== Versões assíncronas (cdp_async.Page, executadas em abas paralelas) =====
+
+async def open_profile_modal_async(page):
+    """Abre o modal de perfil em uma aba CDP (esperas por evento)"""
+    log_action("Abrindo modal de perfil (aba assíncrona)")
+    await page.click(selectors.AVATAR)
+    await page.click(selectors.PROFILE_MENU_ITEM)
+    await page.wait_for(selectors.MODAL)
+    log_action("Modal de perfil aberto")
+    return True
@@ -14,10 +14,12 @@ from utils import (
     wait_for_clickable,
     safe_click,
     slow_type,
+    find_elements,
     find_element_safe,
     log_action
 )
 from config import DEFAULT_DELAY
+import ui_selectors as selectors
 
 
 def open_create_task_modal(driver):
@@ -25,10 +27,7 @@ def open_create_task_modal(driver):
     log_action("Abrindo modal de criar tarefa")
     
     # Procura botão de criar tarefa
-    create_button = safe_click(driver, (
-        By.XPATH,
-        "//button[contains(text(), 'Nova Tarefa') or contains(text(), 'Criar Tarefa') or contains(text(), 'Add Task')]"
-    ))
+    create_button = safe_click(driver, selectors.CREATE_TASK_BUTTON)
     wait(DEFAULT_DELAY)
     return create_button
 
@@ -39,7 +38,7 @@ def create_task(driver, title, description="", difficulty="MEDIUM"):
 
     # Abre modal de criação (reaproveita botão 'Nova Tarefa')
     try:
-        safe_click(driver, (By.XPATH, "//button[.//text()[contains(., 'Nova Tarefa')] or normalize-space(.)='Nova Tarefa']"))
+        safe_click(driver, selectors.NEW_TASK_BUTTON)
     except Exception:
         log_action("Botão 'Nova Tarefa' não encontrado diretamente, tentando alternativa")
 
@@ -47,14 +46,14 @@ def create_task(driver, title, description="", difficulty="MEDIUM"):
     wait(DEFAULT_DELAY)
 
     # Preenche título e descrição usando IDs do modal
-    title_field = wait_for_clickable(driver, (By.ID, "title"), timeout=5)
+    title_field = wait_for_clickable(driver, selectors.TITLE, timeout=5)
     title_field.clear()
     title_field.send_keys(title)
     wait(0.2)
 
     if description:
         try:
-            desc_field = wait_for_clickable(driver, (By.ID, "description"), timeout=3)
+            desc_field = wait_for_clickable(driver, selectors.DESCRIPTION, timeout=3)
             desc_field.clear()
             desc_field.send_keys(description)
             wait(0.2)
@@ -64,7 +63,7 @@ def create_task(driver, title, description="", difficulty="MEDIUM"):
     # Se for ToDo com deadline, preencher o campo
     if difficulty == "TODO_DEADLINE":
         try:
-            deadline_field = wait_for_clickable(driver, (By.ID, "deadline"), timeout=3)
+            deadline_field = wait_for_clickable(driver, selectors.DEADLINE, timeout=3)
             # deadline expected in YYYY-MM-DD format if provided in title var or elsewhere
             # If not provided, skip
             wait(0.2)
@@ -72,7 +71,7 @@ def create_task(driver, title, description="", difficulty="MEDIUM"):
             log_action("Campo deadline não encontrado")
 
     # Clica em criar dentro do modal
-    submit_button = wait_for_clickable(driver, (By.CSS_SELECTOR, "[role='dialog'] button[type='submit']"), timeout=6)
+    submit_button = wait_for_clickable(driver, selectors.MODAL_SUBMIT, timeout=6)
     submit_button.click()
     wait(DEFAULT_DELAY)
 
@@ -102,10 +101,7 @@ def complete_first_incomplete_task(driver):
     
     try:
         # Procura primeiro checkbox não marcado
-        checkbox = safe_click(driver, (
-            By.XPATH,
-            "//input[@type='checkbox' and not(@checked)]"
-        ))
+        checkbox = safe_click(driver, selectors.TASK_UNCHECKED)
         wait(DEFAULT_DELAY * 2)  # Espera animação de XP
         
         log_action("Primeira tarefa completada")
@@ -127,10 +123,7 @@ def delete_task(driver, task_title):
         
         # Confirma se houver modal de confirmação
         try:
-            confirm_button = safe_click(driver, (
-                By.XPATH,
-                "//button[contains(text(), 'Confirmar') or contains(text(), 'Deletar') or contains(text(), 'Delete')]"
-            ), timeout=3)
+            confirm_button = safe_click(driver, selectors.CONFIRM_DELETE_BUTTON, timeout=3)
             wait(DEFAULT_DELAY)
         except:
             pass  # Não havia confirmação
@@ -144,7 +137,7 @@ def delete_task(driver, task_title):
 
 def count_tasks(driver):
     """Conta número de tarefas visíveis"""
-    tasks = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+    tasks = find_elements(driver, selectors.TASK_CHECKBOXES)
     count = len(tasks)
     log_action("Tarefas encontradas", str(count))
     return count
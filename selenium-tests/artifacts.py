@@ -0,0 +1,182 @@
+"""
+Artefatos de falha - DailyQuest
+Hook de passos que, quando um passo falha, coleta screenshot, DOM, console do
+navegador, rede do passo (HAR) e o traceback completo. A coleta no navegador
+acontece depois de medida a duração do passo e só em passos com erro; a
+compressão e a gravação ficam com uma thread em segundo plano, limitadas a um
+orçamento total de espaço em disco.
+"""
+import gzip
+import json
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import waterfall
+from config import ARTIFACTS_BUDGET_MB, ARTIFACTS_QUEUE, ARTIFACTS_COMPRESSION_LEVEL
+from utils import log_action
+
+MB = 1024 * 1024
+UNSAFE_CHARS = re.compile(r"[^\w-]")
+# Gravados nesta ordem: quando o orçamento acaba, os últimos são descartados
+PRIORITY = ("error.txt", "console.json", "screenshot.png", "dom.html", "network.har")
+COMPRESSED = {"screenshot.png"}  # PNG já é comprimido: gravado como está
+
+
+def _iso(wall_time):
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def to_har(requests, page="falha"):
+    """HAR 1.2 mínimo a partir dos registros de rede do waterfall"""
+    entries = []
+    for request in sorted(requests, key=lambda r: r["start"]):
+        elapsed = round((request["end"] - request["start"]) * 1000, 1) if request["end"] is not None else -1
+        entries.append({
+            "pageref": page,
+            "startedDateTime": _iso(request["wall_time"]) if request.get("wall_time") else "",
+            "time": max(elapsed, 0),
+            "request": {
+                "method": request["method"], "url": request["url"], "httpVersion": "",
+                "headers": [], "queryString": [], "cookies": [], "headersSize": -1, "bodySize": -1,
+            },
+            "response": {
+                "status": request["status"] or 0, "statusText": "", "httpVersion": "",
+                "headers": [], "cookies": [], "redirectURL": "", "headersSize": -1,
+                "bodySize": request["bytes"], "content": {"size": request["bytes"], "mimeType": ""},
+                "_error": request["failed"],
+            },
+            "cache": {"_fromCache": request["from_cache"]},
+            "timings": {"send": 0, "wait": max(elapsed, 0), "receive": 0},
+            "_resourceType": request["type"],
+        })
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": "dailyquest-selenium", "version": "1.0"},
+        "pages": [{"id": page, "title": page, "startedDateTime": entries[0]["startedDateTime"] if entries else "",
+                   "pageTimings": {}}],
+        "entries": entries,
+    }}
+
+
+class ArtifactWriter:
+    """Thread que comprime e grava os artefatos, respeitando o orçamento em bytes"""
+
+    def __init__(self, directory, budget=ARTIFACTS_BUDGET_MB * MB, maxsize=ARTIFACTS_QUEUE):
+        self.directory = Path(directory)
+        self.budget = budget
+        self.used = 0
+        self.saved = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, name, files):
+        """Enfileira {arquivo: bytes} da falha `name`; descarta se a fila estiver cheia (nunca bloqueia)"""
+        try:
+            self._queue.put_nowait((name, files))
+        except queue.Full:
+            self.dropped += 1
+            log_action("Artefatos descartados", f"{name}: fila de gravação cheia")
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception as e:
+                log_action("Falha ao gravar artefatos", str(e)[:100])
+            finally:
+                self._queue.task_done()
+
+    def _write(self, name, files):
+        folder = self.directory / name
+        folder.mkdir(parents=True, exist_ok=True)
+        skipped = []
+        for filename in PRIORITY:
+            data = files.get(filename)
+            if data is None:
+                continue
+            if filename not in COMPRESSED:
+                data = gzip.compress(data, ARTIFACTS_COMPRESSION_LEVEL)
+                filename += ".gz"
+            if self.used + len(data) > self.budget:
+                skipped.append(filename)
+                continue
+            (folder / filename).write_bytes(data)
+            self.used += len(data)
+        if skipped:
+            (folder / "SKIPPED.txt").write_text(
+                "Orçamento de artefatos esgotado; não gravados: " + ", ".join(skipped) + "\n", encoding="utf-8"
+            )
+        self.saved += 1
+
+    def close(self):
+        """Espera a gravação do que já foi enfileirado"""
+        self._queue.put(None)
+        self._thread.join()
+
+
+class ArtifactHook:
+    """
+    Hook de passos: artefatos de cada passo com erro em DIR/<nº da falha>-<passo>-<ação>/
+
+    Usa a rede anexada pelo WaterfallHook (quando ativo, deve vir antes na
+    lista de hooks); sem ele lê o log de performance do chromedriver só na
+    falha, filtrando as requisições iniciadas durante o passo.
+    """
+
+    def __init__(self, directory, budget=ARTIFACTS_BUDGET_MB * MB):
+        self.writer = ArtifactWriter(directory, budget)
+        self._started = None
+        self._failures = 0
+
+    def before_step(self, driver, result):
+        self._started = time.time()
+
+    def after_step(self, driver, result):
+        if result["status"] != "error" or driver is None:
+            return
+        # O mesmo passo pode falhar em vários runs (--repeat, matriz de rede)
+        self._failures += 1
+        name = f"{self._failures:03d}-{result['index']}-{UNSAFE_CHARS.sub('_', result['action'])}"
+        error = result.get("traceback") or result.get("error", "")
+        files = {"error.txt": f"{result['description']}\n\n{error}".encode("utf-8")}
+        for filename, collect in (
+            ("screenshot.png", lambda: driver.get_screenshot_as_png()),
+            ("dom.html", lambda: driver.page_source.encode("utf-8")),
+            ("console.json", lambda: json.dumps(driver.get_log("browser"), indent=2).encode("utf-8")),
+            ("network.har", lambda: json.dumps(to_har(self._network(driver, result), name)).encode("utf-8")),
+        ):
+            try:
+                files[filename] = collect()
+            except Exception as e:
+                # Navegador pode ter caído junto com o passo: grava o que conseguir
+                log_action(f"Artefato {filename} indisponível", str(e)[:80])
+        self.writer.submit(name, files)
+        result["artifacts"] = str(self.writer.directory / name)
+
+    def _network(self, driver, result):
+        network = result.get("network")
+        if network:
+            return network["requests"]
+        collected = {}
+        waterfall.WaterfallHook().after_step(driver, collected)
+        return [
+            r for r in collected["network"]["requests"]
+            if r.get("wall_time") is None or r["wall_time"] >= self._started
+        ]
+
+    def close(self):
+        self.writer.close()
+        used = self.writer.used / MB
+        detail = f"{self.writer.saved} falha(s) em {self.writer.directory} ({used:.1f} MB)"
+        if self.writer.dropped:
+            detail += f", {self.writer.dropped} descartada(s)"
+        log_action("Artefatos de falha gravados", detail)
@@ -0,0 +1,109 @@
+"""
+Comandos em lote no navegador - DailyQuest
+Envia um único execute_script que localiza, filtra e age sobre vários
+elementos de uma vez, retornando um resultado compacto. Substitui loops de
+find_elements + click (um round-trip WebDriver por elemento).
+"""
+from selenium.webdriver.common.by import By
+
+from config import BATCH_SETTLE_MS
+
+# Localização compartilhada pelos scripts: XPath ou CSS, com filtros opcionais
+LOCATE_JS = """
+function locate(cmd, context) {
+  var root = context || document, nodes = [];
+  if (cmd.xpath) {
+    var snapshot = document.evaluate(cmd.xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+  } else {
+    nodes = Array.prototype.slice.call(root.querySelectorAll(cmd.css));
+  }
+  if (cmd.has_svg) nodes = nodes.filter(function (n) { return n.querySelector('svg'); });
+  if (cmd.within) nodes = nodes.length ? locate(cmd.within, nodes[0]) : [];
+  return nodes;
+}
+function activate(node) {
+  node.scrollIntoView({block: 'center', behavior: 'instant'});
+  node.click();
+}
+"""
+
+RUN_SCRIPT = LOCATE_JS + """
+return arguments[0].map(function (cmd) {
+  var nodes = locate(cmd);
+  var result = {found: nodes.length, clicked: 0};
+  if (cmd.op === 'click') {
+    (cmd.indices || [0]).forEach(function (i) {
+      var node = nodes[i < 0 ? nodes.length + i : i];
+      if (node) { activate(node); result.clicked++; }
+    });
+  } else if (cmd.op === 'attr') {
+    result.values = nodes.map(function (n) { return n.getAttribute(cmd.name); });
+  }
+  return result;
+});
+"""
+
+# Clica no primeiro elemento ainda não clicado, espera o React re-renderizar e
+# repete; tudo dentro do navegador, em um único round-trip
+SEQUENTIAL_SCRIPT = LOCATE_JS + """
+var done = arguments[arguments.length - 1];
+var cmd = arguments[0], count = arguments[1], settleMs = arguments[2];
+var clicked = [];
+(function next() {
+  if (clicked.length >= count) return done({clicked: clicked.length, exhausted: false});
+  var node = locate(cmd).filter(function (n) { return clicked.indexOf(n) === -1; })[0];
+  if (!node) return done({clicked: clicked.length, exhausted: true});
+  activate(node);
+  clicked.push(node);
+  setTimeout(next, settleMs);
+})();
+"""
+
+
+def command(locator, op="count", **options):
+    """Monta um comando a partir de um locator Selenium (XPath ou CSS)"""
+    by, value = locator
+    if by == By.XPATH:
+        cmd = {"xpath": value}
+    elif by == By.CSS_SELECTOR:
+        cmd = {"css": value}
+    else:
+        raise ValueError(f"Estratégia não suportada em lote: {by}")
+    cmd["op"] = op
+    if "within" in options:
+        options["within"] = command(options["within"])
+    cmd.update(options)
+    return cmd
+
+
+def run(driver, commands):
+    """Executa vários comandos em um único execute_script"""
+    return driver.execute_script(RUN_SCRIPT, commands)
+
+
+def click(driver, locator, indices=(0,), **options):
+    """
+    Clica nos elementos de índice `indices` (negativos contam do fim)
+
+    Retorna {"found": n, "clicked": k}.
+    """
+    return run(driver, [command(locator, "click", indices=list(indices), **options)])[0]
+
+
+def count(driver, locator, **options):
+    """Conta elementos que casam com o locator (e filtros)"""
+    return run(driver, [command(locator, **options)])[0]["found"]
+
+
+def click_each(driver, locator, limit, settle_ms=BATCH_SETTLE_MS, **options):
+    """
+    Clica em até `limit` elementos distintos, re-localizando após cada clique
+
+    Útil quando cada clique muda a lista (ex: hábito completado deixa de casar
+    com o seletor). Retorna quantos foram clicados.
+    """
+    outcome = driver.execute_async_script(
+        SEQUENTIAL_SCRIPT, command(locator, **options), limit, settle_ms
+    )
+    return outcome["clicked"]
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark dos validadores - DailyQuest
+Compara a validação registro a registro (validate_all_fields) com a API em
+lote (compile_rules + validate_records) sobre uma massa sintética de afazeres.
+Execute: python3 bench_validators.py [--rows 10000] [--repeat 5]
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from validators import (
+    validate_username,
+    validate_email,
+    validate_title,
+    validate_description,
+    validate_deadline,
+    validate_all_fields,
+    compile_rules,
+    validate_records,
+    ValidationError,
+)
+
+RULES = {
+    "username": validate_username,
+    "email": validate_email,
+    "title": validate_title,
+    "description": validate_description,
+    "deadline": validate_deadline,
+}
+
+
+def build_records(rows, seed=42):
+    """Registros com ~5% de valores inválidos e prazos em vários formatos"""
+    rng = random.Random(seed)
+    today = date.today()
+    formats = ["%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d"]
+    records = []
+    for i in range(rows):
+        deadline = (today + timedelta(days=rng.randint(0, 90))).strftime(rng.choice(formats))
+        record = {
+            "username": f"user_{i}",
+            "email": f"user{i}@example.com",
+            "title": f"Afazer número {i}",
+            "description": rng.choice(["", "Prioridade da semana", "Meta pessoal"]),
+            "deadline": deadline,
+        }
+        if rng.random() < 0.05:
+            record[rng.choice(list(RULES))] = rng.choice(["", "x", "2020-01-01", "sem-arroba"])
+        records.append(record)
+    return records
+
+
+def per_record(records):
+    """Validação atual: um validate_all_fields por registro"""
+    errors = 0
+    for record in records:
+        try:
+            validate_all_fields({name: (validator, record[name]) for name, validator in RULES.items()})
+        except ValidationError:
+            errors += 1
+    return errors
+
+
+def batch(records, rules):
+    return len(validate_records(records, rules).errors)
+
+
+def measure(function, repeat, *args):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark dos validadores DailyQuest")
+    parser.add_argument("--rows", type=int, default=10000, help="Registros na massa sintética")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições (vale a melhor)")
+    args = parser.parse_args()
+
+    records = build_records(args.rows)
+    rules = compile_rules(RULES)
+
+    scalar, scalar_errors = measure(per_record, args.repeat, records)
+    vectorized, batch_errors = measure(batch, args.repeat, records, rules)
+
+    print(f"{args.rows} registros, {len(RULES)} campos (melhor de {args.repeat})")
+    print(f"  registro a registro  {scalar * 1000:>9.1f} ms  {args.rows / scalar:>10.0f} reg/s  {scalar_errors} inválidos")
+    print(f"  em lote              {vectorized * 1000:>9.1f} ms  {args.rows / vectorized:>10.0f} reg/s  {batch_errors} inválidos")
+    print(f"  ganho                {scalar / vectorized:>9.1f}x")
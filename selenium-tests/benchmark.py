@@ -0,0 +1,190 @@
+"""
+Benchmark com histórico - DailyQuest
+Executa os cenários K vezes, calcula p50/p95/p99 por ação, grava no histórico
+local e compara com os runs anteriores para detectar regressões de desempenho.
+"""
+import json
+import statistics
+import time
+from pathlib import Path
+
+from config import (
+    BENCHMARK_HISTORY,
+    BENCHMARK_WINDOW,
+    BENCHMARK_THRESHOLD,
+    BENCHMARK_MIN_DELTA,
+    DEFAULT_PROFILE,
+)
+from utils import log_action, report
+import driver_pool
+import scenario_generator
+import seeding
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, q):
+    """Percentil q (0-100) com interpolação linear entre as amostras ordenadas"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples):
+    """Converte {ação: [durações]} em {ação: {n, p50, p95, p99}}"""
+    summary = {}
+    for action, durations in samples.items():
+        stats = {"n": len(durations)}
+        for q in PERCENTILES:
+            stats[f"p{q}"] = round(percentile(durations, q), 4)
+        summary[action] = stats
+    return summary
+
+
+def load_history(path=BENCHMARK_HISTORY):
+    """Lê os runs anteriores (um JSON por linha)"""
+    history = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        history.append(json.loads(line))
+                    except ValueError:
+                        continue
+    except OSError:
+        pass
+    return history
+
+
+def append_history(record, path=BENCHMARK_HISTORY):
+    """Adiciona o run ao histórico"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def compare(summary, history, threshold=BENCHMARK_THRESHOLD, window=BENCHMARK_WINDOW):
+    """
+    Compara o p95 de cada ação com a mediana dos p95 dos últimos runs
+
+    Retorna lista de {action, p95, baseline, change, regression}; ações sem
+    histórico têm baseline None.
+    """
+    recent = history[-window:]
+    comparison = []
+    for action, stats in sorted(summary.items()):
+        previous = [run["actions"][action]["p95"] for run in recent if action in run.get("actions", {})]
+        baseline = statistics.median(previous) if previous else None
+        change = (stats["p95"] - baseline) / baseline if baseline else None
+        regression = (
+            baseline is not None
+            and stats["p95"] > baseline * (1 + threshold)
+            and stats["p95"] - baseline >= BENCHMARK_MIN_DELTA
+        )
+        comparison.append({
+            "action": action,
+            "p95": stats["p95"],
+            "baseline": baseline,
+            "change": change,
+            "regression": regression,
+        })
+    return comparison
+
+
+def print_report(summary, comparison):
+    """Imprime tabela de percentis e variação em relação ao histórico"""
+    log_action("========================================")
+    log_action("BENCHMARK - PERCENTIS POR AÇÃO (s)")
+    log_action("========================================")
+    report(f"  {'ação':<28} {'n':>3} {'p50':>7} {'p95':>7} {'p99':>7} {'base p95':>9} {'var':>7}")
+    for row in comparison:
+        stats = summary[row["action"]]
+        baseline = f"{row['baseline']:.3f}" if row["baseline"] is not None else "-"
+        change = f"{row['change']:+.0%}" if row["change"] is not None else "-"
+        flag = "  << REGRESSÃO" if row["regression"] else ""
+        report(
+            f"  {row['action']:<28} {stats['n']:>3} {stats['p50']:>7.3f} {stats['p95']:>7.3f} "
+            f"{stats['p99']:>7.3f} {baseline:>9} {change:>7}{flag}"
+        )
+
+
+def run_benchmark(scenarios, iterations, threshold=BENCHMARK_THRESHOLD, offline=False, hooks=(),
+                  profile=DEFAULT_PROFILE, performance_log=False, console_log=False):
+    """
+    Executa o fluxo `iterations` vezes no mesmo driver e avalia regressões
+
+    Só runs do mesmo perfil de navegador entram na linha de base. Runs com
+    passos em erro não entram no histórico: a ação que falhou sairia do
+    resumo e o run viraria linha de base sem ela.
+
+    performance_log e console_log são repassados a setup_driver (exigidos
+    pelos hooks de waterfall e de artefatos). Cada resultado recebe "run"
+    com o número da iteração.
+
+    Cada iteração usa um usuário novo (testuser_bench<run_id>_<iteração>):
+    com o mesmo usuário o dashboard acumularia os itens criados pelas
+    iterações e runs anteriores e o p95 subiria sem regressão real.
+
+    Retorna o código de saída: 1 se algum passo falhou ou alguma ação
+    regrediu além do limite.
+    """
+    from main import setup_driver, navigate_first, execute_test_flow
+
+    run_id = time.strftime("%H%M%S")
+    users = [
+        scenario_generator.build_user(scenarios["user"], iteration, suffix=f"_bench{run_id}_")
+        for iteration in range(1, iterations + 1)
+    ]
+    seeding.register_users(users)
+    samples = {}
+    errors = {}
+    driver = setup_driver(
+        offline=offline, profile=profile, performance_log=performance_log, console_log=console_log
+    )
+    try:
+        navigate_first(driver)
+        for iteration in range(1, iterations + 1):
+            log_action("Benchmark", f"iteração {iteration}/{iterations} ({users[iteration - 1]['username']})")
+            driver_pool.reset(driver)
+            for result in execute_test_flow(driver, scenarios, user=users[iteration - 1], hooks=hooks):
+                result["run"] = iteration
+                if result["status"] == "ok":
+                    samples.setdefault(result["action"], []).append(result["duration"])
+                elif result["status"] == "error":
+                    errors[result["action"]] = errors.get(result["action"], 0) + 1
+    finally:
+        driver.quit()
+
+    summary = summarize(samples)
+    history = [run for run in load_history() if run.get("profile", DEFAULT_PROFILE) == profile]
+    comparison = compare(summary, history, threshold)
+    print_report(summary, comparison)
+
+    if errors:
+        log_action(
+            "Passos com erro (run fora do histórico)",
+            ", ".join(f"{action} {count}/{iterations}" for action, count in sorted(errors.items()))
+        )
+        return 1
+
+    append_history({
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "iterations": iterations,
+        "profile": profile,
+        "actions": summary,
+    })
+
+    regressions = [row["action"] for row in comparison if row["regression"]]
+    if regressions:
+        log_action("Regressões detectadas", ", ".join(regressions))
+        return 1
+    log_action("Nenhuma regressão", f"limite {threshold:.0%} sobre a mediana de {min(len(history), BENCHMARK_WINDOW)} run(s)")
+    return 0
@@ -0,0 +1,265 @@
+"""
+Transporte CDP assíncrono - DailyQuest
+Conexão asyncio direta ao DevTools do Chrome iniciado pelo Selenium (mesmo
+processo, mesma sessão de login). Cada aba é uma sessão CDP própria sobre um
+único websocket; esperas são assinaturas de eventos (MutationObserver na
+página, eventos Page/Network do CDP) em vez de polling via chromedriver, e
+ações independentes podem rodar em paralelo em abas separadas.
+"""
+import asyncio
+import itertools
+import json
+import time
+from urllib.request import urlopen
+
+import websockets
+
+import batch
+from config import BASE_URL, DEFAULT_TIMEOUT, ASYNC_TABS
+from utils import log_action, report
+
+# Resolve quando o locator casar (e estiver visível); observa mutações do DOM
+# em vez de consultar periodicamente. Retorna o centro do elemento ou null.
+WAIT_FUNCTION = "(function (cmd, visible, timeoutMs) {" + batch.LOCATE_JS + """
+  function match() {
+    var node = locate(cmd).filter(function (n) {
+      return !visible || n.getClientRects().length > 0;
+    })[0];
+    if (!node) return null;
+    node.scrollIntoView({block: 'center', behavior: 'instant'});
+    var rect = node.getBoundingClientRect();
+    return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+  }
+  return new Promise(function (resolve) {
+    var found = match();
+    if (found) return resolve(found);
+    var observer = new MutationObserver(function () {
+      var hit = match();
+      if (hit) { observer.disconnect(); clearTimeout(timer); resolve(hit); }
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    var timer = setTimeout(function () { observer.disconnect(); resolve(null); }, timeoutMs);
+  });
+})"""
+
+
+class CDPError(Exception):
+    """Erro retornado por um comando CDP"""
+    pass
+
+
+def browser_ws_url(driver):
+    """URL do websocket do navegador controlado pelo driver Selenium"""
+    url = driver.capabilities.get("se:cdp")
+    if url:
+        return url
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urlopen(f"http://{address}/json/version", timeout=DEFAULT_TIMEOUT) as response:
+        return json.load(response)["webSocketDebuggerUrl"]
+
+
+class Connection:
+    """Websocket CDP com comandos multiplexados por id e assinatura de eventos"""
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = []  # (método, sessão, predicado, future)
+        self._reader = None
+
+    @classmethod
+    async def open(cls, url):
+        connection = cls(await websockets.connect(url, max_size=None))
+        connection._reader = asyncio.create_task(connection._read())
+        return connection
+
+    async def send(self, method, params=None, session_id=None):
+        message = {"id": next(self._ids), "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message["id"]] = future
+        await self._websocket.send(json.dumps(message))
+        return await future
+
+    def expect(self, method, session_id=None, predicate=None):
+        """Future do próximo evento `method` (crie antes de disparar a ação)"""
+        future = asyncio.get_running_loop().create_future()
+        self._listeners.append((method, session_id, predicate, future))
+        return future
+
+    async def _read(self):
+        try:
+            async for raw in self._websocket:
+                message = json.loads(raw)
+                if "id" in message:
+                    future = self._pending.pop(message["id"], None)
+                    if future and not future.done():
+                        if "error" in message:
+                            future.set_exception(CDPError(message["error"].get("message", "erro CDP")))
+                        else:
+                            future.set_result(message.get("result", {}))
+                    continue
+                self._dispatch(message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for future in list(self._pending.values()) + [entry[3] for entry in self._listeners]:
+                if not future.done():
+                    future.set_exception(CDPError("conexão CDP encerrada"))
+
+    def _dispatch(self, event):
+        remaining = []
+        for method, session_id, predicate, future in self._listeners:
+            if future.done():
+                continue
+            if (event.get("method") == method and session_id in (None, event.get("sessionId"))
+                    and (predicate is None or predicate(event.get("params", {})))):
+                future.set_result(event.get("params", {}))
+                continue
+            remaining.append((method, session_id, predicate, future))
+        self._listeners = remaining
+
+    async def close(self):
+        await self._websocket.close()
+        if self._reader:
+            await self._reader
+
+
+class Page:
+    """Aba controlada por uma sessão CDP própria"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None):
+        return await self.connection.send(method, params, self.session_id)
+
+    def expect(self, method, predicate=None):
+        return self.connection.expect(method, self.session_id, predicate)
+
+    async def evaluate(self, expression, timeout=DEFAULT_TIMEOUT):
+        """Avalia a expressão (aguardando promises) e retorna o valor"""
+        response = await asyncio.wait_for(self.send("Runtime.evaluate", {
+            "expression": expression, "awaitPromise": True, "returnByValue": True,
+        }), timeout + 1)
+        if "exceptionDetails" in response:
+            raise CDPError(response["exceptionDetails"].get("text", "erro de script"))
+        return response["result"].get("value")
+
+    async def navigate(self, url, timeout=DEFAULT_TIMEOUT):
+        """Navega e espera o evento load"""
+        loaded = self.expect("Page.loadEventFired")
+        await self.send("Page.navigate", {"url": url})
+        await asyncio.wait_for(loaded, timeout)
+
+    async def wait_for(self, locator, timeout=DEFAULT_TIMEOUT, visible=True):
+        """Espera o locator (XPath/CSS) casar; retorna o centro do elemento"""
+        cmd = json.dumps(batch.command(locator))
+        position = await self.evaluate(
+            f"{WAIT_FUNCTION}({cmd}, {json.dumps(visible)}, {int(timeout * 1000)})", timeout
+        )
+        if position is None:
+            raise asyncio.TimeoutError(f"Elemento não encontrado: {locator[1][:80]}")
+        return position
+
+    async def click(self, locator, timeout=DEFAULT_TIMEOUT):
+        """Clique real (Input.dispatchMouseEvent) no centro do elemento"""
+        position = await self.wait_for(locator, timeout)
+        base = {"x": position["x"], "y": position["y"], "button": "left", "clickCount": 1}
+        await self.send("Input.dispatchMouseEvent", dict(base, type="mouseMoved"))
+        await self.send("Input.dispatchMouseEvent", dict(base, type="mousePressed"))
+        await self.send("Input.dispatchMouseEvent", dict(base, type="mouseReleased"))
+
+    async def type(self, locator, text, timeout=DEFAULT_TIMEOUT):
+        """Foca o campo e insere o texto de uma vez"""
+        await self.click(locator, timeout)
+        await self.send("Input.insertText", {"text": text})
+
+    def expect_response(self, url_part):
+        """Future da próxima resposta cuja URL contém url_part"""
+        return self.expect("Network.responseReceived", lambda p: url_part in p["response"]["url"])
+
+    async def close(self):
+        await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+
+
+class AsyncBrowser:
+    """Navegador do driver Selenium acessado via CDP assíncrono"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.pages = []
+
+    @classmethod
+    async def attach(cls, ws_url):
+        return cls(await Connection.open(ws_url))
+
+    async def new_page(self, url=None):
+        """Abre uma aba no contexto padrão (compartilha login) e a navega até url"""
+        target = await self.connection.send("Target.createTarget", {"url": "about:blank"})
+        attached = await self.connection.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True}
+        )
+        page = Page(self.connection, target["targetId"], attached["sessionId"])
+        await asyncio.gather(page.send("Page.enable"), page.send("Runtime.enable"), page.send("Network.enable"))
+        self.pages.append(page)
+        if url:
+            await page.navigate(url)
+        return page
+
+    async def close(self):
+        for page in self.pages:
+            try:
+                await page.close()
+            except CDPError:
+                pass
+        await self.connection.close()
+
+
+async def _run_job(browser, name, job, url):
+    started = time.perf_counter()
+    result = {"action": name, "status": "ok", "error": ""}
+    try:
+        page = await browser.new_page(url)
+        await job(page)
+    except Exception as e:
+        result.update(status="error", error=str(e)[:100] or type(e).__name__)
+    result["duration"] = time.perf_counter() - started
+    return result
+
+
+async def run_jobs(ws_url, jobs, url=f"{BASE_URL}/dashboard", tabs=ASYNC_TABS):
+    """
+    Executa jobs {nome: coroutine(page)} em paralelo, cada um na sua aba
+
+    No máximo `tabs` abas abertas ao mesmo tempo. Retorna os resultados na
+    ordem dos jobs.
+    """
+    browser = await AsyncBrowser.attach(ws_url)
+    limit = asyncio.Semaphore(tabs)
+
+    async def bounded(name, job):
+        async with limit:
+            return await _run_job(browser, name, job, url)
+
+    try:
+        return await asyncio.gather(*(bounded(name, job) for name, job in jobs.items()))
+    finally:
+        await browser.close()
+
+
+def run_concurrently(driver, jobs, tabs=ASYNC_TABS):
+    """Executa os jobs em abas do navegador do driver e imprime o ganho sobre a execução em série"""
+    started = time.perf_counter()
+    results = asyncio.run(run_jobs(browser_ws_url(driver), jobs, tabs=tabs))
+    wall = time.perf_counter() - started
+    serial = sum(r["duration"] for r in results)
+    log_action("Ações assíncronas em abas", f"{len(results)} ação(ões), {wall:.2f}s (em série: {serial:.2f}s)")
+    for result in results:
+        status = "ok" if result["status"] == "ok" else f"ERRO {result['error']}"
+        report(f"  {result['action']:<28} {result['duration']:>7.3f}s  {status}")
+    return results
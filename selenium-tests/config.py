@@ -1,5 +1,9 @@
+import os
+
 BASE_URL = "http://localhost:3000"
 API_URL = "http://localhost:8000"
+API_BASE_URL = f"{API_URL}/api/v1"   # NEXT_PUBLIC_API_URL do frontend
+AUTH_URL = "http://localhost:8001"    # NEXT_PUBLIC_AUTH_URL do frontend
 
 # Timeouts
 DEFAULT_TIMEOUT = 5
@@ -18,3 +22,171 @@ CHROME_OPTIONS = [
     "--disable-gpu",
     "--no-sandbox"
 ]
+
+# Modo headless (usado pelos workers do runner paralelo)
+HEADLESS_OPTION = "--headless=new"
+
+# Runner paralelo
+PARALLEL_USER_SUFFIX = "_w"  # testuser -> testuser_w1, testuser_w2, ...
+
+# Espera por quiescência (substitui pausas fixas): "quiescence" ou "fixed"
+WAIT_STRATEGY = "quiescence"
+QUIESCENCE_TIMEOUT = SHORT_TIMEOUT  # Máximo de espera por estabilização (s)
+QUIESCENCE_MAX_FACTOR = 4           # Cada espera dura no máximo N x a pausa fixa que substitui
+QUIESCENCE_QUIET_MS = 100           # Janela sem atividade para considerar a página estável
+QUIESCENCE_TRACKED_PATHS = [        # Endpoints cujos fetches pendentes bloqueiam a espera
+    "/tasks",
+    "/dashboard",
+    "/task-completions",
+    "/tags",
+    "/achievements",
+]
+
+# Cache do chromedriver (chave: versão major do Chrome)
+DRIVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dailyquest-selenium", "chromedriver")
+DRIVER_OFFLINE = os.environ.get("DAILYQUEST_OFFLINE", "") == "1"  # Nunca chama webdriver-manager
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+# Seeding via API (pré-condições sem passar pela UI)
+SEED_POOL_SIZE = 16      # Conexões HTTP reaproveitadas pela sessão de seeding
+SEED_WORKERS = 8         # Requisições simultâneas em operações em lote
+SEED_TIMEOUT = 10        # Timeout por requisição (s)
+
+# Cache de sessão (token/localStorage de lib/auth.ts) para evitar login pela UI
+SESSION_CACHE_ENABLED = True
+SESSION_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dailyquest-selenium", "sessions")
+SESSION_MAX_AGE = 12 * 60 * 60  # Sessões mais antigas são descartadas sem consultar a API (s)
+
+# Benchmark (histórico local de p50/p95/p99 por ação)
+BENCHMARK_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "history.jsonl")
+BENCHMARK_WINDOW = 10          # Quantos runs anteriores formam a linha de base
+BENCHMARK_THRESHOLD = 0.20     # Regressão: p95 acima da linha de base em mais de 20%...
+BENCHMARK_MIN_DELTA = 0.05     # ...e em pelo menos 50 ms (evita ruído em passos rápidos)
+
+# Comandos em lote (batch.py): intervalo entre cliques sequenciais no navegador
+BATCH_SETTLE_MS = 300
+
+# Carga HTTP (loadtest.py): usuários virtuais assíncronos contra a API
+LOAD_USERS = 100              # Usuários virtuais simultâneos
+LOAD_SPAWN_RATE = 50          # Usuários iniciados por segundo
+LOAD_DURATION = 60            # Duração da fase de carga (s)
+LOAD_THINK_TIME = (0.5, 2.0)  # Pausa aleatória entre requisições de um usuário (s)
+LOAD_CONNECTIONS = 1000       # Limite de conexões TCP simultâneas
+LOAD_USER_SUFFIX = "_load"    # testuser_load1, testuser_load2, ...
+
+# Backend simulado (mock_backend.py): servidor em processo nas portas de API_URL e AUTH_URL
+MOCK_HOST = "127.0.0.1"
+MOCK_LATENCY_MS = 0           # Latência injetada em cada resposta (ms)
+MOCK_JITTER_MS = 0            # Variação aleatória somada à latência (ms)
+
+# Registro de locators (locators.py): sondagem de XPath e cache da estratégia mais rápida por página
+LOCATOR_CACHE_ENABLED = True
+LOCATOR_PROBE_ROUNDS = 3      # Medições por estratégia na sondagem (usa a menor)
+
+# Motor de passos (engine.py): antecipa e paraleliza passos seed seguros; False = replay linear
+PLAN_REORDER = True
+
+# Novas tentativas de passos idempotentes em falhas transitórias (backoff exponencial limitado)
+RETRY_ATTEMPTS = 3             # Tentativas por passo (1 = sem retry)
+RETRY_BACKOFF = 0.5            # Espera antes da 2ª tentativa (s); dobra a cada tentativa
+RETRY_BACKOFF_MAX = 4.0        # Espera máxima entre tentativas (s)
+RETRY_EXCEPTIONS = (           # Falhas consideradas transitórias (nome da classe ou de uma base)
+    "TimeoutException",
+    "StaleElementReferenceException",
+    "ElementClickInterceptedException",
+    "ElementNotInteractableException",
+    "NoSuchElementException",
+    "TimeoutError",
+    "StepFailed",                 # Ação retornou False (engine.StepFailed)
+)
+
+# Histórico de flakiness por passo (flaky.py) e pista de quarentena
+FLAKE_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "flakes.jsonl")
+FLAKE_WINDOW = 20              # Runs recentes considerados na taxa de flake
+FLAKE_MIN_RUNS = 5             # Runs mínimos de um passo antes de poder entrar em quarentena
+FLAKE_QUARANTINE_RATE = 0.2    # Tentativas com falha / tentativas acima disso = quarentena
+
+# Perfis de navegador: "demo" (apresentação, como sempre foi) e "throughput" (CI, velocidade)
+BROWSER_PROFILES = {
+    "demo": {
+        "headless": False,
+        "window_size": "1920,1080",
+        "block_resources": False,
+        "disable_animations": False,
+        "pause_scale": 1.0,   # Multiplica as pausas de wait() quando não há quiescência
+        "typing": True,       # Digitação caractere a caractere
+        "keep_alive": 3,      # Segundos com o navegador aberto no final
+    },
+    "throughput": {
+        "headless": True,
+        "window_size": "1280,800",
+        "block_resources": True,
+        "disable_animations": True,
+        "pause_scale": 0.25,
+        "typing": False,
+        "keep_alive": 0,
+    },
+}
+DEFAULT_PROFILE = "demo"
+BLOCKED_URL_PATTERNS = [       # Network.setBlockedURLs no perfil throughput (imagens e fontes)
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+]
+PROFILE_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "profiles.jsonl")
+
+# Pool de drivers aquecidos (vários cenários no mesmo processo Chrome)
+POOL_SIZE = 1                # Drivers mantidos abertos pelo pool
+POOL_NEW_CONTEXT = True      # Cada cenário em um contexto de navegador novo (Target.createBrowserContext)
+POOL_RESET_ORIGINS = [BASE_URL, API_URL, AUTH_URL]  # Origens com storage limpo no reset
+
+# Transporte CDP assíncrono (cdp_async.py)
+ASYNC_TABS = 3               # Abas abertas ao mesmo tempo para ações independentes
+
+# Gerador de cenários sintéticos (scenario_generator.py)
+GENERATOR_SEED = 42
+GENERATOR_USERS = 1
+GENERATOR_HABITS = 100            # Hábitos por usuário
+GENERATOR_TODOS = 500             # Afazeres por usuário
+GENERATOR_TAGS = 10               # Tags por usuário
+GENERATOR_HISTORY_DAYS = 90       # Dias de histórico de conclusões
+GENERATOR_COMPLETION_RATE = 0.6   # Chance de um hábito ter sido concluído em um dia previsto
+GENERATOR_USER_SUFFIX = "_gen"    # testuser -> testuser_gen1, testuser_gen2, ...
+
+# Logs (log_pipeline.py): "text" ou "json"; nível mínimo; arquivo JSON lines opcional
+LOG_FORMAT = os.environ.get("DAILYQUEST_LOG_FORMAT", "text")
+LOG_LEVEL = os.environ.get("DAILYQUEST_LOG_LEVEL", "INFO")
+LOG_FILE = os.environ.get("DAILYQUEST_LOG_FILE") or None
+
+# Artefatos de falha (artifacts.py)
+ARTIFACTS_BUDGET_MB = 200         # Espaço máximo gravado por run (screenshots, DOM, console, HAR)
+ARTIFACTS_QUEUE = 16              # Falhas aguardando gravação (acima disso são descartadas)
+ARTIFACTS_COMPRESSION_LEVEL = 6   # gzip (1 = mais rápido, 9 = menor)
+
+# Cenários em streaming (scenario_stream.py)
+STREAM_KEEP_ERRORS = 50        # Passos com erro guardados para o relatório final
+STREAM_PROGRESS_EVERY = 1000   # Passos entre as linhas de progresso
+
+# Teste de escala do DOM (stress.py): N hábitos/afazeres por run
+STRESS_SIZES = [10, 100, 1000, 10000]
+STRESS_HISTORY_DAYS = 180      # Meses de histórico de conclusões
+STRESS_HISTORY_HABITS = 50     # Hábitos com histórico (limita o volume de conclusões)
+STRESS_QUIET_MS = 500          # Janela sem mutações/long tasks para considerar a view pronta
+STRESS_SCROLL_MS = 1500        # Duração da medição de scroll (ms)
+STRESS_TIMEOUT = 60            # Máximo por medição (s)
+STRESS_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "stress.json")
+
+# Matriz de condições de rede/CPU (throttling.py); vazão em bytes/s, -1 = sem limite
+NETWORK_PROFILES = {
+    "baseline": {"latency": 0, "download": -1, "upload": -1, "cpu": 1},
+    "3g": {"latency": 562.5, "download": 180000, "upload": 84375, "cpu": 1},            # "3G" do DevTools
+    "4g": {"latency": 165, "download": 1012500, "upload": 168750, "cpu": 1},            # "Fast 4G" do DevTools
+    "high_latency": {"latency": 800, "download": -1, "upload": -1, "cpu": 1},
+    "cpu_4x": {"latency": 0, "download": -1, "upload": -1, "cpu": 4},
+}
+NETWORK_MATRIX_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "network_matrix.json")
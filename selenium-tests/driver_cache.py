@@ -0,0 +1,220 @@
+"""
+Cache persistente do chromedriver - DailyQuest
+Guarda o binário resolvido pelo webdriver-manager por versão do Chrome, para
+que inicializações seguintes não precisem de rede nem de busca em diretórios.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from config import DRIVER_CACHE_DIR, CHROME_BINARIES
+from utils import log_action
+
+INDEX_FILE = "chromedriver.json"
+
+
+class DriverResolutionError(Exception):
+    """Não foi possível obter um chromedriver utilizável"""
+    pass
+
+
+def detect_chrome_version():
+    """Retorna a versão do Chrome instalado (ex: '120.0.6099.109') ou None"""
+    for binary in CHROME_BINARIES:
+        executable = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+        if not executable:
+            continue
+        try:
+            output = subprocess.run(
+                [executable, "--version"], capture_output=True, text=True, timeout=5
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _sha256(path):
+    """Hash SHA-256 do arquivo"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_index():
+    """Lê o índice do cache (vazio se não existir ou estiver corrompido)"""
+    try:
+        with open(Path(DRIVER_CACHE_DIR) / INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _temp_path(directory, prefix):
+    """Arquivo temporário exclusivo no diretório (vários processos podem gravar ao mesmo tempo)"""
+    fd, path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    os.close(fd)
+    return Path(path)
+
+
+def _save_index(index):
+    """Grava o índice do cache de forma atômica"""
+    cache_dir = Path(DRIVER_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_path(cache_dir, INDEX_FILE)
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, cache_dir / INDEX_FILE)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _verify(entry):
+    """
+    Confere a integridade de uma entrada do cache
+
+    Caminho rápido: tamanho e mtime inalterados. Se mudaram, recalcula o
+    SHA-256 e só aceita se o conteúdo for o mesmo.
+    """
+    path = Path(entry["path"])
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    if not os.access(str(path), os.X_OK):
+        return False
+    if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    if _sha256(path) != entry["sha256"]:
+        log_action("Cache do chromedriver inválido (hash divergente)", str(path))
+        return False
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return True
+
+
+def _install_with_manager():
+    """Resolve o chromedriver via webdriver-manager (requer rede no primeiro uso)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    # webdriver-manager may return a path that is not the actual executable (e.g. a NOTICE file)
+    install_path = ChromeDriverManager().install()
+    driver_path = Path(install_path)
+
+    log_action(f"webdriver-manager returned: {install_path}")
+
+    # Check if the returned file is actually the chromedriver binary
+    is_valid_binary = (
+        driver_path.is_file() and
+        driver_path.name == 'chromedriver' and
+        os.access(str(driver_path), os.X_OK)
+    )
+
+    if is_valid_binary:
+        return driver_path
+
+    log_action(f"Returned path is not the chromedriver binary (is_file={driver_path.is_file()}, name={driver_path.name})")
+    log_action("Searching for actual chromedriver binary...")
+
+    # Search in the same directory for the actual chromedriver
+    search_dir = driver_path.parent if driver_path.is_file() else driver_path
+    log_action(f"Searching in: {search_dir}")
+
+    # Look for files named exactly 'chromedriver' (no extension)
+    for candidate in search_dir.iterdir():
+        if candidate.name == 'chromedriver' and candidate.is_file():
+            log_action(f"Found candidate: {candidate}, executable={os.access(str(candidate), os.X_OK)}")
+            # Try to make it executable if not already
+            try:
+                if not os.access(str(candidate), os.X_OK):
+                    log_action(f"Making {candidate} executable...")
+                    os.chmod(str(candidate), 0o755)
+                log_action(f"✓ Using chromedriver at: {candidate}")
+                return candidate
+            except Exception as e:
+                log_action(f"Could not use {candidate}: {e}")
+
+    log_action("ERROR: Could not find chromedriver binary!")
+    return driver_path  # Will fail, but with clear error
+
+
+def _store(key, chrome_version, source_path):
+    """
+    Copia o binário para o cache e registra a entrada no índice
+
+    A cópia vai para um temporário exclusivo e substitui o destino com
+    os.replace: um processo que já executa o binário do cache continua com o
+    arquivo antigo em vez de vê-lo sobrescrito (ETXTBSY).
+    """
+    target_dir = Path(DRIVER_CACHE_DIR) / key
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / Path(source_path).name
+    tmp_path = _temp_path(target_dir, target.name)
+    try:
+        shutil.copy2(source_path, tmp_path)
+        os.chmod(tmp_path, 0o755)
+        os.replace(tmp_path, target)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    stat = target.stat()
+    index = _load_index()
+    index[key] = {
+        "path": str(target),
+        "chrome_version": chrome_version,
+        "sha256": _sha256(target),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "resolved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    _save_index(index)
+    return str(target)
+
+
+def resolve_driver(offline=False):
+    """
+    Retorna o caminho do chromedriver para o Chrome instalado
+
+    Ordem: cache (chave = versão major do Chrome) -> webdriver-manager -> PATH.
+    Em modo offline o webdriver-manager nunca é chamado.
+    """
+    chrome_version = detect_chrome_version()
+    key = chrome_version.split(".")[0] if chrome_version else None
+
+    if key:
+        index = _load_index()
+        entry = index.get(key)
+        if entry and _verify(entry):
+            log_action("Chromedriver do cache", f"Chrome {chrome_version} -> {entry['path']}")
+            return entry["path"]
+        if entry:
+            index.pop(key)
+            _save_index(index)
+
+    if not offline:
+        resolved = _install_with_manager()
+        if key and resolved.is_file():
+            return _store(key, chrome_version, resolved)
+        return str(resolved)
+
+    fallback = shutil.which("chromedriver")
+    if fallback:
+        log_action("Modo offline: usando chromedriver do PATH", fallback)
+        return fallback
+
+    raise DriverResolutionError(
+        f"Modo offline sem chromedriver em cache para Chrome {chrome_version or 'desconhecido'}; "
+        "execute uma vez com rede ou adicione o chromedriver ao PATH"
+    )
@@ -0,0 +1,213 @@
+"""
+Pool de drivers aquecidos - DailyQuest
+Mantém processos Chrome abertos entre cenários. Entre um cenário e outro o
+estado é limpo via CDP (cookies, storage das origens do app) e a aba é
+trocada por uma em um contexto de navegador novo, o que custa dezenas de
+milissegundos em vez dos segundos de setup_driver + driver.quit.
+"""
+import queue
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+
+import quiescence
+from config import (
+    BASE_URL,
+    DRIVER_OFFLINE,
+    DEFAULT_PROFILE,
+    POOL_SIZE,
+    POOL_NEW_CONTEXT,
+    POOL_RESET_ORIGINS,
+)
+from utils import log_action
+
+# Desligado na primeira falha de Target.createBrowserContext (ex: Chrome sem suporte)
+_contexts = {"supported": True}
+
+
+def _clear_state(driver):
+    """Limpa sessionStorage da aba, cookies e storage das origens do app"""
+    try:
+        driver.execute_script("try { window.sessionStorage.clear(); } catch (e) {}")
+    except Exception:
+        pass
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    for origin in POOL_RESET_ORIGINS:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+
+def _replay_setups(driver):
+    """Reaplica na aba atual os comandos registrados por utils.cdp_setup"""
+    for method, params in getattr(driver, "cdp_setups", []):
+        driver.execute_cdp_cmd(method, params)
+
+
+def _switch_context(driver):
+    """
+    Troca a aba atual por uma aba em um contexto de navegador novo
+
+    O handle de janela do chromedriver é o targetId do CDP. O contexto
+    anterior (se criado pelo pool) é descartado depois da troca.
+    """
+    context = driver.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": False})
+    context_id = context["browserContextId"]
+    target = driver.execute_cdp_cmd(
+        "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+    )
+    previous_context = getattr(driver, "browser_context", None)
+    driver.close()
+    driver.switch_to.window(target["targetId"])
+    driver.browser_context = context_id
+    if previous_context:
+        try:
+            driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": previous_context})
+        except Exception:
+            pass
+    _replay_setups(driver)
+
+
+def reset(driver, new_context=POOL_NEW_CONTEXT, url=BASE_URL):
+    """
+    Deixa o driver pronto para um novo cenário e retorna a duração (s)
+
+    Um contexto novo já nasce sem cookies nem storage; sem suporte a
+    contextos novos, o estado é limpo na própria aba.
+    """
+    started = time.perf_counter()
+    switched = False
+    if new_context and _contexts["supported"]:
+        try:
+            _switch_context(driver)
+            switched = True
+        except Exception as e:
+            _contexts["supported"] = False
+            log_action("Contexto de navegador novo indisponível", f"limpando na mesma aba ({str(e)[:80]})")
+            try:
+                driver.current_window_handle
+            except Exception:
+                # A aba antiga já foi fechada: segue na que restou
+                driver.switch_to.window(driver.window_handles[0])
+    if not switched:
+        _clear_state(driver)
+    driver.get(url)
+    return time.perf_counter() - started
+
+
+class DriverPool:
+    """
+    Drivers Chrome reutilizáveis entre cenários
+
+    acquire() devolve um driver pronto em BASE_URL: aquecido (após reset) se
+    houver um livre, novo enquanto o pool não chegou a `size`, ou espera a
+    devolução de outro. Use lease() como gerenciador de contexto.
+    performance_log e console_log são repassados a setup_driver (exigidos
+    pelos hooks de waterfall e de artefatos).
+    """
+
+    def __init__(self, size=POOL_SIZE, offline=DRIVER_OFFLINE, profile=DEFAULT_PROFILE, headless=False,
+                 new_context=POOL_NEW_CONTEXT, performance_log=False, console_log=False):
+        self.size = size
+        self.offline = offline
+        self.profile = profile
+        self.headless = headless
+        self.new_context = new_context
+        self.performance_log = performance_log
+        self.console_log = console_log
+        self._idle = queue.LifoQueue()
+        self._drivers = []
+        self._reserved = 0
+        self._lock = threading.Lock()
+        self.startups = []
+        self.resets = []
+
+    def _create(self):
+        from main import setup_driver, navigate_first
+
+        started = time.perf_counter()
+        driver = setup_driver(
+            headless=self.headless, offline=self.offline, profile=self.profile,
+            performance_log=self.performance_log, console_log=self.console_log
+        )
+        navigate_first(driver)
+        self.startups.append(time.perf_counter() - started)
+        return driver
+
+    def acquire(self):
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._reserved < self.size
+                if create:
+                    self._reserved += 1
+            if not create:
+                driver = self._idle.get()
+            else:
+                try:
+                    driver = self._create()
+                except Exception:
+                    with self._lock:
+                        self._reserved -= 1
+                    raise
+                self._drivers.append(driver)
+                quiescence.use(driver)
+                return driver
+        self.resets.append(reset(driver, self.new_context))
+        quiescence.use(driver)
+        return driver
+
+    def release(self, driver):
+        self._idle.put(driver)
+
+    @contextmanager
+    def lease(self):
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers = []
+        self._reserved = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def print_report(self):
+        """Compara o custo de inicialização com o custo de reset por cenário"""
+        if self.startups:
+            log_action(
+                "Inicialização de driver",
+                f"{len(self.startups)}x, mediana {statistics.median(self.startups) * 1000:.0f} ms"
+            )
+        if self.resets:
+            log_action(
+                "Reset entre cenários",
+                f"{len(self.resets)}x, mediana {statistics.median(self.resets) * 1000:.0f} ms "
+                f"(máx {max(self.resets) * 1000:.0f} ms)"
+            )
+
+
+def run_repeated(scenarios, repeat, pool, hooks=()):
+    """Executa o fluxo `repeat` vezes em sequência nos drivers do pool"""
+    from main import execute_test_flow
+
+    results = []
+    for run in range(1, repeat + 1):
+        log_action("Cenário no pool", f"{run}/{repeat}")
+        with pool.lease() as driver:
+            for result in execute_test_flow(driver, scenarios, hooks=hooks):
+                result["run"] = run
+                results.append(result)
+    pool.print_report()
+    return results
@@ -0,0 +1,366 @@
+"""
+Motor de passos - DailyQuest
+Registro de ações com metadados (@step), compilação do cenário em um plano
+de execução com os dados já associados a cada passo e escalonador que
+antecipa e paraleliza passos seguros (seeding via API) respeitando as
+dependências declaradas (requires/provides).
+"""
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import log_pipeline
+import seeding
+from config import PLAN_REORDER, SEED_WORKERS, RETRY_ATTEMPTS, RETRY_BACKOFF, RETRY_BACKOFF_MAX, RETRY_EXCEPTIONS
+from utils import wait, log_action
+
+# Recurso fornecido pelo login e exigido pelos passos com needs_login
+SESSION = "session"
+
+STEPS = {}
+
+
+class StepFailed(Exception):
+    """Ação retornou False (tratou a exceção internamente sem concluir o passo)"""
+    pass
+
+
+class StepSpec:
+    """Ação registrada e seus metadados"""
+
+    def __init__(self, name, func, idempotent=False, needs_login=True, parallel_safe=False,
+                 consumes=None, bind=None, requires=(), provides=()):
+        self.name = name
+        self.func = func
+        self.idempotent = idempotent
+        self.needs_login = needs_login
+        self.parallel_safe = parallel_safe
+        self.consumes = consumes
+        self.bind = bind
+        self.requires = set(requires) | ({SESSION} if needs_login else set())
+        self.provides = set(provides)
+        self.seed = None
+
+    @property
+    def seedable(self):
+        return self.seed is not None
+
+
+def step(*names, **metadata):
+    """
+    Registra a função como ação do cenário
+
+    func(driver, item, ctx) recebe o item do plano (passo original em
+    item["step"], dados do cenário em item["data"]) e o FlowContext; retornar
+    False conta como falha do passo (StepFailed). Metadados: idempotent, needs_login, parallel_safe, consumes
+    ("habits"/"tasks"), bind(step, scenarios, position), requires e provides.
+    """
+    def decorator(func):
+        for name in names:
+            STEPS[name] = StepSpec(name, func, **metadata)
+        return func
+    return decorator
+
+
+def seeder(*names):
+    """Registra func(client, item, ctx) como execução via API das ações (passos "seed": true)"""
+    def decorator(func):
+        for name in names:
+            STEPS[name].seed = func
+        return func
+    return decorator
+
+
+def compile_item(raw, index, scenarios, positions):
+    """
+    Item do plano para um passo do cenário
+
+    positions ({"habits": n, "tasks": n}) é atualizado com o item consumido.
+    """
+    spec = STEPS.get(raw["action"])
+    item = {
+        "index": index,
+        "action": raw["action"],
+        "description": raw["description"],
+        "step": raw,
+        "spec": spec,
+        "data": None,
+        "seed": bool(spec and spec.seedable and raw.get("seed")),
+    }
+    if spec and spec.consumes:
+        position = positions.get(spec.consumes, 0)
+        item["data"] = spec.bind(raw, scenarios, position) if spec.bind else None
+        positions[spec.consumes] = position + 1
+    return item
+
+
+def compile_plan(scenarios, flow, start_index=1, positions=None):
+    """
+    Compila os passos em itens do plano
+
+    Os itens consumidos de scenarios["habits"]/["tasks"] são associados aqui,
+    uma única vez; positions indica quantos já foram consumidos antes do
+    primeiro passo (segmentos do runner paralelo).
+    """
+    positions = dict(positions or {})
+    return [compile_item(raw, index, scenarios, positions) for index, raw in enumerate(flow, start_index)]
+
+
+def schedule(plan, reorder=PLAN_REORDER):
+    """
+    Divide o plano em estágios [{"parallel": bool, "items": [...]}]
+
+    Com reorder, passos seed paralelizáveis cujas dependências não vêm de
+    passos de UI anteriores são antecipados para um estágio concorrente; os
+    demais seguem na ordem do cenário.
+    """
+    if not reorder:
+        return [{"parallel": False, "items": plan}]
+
+    hoisted, remaining = [], []
+    provided_by_ui = set()
+    for item in plan:
+        spec = item["spec"]
+        needs = (spec.requires - {SESSION}) if spec else set()
+        if item["seed"] and spec.parallel_safe and not needs & provided_by_ui:
+            hoisted.append(item)
+            continue
+        remaining.append(item)
+        if spec and not item["seed"]:
+            provided_by_ui |= spec.provides
+
+    stages = []
+    if hoisted:
+        stages.append({"parallel": len(hoisted) > 1, "items": hoisted})
+    if remaining:
+        stages.append({"parallel": False, "items": remaining})
+    return stages
+
+
+def split_quarantine(plan, actions):
+    """
+    Separa do plano os passos em quarentena que podem rodar fora do caminho crítico
+
+    Só passos de UI idempotentes entram na pista: o que um passo da pista
+    exige tem de vir de um passo anterior da própria pista, e nada do que a
+    pista fornece pode ser exigido pelos demais passos. Como o estado da tela
+    (modal aberto, aba) também é declarado em requires/provides, fechar um
+    modal ou trocar de aba só sai do caminho crítico junto com quem o abriu.
+    Retorna (caminho crítico, pista).
+    """
+    lane = [
+        item for item in plan
+        if item["action"] in actions and item["spec"] and item["spec"].idempotent
+        and not item["seed"] and SESSION not in item["spec"].provides
+    ]
+    while True:
+        indexes = {item["index"] for item in lane}
+        critical_needs = set()
+        for item in plan:
+            if item["index"] not in indexes and item["spec"]:
+                critical_needs |= item["spec"].requires - {SESSION}
+        provided, keep = set(), []
+        for item in lane:
+            spec = item["spec"]
+            if spec.requires - {SESSION} <= provided and not spec.provides & critical_needs:
+                keep.append(item)
+                provided |= spec.provides
+        if len(keep) == len(lane):
+            break
+        lane = keep
+    indexes = {item["index"] for item in lane}
+    return [item for item in plan if item["index"] not in indexes], lane
+
+
+class FlowContext:
+    """Estado compartilhado pelos passos de uma execução"""
+
+    def __init__(self, scenarios, user, total):
+        self.scenarios = scenarios
+        self.user = user
+        self.total = total
+        self.seed_client = None
+        self.needs_refresh = False
+        self.failed = set()
+
+    def client(self):
+        """SeedClient autenticado, criado no primeiro passo seed"""
+        if self.seed_client is None:
+            self.seed_client = seeding.SeedClient()
+            self.seed_client.login(self.user["username"], self.user["password"])
+        return self.seed_client
+
+    def close(self):
+        if self.seed_client:
+            self.seed_client.close()
+
+
+def _new_result(item):
+    return {"index": item["index"], "action": item["action"], "description": item["description"],
+            "status": "ok", "error": ""}
+
+
+def _banner(item, ctx):
+    log_action("========================================")
+    log_action(f"PASSO {item['index']}/{ctx.total}: {item['description']}")
+    log_action("========================================")
+
+
+def _blocked(item, ctx):
+    """Dependência que falhou antes (o passo é pulado em vez de falhar)"""
+    spec = item["spec"]
+    missing = spec.requires & ctx.failed if spec else set()
+    return ", ".join(sorted(missing))
+
+
+def is_transient(error):
+    """Falha que pode passar em uma nova tentativa (timeout, elemento obsoleto/coberto...)"""
+    return any(cls.__name__ in RETRY_EXCEPTIONS for cls in type(error).__mro__)
+
+
+def _call_with_retry(spec, driver, item, ctx, result, attempts=RETRY_ATTEMPTS):
+    """Executa a ação; passos idempotentes são repetidos em falhas transitórias com backoff limitado"""
+    attempts = attempts if spec.idempotent else 1
+    for attempt in range(1, attempts + 1):
+        result["attempts"] = attempt
+        try:
+            if spec.func(driver, item, ctx) is False:
+                raise StepFailed(f"{item['action']} não foi concluída")
+            return
+        except Exception as e:
+            if attempt == attempts or not is_transient(e):
+                raise
+            delay = min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+            log_action(
+                f"Passo {item['index']} falhou (tentativa {attempt}/{attempts})",
+                f"{type(e).__name__}; nova tentativa em {delay:.1f}s", logging.WARNING
+            )
+            time.sleep(delay)
+
+
+def run_item(driver, item, ctx):
+    """Executa um item do plano (UI ou seed) e retorna o resultado"""
+    result = _new_result(item)
+    spec = item["spec"]
+    blocked = _blocked(item, ctx)
+    if blocked:
+        log_action(f"Passo {item['index']} pulado", f"dependência falhou: {blocked}")
+        result.update(status="skipped", error=f"dependência falhou: {blocked}")
+        return result
+
+    try:
+        if spec is None:
+            log_action(f"Ação não implementada: {item['action']}")
+            result["status"] = "skipped"
+        elif item["seed"]:
+            spec.seed(ctx.client(), item, ctx)
+            result["seeded"] = True
+            ctx.needs_refresh = True
+        else:
+            # Dados criados via API só aparecem após recarregar (o login já carrega a página)
+            if ctx.needs_refresh and SESSION not in spec.provides:
+                driver.refresh()
+                wait(0.3)
+            ctx.needs_refresh = False
+            _call_with_retry(spec, driver, item, ctx, result)
+            wait(0.2)
+        if spec:
+            ctx.failed -= spec.provides
+    except Exception as e:
+        log_action(f"Erro no passo {item['index']}: {str(e)[:100]}", level=logging.ERROR)
+        result["status"] = "error"
+        result["error"] = str(e)[:100]
+        result["traceback"] = traceback.format_exc()
+        if spec:
+            ctx.failed |= spec.provides
+        if not item["seed"]:
+            wait(0.3)
+    return result
+
+
+def _run_with_hooks(driver, item, ctx, hooks):
+    _banner(item, ctx)
+    placeholder = _new_result(item)
+    for hook in hooks:
+        hook.before_step(driver, placeholder)
+    # Logs do passo só são enfileirados: a escrita não entra na duração
+    token = log_pipeline.enter_step(item["index"], item["action"])
+    started = time.perf_counter()
+    try:
+        result = run_item(driver, item, ctx)
+        placeholder["duration"] = time.perf_counter() - started
+    finally:
+        log_pipeline.leave_step(token)
+        log_pipeline.flush()
+    placeholder.update(result)
+    for hook in hooks:
+        hook.after_step(driver, placeholder)
+    return placeholder
+
+
+def run_detached(item, ctx, driver=None):
+    """
+    Passo fora do fluxo principal, sem hooks: seed do estágio concorrente
+    (driver None) ou passo da pista de quarentena (driver próprio)
+    """
+    token = log_pipeline.enter_step(item["index"], item["action"])
+    started = time.perf_counter()
+    try:
+        result = run_item(driver, item, ctx)
+        result["duration"] = time.perf_counter() - started
+    finally:
+        log_pipeline.leave_step(token)
+    return result
+
+
+def run_stream(driver, items, scenarios, user, total="?", hooks=()):
+    """
+    Executa itens à medida que chegam (gerador), em ordem e sem reordenação
+
+    Gera o resultado de cada passo assim que ele termina; nada do plano é
+    guardado (usado por scenario_stream.py).
+    """
+    ctx = FlowContext(scenarios, user, total)
+    log_pipeline.set_context(scenario=user["username"])
+    try:
+        for item in items:
+            yield _run_with_hooks(driver, item, ctx, hooks)
+    finally:
+        ctx.close()
+
+
+def run_plan(driver, plan, scenarios, user, total=None, hooks=(), reorder=PLAN_REORDER, lane=None):
+    """
+    Executa o plano estágio a estágio; retorna os resultados na ordem do cenário
+
+    lane (flaky.QuarantineLane) recebe os passos em quarentena que podem sair
+    do caminho crítico (split_quarantine) e os executa em paralelo.
+    """
+    ctx = FlowContext(scenarios, user, total or len(plan))
+    log_pipeline.set_context(scenario=user["username"])
+    results = []
+    if lane is not None:
+        plan, quarantined = split_quarantine(plan, lane.actions)
+        lane.start(quarantined, scenarios, user)
+    try:
+        for stage in schedule(plan, reorder):
+            if stage["parallel"]:
+                log_action("Passos seed antecipados em paralelo", ", ".join(str(i["index"]) for i in stage["items"]))
+                try:
+                    ctx.client()
+                except Exception as e:
+                    # Sem cliente autenticado cada passo falha individualmente, em sequência
+                    log_action("Login na API falhou", str(e)[:100])
+                    results.extend(run_detached(item, ctx) for item in stage["items"])
+                    continue
+                with ThreadPoolExecutor(max_workers=SEED_WORKERS) as pool:
+                    results.extend(pool.map(lambda item: run_detached(item, ctx), stage["items"]))
+            else:
+                for item in stage["items"]:
+                    results.append(_run_with_hooks(driver, item, ctx, hooks))
+    finally:
+        ctx.close()
+        if lane is not None:
+            results.extend(lane.results())
+    return sorted(results, key=lambda r: r["index"])
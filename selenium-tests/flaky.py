@@ -0,0 +1,136 @@
+"""
+Flakiness por passo - DailyQuest
+Registra em FLAKE_HISTORY, a cada run, as tentativas e falhas de cada ação
+(engine.py repete passos idempotentes em falhas transitórias). A taxa de
+flake de uma ação é tentativas com falha / tentativas nos últimos
+FLAKE_WINDOW runs. Uma ação que às vezes passa e tem taxa acima de
+FLAKE_QUARANTINE_RATE entra em quarentena (a que nunca passa está quebrada,
+não instável) e, com --quarantine, roda em uma pista paralela com um Chrome
+próprio, fora do caminho crítico.
+"""
+import threading
+import time
+
+import benchmark
+import engine
+from config import FLAKE_HISTORY, FLAKE_WINDOW, FLAKE_MIN_RUNS, FLAKE_QUARANTINE_RATE
+from utils import log_action, report
+
+
+def summarize(results):
+    """{ação: {"runs", "passed", "attempts", "failures"}} de um run"""
+    steps = {}
+    for result in results:
+        if result["status"] == "skipped":
+            continue
+        attempts = result.get("attempts", 1)
+        failures = attempts - (1 if result["status"] == "ok" else 0)
+        entry = steps.setdefault(result["action"], {"runs": 1, "passed": 0, "attempts": 0, "failures": 0})
+        entry["passed"] += result["status"] == "ok"
+        entry["attempts"] += attempts
+        entry["failures"] += failures
+    return steps
+
+
+def record(results, path=FLAKE_HISTORY):
+    """Adiciona ao histórico um registro por run (resultados com "run" vêm de --repeat)"""
+    runs = {}
+    for result in results:
+        runs.setdefault(result.get("run"), []).append(result)
+    for run_results in runs.values():
+        benchmark.append_history({"timestamp": time.time(), "steps": summarize(run_results)}, path)
+
+
+def rates(path=FLAKE_HISTORY, window=FLAKE_WINDOW):
+    """{ação: {"runs", "passed", "attempts", "failures", "rate"}} nos últimos `window` runs"""
+    totals = {}
+    for run in benchmark.load_history(path)[-window:]:
+        for action, entry in run.get("steps", {}).items():
+            total = totals.setdefault(action, {"runs": 0, "passed": 0, "attempts": 0, "failures": 0})
+            for key in total:
+                total[key] += entry.get(key, 0)
+    for total in totals.values():
+        total["rate"] = total["failures"] / total["attempts"] if total["attempts"] else 0.0
+    return totals
+
+
+def quarantined(path=FLAKE_HISTORY, threshold=FLAKE_QUARANTINE_RATE, min_runs=FLAKE_MIN_RUNS):
+    """Ações cronicamente instáveis (falham com frequência, mas também passam)"""
+    return {
+        action for action, total in rates(path).items()
+        if total["runs"] >= min_runs and total["passed"] and total["rate"] > threshold
+    }
+
+
+def print_report(results, path=FLAKE_HISTORY):
+    """Passos repetidos neste run e ações em quarentena pelo histórico"""
+    retried = [r for r in results if r.get("attempts", 1) > 1]
+    if retried:
+        log_action("Passos com novas tentativas")
+        for result in retried:
+            status = "ok" if result["status"] == "ok" else "ERRO"
+            report(f"  {result['index']:>3} {result['action']:<28} {result['attempts']} tentativas  {status}")
+    history = rates(path)
+    flagged = sorted(quarantined(path), key=lambda action: -history[action]["rate"])
+    if flagged:
+        log_action("Ações em quarentena (taxa de flake / runs)")
+        for action in flagged:
+            report(f"  {action:<28} {history[action]['rate']:>6.1%} {history[action]['runs']:>4}")
+
+
+class QuarantineLane:
+    """
+    Pista paralela para passos em quarentena
+
+    Abre o próprio driver (open_driver() retorna um driver já na aplicação),
+    faz login com o usuário do fluxo e executa os passos em sequência em uma
+    thread, enquanto o fluxo principal segue sem eles.
+    """
+
+    def __init__(self, actions, open_driver):
+        self.actions = set(actions)
+        self._open_driver = open_driver
+        self._thread = None
+        self._results = []
+
+    def start(self, items, scenarios, user):
+        if not items:
+            return
+        log_action("Passos na pista de quarentena", ", ".join(f"{i['index']} {i['action']}" for i in items))
+        self._thread = threading.Thread(
+            target=self._run, args=(items, scenarios, user), name="quarantine-lane", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, items, scenarios, user):
+        ctx = engine.FlowContext(scenarios, user, len(items))
+        driver = None
+        try:
+            driver = self._open_driver()
+            login = engine.compile_item({"action": "login", "description": "Login da pista de quarentena"}, 0,
+                                        scenarios, {})
+            # Se o login falhar os passos são pulados (dependência "session")
+            engine.run_item(driver, login, ctx)
+            for item in items:
+                result = engine.run_detached(item, ctx, driver)
+                result["lane"] = "quarantine"
+                self._results.append(result)
+        except Exception as e:
+            log_action("Pista de quarentena falhou", str(e)[:100])
+            done = {r["index"] for r in self._results}
+            for item in items:
+                if item["index"] not in done:
+                    self._results.append({
+                        "index": item["index"], "action": item["action"], "description": item["description"],
+                        "status": "error", "error": str(e)[:100], "duration": 0.0, "lane": "quarantine",
+                    })
+        finally:
+            ctx.close()
+            if driver:
+                driver.quit()
+
+    def results(self):
+        """Espera a pista terminar e retorna seus resultados"""
+        if self._thread:
+            self._thread.join()
+        return self._results
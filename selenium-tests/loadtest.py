@@ -0,0 +1,194 @@
+"""
+Carga HTTP - DailyQuest
+Transforma o cenário (usuário, hábitos, afazeres e tags de scenarios.json) em
+chamadas diretas à API (mesmas rotas de lib/api-service.ts) executadas por
+milhares de usuários virtuais asyncio, no estilo Locust. Reporta throughput e
+p50/p95/p99 de latência por endpoint.
+"""
+import asyncio
+import random
+import time
+
+import aiohttp
+
+import seeding
+from benchmark import percentile, PERCENTILES
+from config import (
+    API_BASE_URL,
+    AUTH_URL,
+    SEED_TIMEOUT,
+    LOAD_USERS,
+    LOAD_SPAWN_RATE,
+    LOAD_DURATION,
+    LOAD_THINK_TIME,
+    LOAD_CONNECTIONS,
+    LOAD_USER_SUFFIX,
+)
+from parallel import build_user_pool
+from utils import log_action, report
+
+# Comportamento de leitura do usuário virtual: (peso, nome do endpoint, caminho)
+READ_TASKS = [
+    (4, "GET /tasks", "/tasks"),
+    (3, "GET /dashboard/stats", "/dashboard/stats"),
+    (2, "GET /dashboard/history", "/dashboard/history?days=30"),
+    (1, "GET /achievements/user", "/achievements/user"),
+]
+# Peso de completar uma tarefa ainda pendente do usuário
+COMPLETE_WEIGHT = 3
+
+
+class LoadStats:
+    """Latências e falhas por endpoint"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.failures = {}
+        self.started = None
+        self.finished = None
+
+    def record(self, name, seconds, ok):
+        self.latencies.setdefault(name, []).append(seconds)
+        if not ok:
+            self.failures[name] = self.failures.get(name, 0) + 1
+
+    def report(self):
+        """Lista {endpoint, requests, failures, rps, p50, p95, p99} por endpoint"""
+        elapsed = max((self.finished or time.perf_counter()) - self.started, 1e-9)
+        rows = []
+        for name, values in sorted(self.latencies.items()):
+            row = {
+                "endpoint": name,
+                "requests": len(values),
+                "failures": self.failures.get(name, 0),
+                "rps": len(values) / elapsed,
+            }
+            for q in PERCENTILES:
+                row[f"p{q}"] = percentile(values, q)
+            rows.append(row)
+        return rows, elapsed
+
+
+class VirtualUser:
+    """Usuário virtual: registra, faz login, cria o cenário e alterna leituras e conclusões"""
+
+    def __init__(self, session, user, scenarios, stats):
+        self.session = session
+        self.user = user
+        self.scenarios = scenarios
+        self.stats = stats
+        self.headers = {}
+        self.pending = []
+
+    async def request(self, name, method, url, accept=(), **kwargs):
+        """
+        Executa a requisição medindo a latência; retorna o JSON ou None em falha
+
+        Status em `accept` não contam como falha (ex: usuário já cadastrado).
+        """
+        started = time.perf_counter()
+        ok = False
+        data = None
+        try:
+            async with self.session.request(method, url, headers=self.headers, **kwargs) as response:
+                body = await response.read()
+                ok = response.status < 400 or response.status in accept
+                if ok and body and response.content_type == "application/json":
+                    data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        self.stats.record(name, time.perf_counter() - started, ok)
+        return data
+
+    async def setup(self):
+        """Cadastro, login e criação dos hábitos/afazeres do cenário"""
+        await self.request("POST /users", "POST", f"{API_BASE_URL}/users", accept=(400, 409), json=self.user)
+        token = await self.request("POST /login", "POST", f"{AUTH_URL}/login", data={
+            "username": self.user["username"], "password": self.user["password"]
+        })
+        if not token:
+            return False
+        self.headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+        bodies = [
+            seeding.habit_body(**seeding.habit_payload(h)) for h in self.scenarios.get("habits", [])
+        ] + [
+            seeding.todo_body(**seeding.todo_payload(t)) for t in self.scenarios.get("tasks", [])
+        ]
+        for body in bodies:
+            task = await self.request("POST /tasks", "POST", f"{API_BASE_URL}/tasks", json=body)
+            if task and "id" in task:
+                self.pending.append(task["id"])
+        random.shuffle(self.pending)
+        return True
+
+    async def step(self):
+        """Escolhe a próxima ação pelos pesos (conclusão só enquanto houver pendentes)"""
+        weights = [weight for weight, _, _ in READ_TASKS]
+        choices = list(READ_TASKS)
+        if self.pending:
+            weights.append(COMPLETE_WEIGHT)
+            choices.append(None)
+        choice = random.choices(choices, weights)[0]
+        if choice is None:
+            task_id = self.pending.pop()
+            await self.request(
+                "POST /task-completions/complete/{id}", "POST",
+                f"{API_BASE_URL}/task-completions/complete/{task_id}"
+            )
+        else:
+            _, name, path = choice
+            await self.request(name, "GET", f"{API_BASE_URL}{path}")
+
+    async def run(self, deadline):
+        if not await self.setup():
+            return
+        while time.perf_counter() < deadline:
+            await self.step()
+            await asyncio.sleep(random.uniform(*LOAD_THINK_TIME))
+
+
+async def run_load(scenarios, users=LOAD_USERS, duration=LOAD_DURATION, spawn_rate=LOAD_SPAWN_RATE):
+    """Inicia `users` usuários virtuais a `spawn_rate`/s e mantém a carga por `duration` s"""
+    stats = LoadStats()
+    pool = build_user_pool(scenarios["user"], users, suffix=LOAD_USER_SUFFIX)
+    connector = aiohttp.TCPConnector(limit=LOAD_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(total=SEED_TIMEOUT)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        stats.started = time.perf_counter()
+        deadline = stats.started + duration
+        running = []
+        for i, user in enumerate(pool):
+            running.append(asyncio.create_task(VirtualUser(session, user, scenarios, stats).run(deadline)))
+            if (i + 1) % max(spawn_rate, 1) == 0:
+                log_action("Usuários virtuais ativos", str(i + 1))
+                await asyncio.sleep(1)
+        await asyncio.gather(*running)
+        stats.finished = time.perf_counter()
+    return stats
+
+
+def print_report(stats):
+    """Imprime throughput e percentis de latência por endpoint"""
+    rows, elapsed = stats.report()
+    total = sum(row["requests"] for row in rows)
+    failures = sum(row["failures"] for row in rows)
+    log_action("========================================")
+    log_action("CARGA - LATÊNCIA POR ENDPOINT (ms)")
+    log_action("========================================")
+    report(f"  {'endpoint':<38} {'req':>7} {'falhas':>7} {'req/s':>8} {'p50':>7} {'p95':>7} {'p99':>7}")
+    for row in rows:
+        report(
+            f"  {row['endpoint']:<38} {row['requests']:>7} {row['failures']:>7} {row['rps']:>8.1f} "
+            f"{row['p50'] * 1000:>7.1f} {row['p95'] * 1000:>7.1f} {row['p99'] * 1000:>7.1f}"
+        )
+    log_action("Throughput total", f"{total / elapsed:.1f} req/s, {total} requisições, {failures} falhas em {elapsed:.1f}s")
+
+
+def run(scenarios, users=LOAD_USERS, duration=LOAD_DURATION, spawn_rate=LOAD_SPAWN_RATE):
+    """Executa a carga e retorna o código de saída (1 se houve falhas)"""
+    log_action("Iniciando carga", f"{users} usuários, {duration}s, {spawn_rate} usuários/s")
+    stats = asyncio.run(run_load(scenarios, users, duration, spawn_rate))
+    print_report(stats)
+    return 1 if stats.failures else 0
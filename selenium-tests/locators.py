@@ -0,0 +1,214 @@
+"""
+Registro de locators - DailyQuest
+Centraliza os locators com nome e alternativas equivalentes. Locators XPath
+(avaliados sobre o DOM inteiro, lentos) são sondados uma vez por página com
+implicit wait 0: cada estratégia é cronometrada e a alternativa declarada
+mais rápida que encontra exatamente os mesmos elementos fica em cache para a
+página. Seletores CSS gerados a partir do elemento encontrado são só
+sugestões no relatório: eles perdem predicados do XPath (not(...),
+contains(., ...)) e poderiam casar elementos diferentes.
+"""
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+import batch
+import utils
+from config import DEFAULT_TIMEOUT, LOCATOR_CACHE_ENABLED, LOCATOR_PROBE_ROUNDS
+from tracing import tracer
+
+# Gera seletores CSS únicos para o elemento encontrado pelo locator original
+SUGGEST_SCRIPT = batch.LOCATE_JS + """
+var el = locate(arguments[0])[0];
+if (!el) return [];
+var out = [], tag = el.tagName.toLowerCase();
+function add(sel) {
+  try { if (out.indexOf(sel) === -1 && document.querySelector(sel) === el) out.push(sel); } catch (e) {}
+}
+var testid = el.getAttribute('data-testid');
+if (testid) add('[data-testid="' + CSS.escape(testid) + '"]');
+if (el.id) add('#' + CSS.escape(el.id));
+['aria-label', 'name', 'role', 'type'].forEach(function (a) {
+  var v = el.getAttribute(a);
+  if (v) add(tag + '[' + a + '="' + CSS.escape(v) + '"]');
+});
+// Classes utilitárias sem variantes (hover:, w-1/2, [..]) e escopo no modal aberto
+var classes = Array.prototype.filter.call(el.classList, function (c) { return !/[:\\/\\[\\]]/.test(c); });
+var scope = el.closest('[role="dialog"]') ? '[role="dialog"] ' : '';
+for (var n = 1; n <= Math.min(classes.length, 4); n++) {
+  add(scope + tag + classes.slice(0, n).map(function (c) { return '.' + CSS.escape(c); }).join(''));
+}
+return out;
+"""
+
+
+class Locator(tuple):
+    """
+    Locator Selenium (by, value) com nome e alternativas
+
+    Continua sendo uma tupla: pode ser passado direto para WebDriverWait,
+    find_element(*locator) e batch.command.
+    """
+
+    def __new__(cls, name, by, value, alternatives=()):
+        locator = super().__new__(cls, (by, value))
+        locator.name = name
+        locator.alternatives = tuple(alternatives)
+        return locator
+
+    def __reduce__(self):
+        return (Locator, (self.name, self[0], self[1], self.alternatives))
+
+
+REGISTRY = {}
+
+# (nome, página) -> estratégia vencedora
+_winners = {}
+# (nome, página) -> URL completa em que a vencedora foi validada pela sondagem
+_validated = {}
+# (nome, página) -> seletores sugeridos
+_suggestions = {}
+# nome -> {"calls", "total", "max", "strategies": {estratégia: usos}}
+_stats = {}
+# (nome, estratégia) -> menor tempo de find_elements medido na sondagem (s)
+_probes = {}
+
+
+def register(name, by, value, *alternatives):
+    """Registra um locator nomeado (alternativas: tuplas (by, value) equivalentes)"""
+    locator = Locator(name, by, value, alternatives)
+    REGISTRY[name] = locator
+    return locator
+
+
+def _page(driver):
+    return urlsplit(driver.current_url).path or "/"
+
+
+def _time_find(driver, strategy):
+    """Menor tempo de find_elements em LOCATOR_PROBE_ROUNDS tentativas"""
+    best, elements = None, []
+    for _ in range(LOCATOR_PROBE_ROUNDS):
+        started = time.perf_counter()
+        try:
+            elements = driver.find_elements(*strategy)
+        except WebDriverException:
+            elements = []
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, elements
+
+
+def _probe(driver, locator, page):
+    """
+    Cronometra as estratégias do locator na página atual
+
+    Retorna a mais rápida entre o original e as alternativas declaradas que
+    encontram o mesmo conjunto de elementos, ou None se o elemento ainda não
+    existe. As sugestões geradas são cronometradas só para o relatório.
+    """
+    primary = tuple(locator)
+    driver.implicitly_wait(0)
+    try:
+        elapsed, reference = _time_find(driver, primary)
+        _probes[(locator.name, primary)] = elapsed
+        if not reference:
+            return None
+
+        key = (locator.name, page)
+        if key not in _suggestions:
+            try:
+                _suggestions[key] = driver.execute_script(SUGGEST_SCRIPT, batch.command(locator))
+            except WebDriverException:
+                _suggestions[key] = []
+
+        timings = {primary: elapsed}
+        for strategy in locator.alternatives:
+            elapsed, elements = _time_find(driver, strategy)
+            _probes[(locator.name, strategy)] = elapsed
+            if elements == reference:
+                timings[strategy] = elapsed
+        for selector in _suggestions[key]:
+            strategy = (By.CSS_SELECTOR, selector)
+            _probes[(locator.name, strategy)], _ = _time_find(driver, strategy)
+        return min(timings, key=timings.get)
+    finally:
+        driver.implicitly_wait(DEFAULT_TIMEOUT)
+
+
+def resolve(driver, locator):
+    """
+    Estratégia a usar para o locator na página atual
+
+    Só locators registrados com XPath são sondados; os demais (CSS, ID) já
+    são rápidos e voltam inalterados.
+    """
+    return resolve_checked(driver, locator)[0]
+
+
+def resolve_checked(driver, locator):
+    """
+    Como resolve(), mas retorna (estratégia, validada)
+
+    validada indica que a estratégia é o próprio locator ou uma alternativa
+    sondada nesta mesma URL (mesmos elementos do original): se ela não
+    encontrar o elemento, o original também não encontraria.
+    """
+    if not LOCATOR_CACHE_ENABLED or not isinstance(locator, Locator) or locator[0] != By.XPATH:
+        return tuple(locator), True
+    url = driver.current_url
+    page = urlsplit(url).path or "/"
+    key = (locator.name, page)
+    winner = _winners.get(key)
+    if winner is None:
+        with tracer.span(f"probe {locator.name}", "webdriver"):
+            winner = _probe(driver, locator, page)
+        if winner is None:
+            return tuple(locator), True
+        _winners[key] = winner
+        _validated[key] = url
+        if winner != tuple(locator):
+            utils.log_action(f"Locator {locator.name}", f"{page}: {winner[1]}")
+    return winner, winner == tuple(locator) or _validated.get(key) == url
+
+
+def forget(locator):
+    """Descarta as estratégias em cache do locator (ex: alternativa deixou de casar)"""
+    for key in [k for k in _winners if k[0] == getattr(locator, "name", None)]:
+        del _winners[key]
+        _validated.pop(key, None)
+
+
+def record(locator, strategy, seconds):
+    """Acumula o tempo de resolução (espera incluída) do locator"""
+    name = getattr(locator, "name", None) or f"{locator[0]}={locator[1][:60]}"
+    stats = _stats.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0, "strategies": {}})
+    stats["calls"] += 1
+    stats["total"] += seconds
+    stats["max"] = max(stats["max"], seconds)
+    label = "original" if strategy == tuple(locator) else strategy[1]
+    stats["strategies"][label] = stats["strategies"].get(label, 0) + 1
+
+
+def print_report():
+    """Imprime tempo de resolução por locator, estratégias sondadas e sugestões"""
+    utils.log_action("Locators por tempo total de resolução (chamadas / média / máx, s)")
+    for name, stats in sorted(_stats.items(), key=lambda item: item[1]["total"], reverse=True):
+        mean = stats["total"] / stats["calls"]
+        utils.report(f"  {name[:48]:<48} {stats['calls']:>4} {mean:>7.3f} {stats['max']:>7.3f}")
+        for label, uses in stats["strategies"].items():
+            utils.report(f"      {uses:>3}x {label[:90]}")
+
+    probed = sorted({name for name, _ in _probes})
+    if probed:
+        utils.log_action("Sondagem com implicit wait 0 (find_elements, ms)")
+    for name in probed:
+        utils.report(f"  {name}")
+        for (probe_name, strategy), elapsed in sorted(_probes.items(), key=lambda item: item[1]):
+            if probe_name == name:
+                utils.report(f"      {elapsed * 1000:>7.2f}  {strategy[0]}: {strategy[1][:90]}")
+        for (suggest_name, page), selectors in sorted(_suggestions.items()):
+            if suggest_name == name and selectors:
+                utils.report(f"      sugestões em {page}: {', '.join(selectors[:3])}")
@@ -0,0 +1,186 @@
+"""
+Pipeline de logs - DailyQuest
+Backend de utils.log_action: cada registro vai para uma fila e é formatado e
+gravado por uma thread em segundo plano (logging.QueueListener). A saída é
+texto ("[HH:MM:SS] ação: detalhe") ou JSON lines, filtrada por nível, e cada
+registro leva o worker, o cenário e o passo em que foi emitido.
+
+Durante um passo o registro só é enfileirado, então formatação e escrita
+ficam fora do tempo medido. Fora dos passos a chamada espera a fila esvaziar,
+mantendo a ordem com as linhas de relatório (report), que no formato JSON vão
+para stderr para o stdout ter só JSON lines.
+"""
+import atexit
+import contextvars
+import json
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import QueueListener
+
+from config import LOG_FORMAT, LOG_LEVEL, LOG_FILE
+
+LOGGER = "dailyquest"
+FORMATS = ("text", "json")
+CONTEXT_FIELDS = ("worker", "scenario", "step", "step_action")
+
+# Passo em execução na thread atual: (índice, ação) ou None
+_step = contextvars.ContextVar("log_step", default=None)
+# Worker e cenário do processo
+_context = {"worker": None, "scenario": None}
+
+
+def _level(name):
+    """Nível numérico a partir do nome (DEBUG, INFO, WARNING, ERROR)"""
+    level = logging.getLevelName(str(name).upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Nível de log desconhecido: {name}")
+    return level
+
+
+_state = {"format": LOG_FORMAT, "level": _level(LOG_LEVEL), "path": LOG_FILE}
+_pipeline = {"queue": None, "listener": None}
+
+
+class TextFormatter(logging.Formatter):
+    """[HH:MM:SS] ação: detalhe (com [worker] quando definido)"""
+
+    def format(self, record):
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+        worker = f"[w{record.worker}] " if record.worker is not None else ""
+        message = f"{record.msg}: {record.detail}" if record.detail else record.msg
+        return f"[{timestamp}] {worker}{message}"
+
+
+class JsonFormatter(logging.Formatter):
+    """Um objeto JSON por linha"""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "action": record.msg,
+            "detail": record.detail,
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field)
+            if value is not None:
+                entry[field] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _Listener(QueueListener):
+    """Monta o LogRecord na thread de escrita (a fila recebe só tuplas)"""
+
+    def prepare(self, entry):
+        created, level, action, detail, worker, scenario, step = entry
+        record = logging.LogRecord(LOGGER, level, "", 0, action, None, None)
+        record.created = created
+        record.detail = detail
+        record.worker = worker
+        record.scenario = scenario
+        record.step, record.step_action = step if step else (None, None)
+        return record
+
+
+def _handlers():
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(JsonFormatter() if _state["format"] == "json" else TextFormatter())
+    handlers = [console]
+    if _state["path"]:
+        # Arquivo sempre em JSON lines (para análise), independente da saída no terminal
+        output = logging.FileHandler(_state["path"], encoding="utf-8")
+        output.setFormatter(JsonFormatter())
+        handlers.append(output)
+    return handlers
+
+
+def start():
+    """Inicia a thread de escrita (chamado no primeiro registro)"""
+    if _pipeline["listener"] is None:
+        _pipeline["queue"] = queue.Queue()
+        _pipeline["listener"] = _Listener(_pipeline["queue"], *_handlers())
+        _pipeline["listener"].start()
+
+
+def stop():
+    """Grava os registros pendentes e encerra a thread de escrita"""
+    listener = _pipeline["listener"]
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    _pipeline["listener"] = None
+
+
+def flush():
+    """Espera a thread de escrita gravar tudo o que já foi enfileirado"""
+    if _pipeline["listener"] is not None:
+        _pipeline["queue"].join()
+
+
+def configure(fmt=None, level=None, path=None):
+    """
+    Ajusta formato ("text"/"json"), nível mínimo e arquivo JSON lines opcional
+
+    Os valores vão também para o ambiente, herdado por processos filhos
+    (workers do runner paralelo).
+    """
+    if fmt and fmt not in FORMATS:
+        raise ValueError(f"Formato de log desconhecido: {fmt} (opções: {', '.join(FORMATS)})")
+    stop()
+    if fmt:
+        _state["format"] = fmt
+        os.environ["DAILYQUEST_LOG_FORMAT"] = fmt
+    if level:
+        _state["level"] = _level(level)
+        os.environ["DAILYQUEST_LOG_LEVEL"] = level.upper()
+    if path:
+        _state["path"] = path
+        os.environ["DAILYQUEST_LOG_FILE"] = path
+
+
+def set_context(**fields):
+    """Define worker e/ou cenário dos próximos registros do processo"""
+    _context.update(fields)
+
+
+def enter_step(index, action):
+    """Marca o início de um passo na thread atual; retorna o token para leave_step"""
+    return _step.set((index, action))
+
+
+def leave_step(token):
+    _step.reset(token)
+
+
+def emit(action, detail="", level=logging.INFO):
+    """Enfileira o registro; fora de um passo, espera ele ser gravado"""
+    if level < _state["level"]:
+        return
+    if _pipeline["listener"] is None:
+        start()
+    step = _step.get()
+    _pipeline["queue"].put_nowait((time.time(), level, action, detail, _context["worker"], _context["scenario"], step))
+    if step is None:
+        flush()
+
+
+def report(line=""):
+    """Linha de tabela de relatório: stdout em texto, stderr no formato JSON"""
+    flush()
+    print(line, file=sys.stderr if _state["format"] == "json" else sys.stdout, flush=True)
+
+
+def _after_fork():
+    # A thread de escrita não existe no processo filho: recria a fila na primeira chamada
+    _pipeline["listener"] = None
+    _pipeline["queue"] = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+atexit.register(stop)
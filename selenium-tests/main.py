@@ -3,286 +3,470 @@
 Script principal - Demonstração automatizada DailyQuest
 Baseado na arquitetura modular com ações e cenários JSON
 """
+import argparse
 import json
+import logging
 import sys
 import time
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import os
-from pathlib import Path
 
 # Adiciona diretório atual ao path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import BASE_URL, DEFAULT_TIMEOUT, DEFAULT_DELAY, CHROME_OPTIONS
+from config import BASE_URL, DEFAULT_TIMEOUT, DEFAULT_DELAY, WAIT_STRATEGY, DRIVER_OFFLINE
+from config import BENCHMARK_THRESHOLD, LOAD_DURATION, MOCK_LATENCY_MS, BROWSER_PROFILES, DEFAULT_PROFILE, STRESS_SIZES
+from config import NETWORK_PROFILES, LOG_FORMAT, LOG_LEVEL
 from utils import wait, log_action
-
-# Importa módulos de ações
-from actions import auth, dashboard, tasks, achievements, profile
-from actions import habits
+import artifacts
+import driver_cache
+import engine
+import flaky
+import locators
+import log_pipeline
+import profiles
+import quiescence
+import scenario_stream
+import steps  # noqa: F401 - registra as ações do cenário no motor de passos
+import tracing
+import vitals
+import waterfall
 
 
-def setup_driver():
-    """Configura e retorna driver do Chrome"""
-    log_action("Configurando Chrome WebDriver")
+def setup_driver(headless=False, offline=DRIVER_OFFLINE, profile=DEFAULT_PROFILE, performance_log=False,
+                 console_log=False, driver_path=None, install_quiescence=True):
+    """
+    Configura e retorna driver do Chrome
+    
+    profile é o nome do perfil de navegador (config.BROWSER_PROFILES); o
+    driver guarda a configuração em driver.profile. performance_log habilita
+    o log de performance do chromedriver (eventos Network.*, usado por
+    waterfall.py) e console_log guarda todo o console do navegador
+    (artifacts.py). driver_path é um chromedriver já resolvido (o runner
+    paralelo resolve uma vez no processo pai). install_quiescence=False não
+    torna o driver alvo das esperas por quiescência (drivers auxiliares, como
+    o da pista de quarentena). Os tempos de inicialização por fase ficam em
+    driver.startup_timings.
+    """
+    log_action("Configurando Chrome WebDriver", f"perfil {profile}")
     
+    settings = profiles.get(profile)
     options = webdriver.ChromeOptions()
-    for option in CHROME_OPTIONS:
+    for option in profiles.chrome_arguments(settings, headless):
         options.add_argument(option)
-    # webdriver-manager may return a path that is not the actual executable (e.g. a NOTICE file)
-    install_path = ChromeDriverManager().install()
-    driver_path = Path(install_path)
-    
-    log_action(f"webdriver-manager returned: {install_path}")
-    
-    # Check if the returned file is actually the chromedriver binary
-    is_valid_binary = (
-        driver_path.is_file() and 
-        driver_path.name == 'chromedriver' and 
-        os.access(str(driver_path), os.X_OK)
-    )
-    
-    if not is_valid_binary:
-        log_action(f"Returned path is not the chromedriver binary (is_file={driver_path.is_file()}, name={driver_path.name})")
-        log_action("Searching for actual chromedriver binary...")
-        
-        # Search in the same directory for the actual chromedriver
-        search_dir = driver_path.parent if driver_path.is_file() else driver_path
-        log_action(f"Searching in: {search_dir}")
-        
-        exec_candidate = None
-        # List all files in the directory for debugging
-        try:
-            files = list(search_dir.iterdir())
-            log_action(f"Files in directory: {[f.name for f in files]}")
-        except Exception as e:
-            log_action(f"Could not list directory: {e}")
-        
-        # Look for files named exactly 'chromedriver' (no extension)
-        for candidate in search_dir.iterdir():
-            if candidate.name == 'chromedriver' and candidate.is_file():
-                log_action(f"Found candidate: {candidate}, executable={os.access(str(candidate), os.X_OK)}")
-                # Try to make it executable if not already
-                try:
-                    if not os.access(str(candidate), os.X_OK):
-                        log_action(f"Making {candidate} executable...")
-                        os.chmod(str(candidate), 0o755)
-                    exec_candidate = candidate
-                    log_action(f"✓ Using chromedriver at: {candidate}")
-                    break
-                except Exception as e:
-                    log_action(f"Could not use {candidate}: {e}")
-        
-        if exec_candidate:
-            final_path = str(exec_candidate)
-        else:
-            log_action("ERROR: Could not find chromedriver binary!")
-            final_path = str(driver_path)  # Will fail, but with clear error
-    else:
-        final_path = str(driver_path)
+    logging_prefs = {}
+    if performance_log:
+        logging_prefs["performance"] = "ALL"
+    if console_log:
+        logging_prefs["browser"] = "ALL"
+    if logging_prefs:
+        options.set_capability("goog:loggingPrefs", logging_prefs)
+    started = time.perf_counter()
+    final_path = driver_path or driver_cache.resolve_driver(offline=offline)
+    resolved = time.perf_counter()
     
     log_action(f"Final path: {final_path}")
     service = Service(final_path)
     driver = webdriver.Chrome(service=service, options=options)
     driver.implicitly_wait(DEFAULT_TIMEOUT)
+    tracing.instrument_driver(driver)
+    profiles.install(driver, settings)
+    driver.profile = settings
+    driver.startup_timings = {
+        "resolve": resolved - started,
+        "spawn": time.perf_counter() - resolved,
+    }
+    
+    if WAIT_STRATEGY == "quiescence" and install_quiescence:
+        quiescence.install(driver)
     
     log_action("Chrome iniciado com sucesso")
     return driver
 
 
-def load_scenarios():
-    """Carrega cenários do arquivo JSON"""
-    scenarios_path = Path(__file__).parent / "data" / "scenarios.json"
+def navigate_first(driver, url=BASE_URL):
+    """Primeira navegação do driver, registrando o tempo e o resumo de inicialização"""
+    started = time.perf_counter()
+    driver.get(url)
+    timings = getattr(driver, "startup_timings", {})
+    timings["first_navigation"] = time.perf_counter() - started
+    log_action(
+        "Inicialização",
+        " | ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+    )
+
+
+def load_scenarios(path=None):
+    """
+    Carrega cenários do arquivo JSON
+    
+    Arquivos .jsonl (scenario_generator.py) têm um cenário por usuário; o
+    runner de UI usa o primeiro. Arquivos no formato de streaming
+    (scenario_stream.py) são materializados por inteiro.
+    """
+    scenarios_path = Path(path) if path else Path(__file__).parent / "data" / "scenarios.json"
     
     log_action("Carregando cenários", str(scenarios_path))
     
-    with open(scenarios_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if scenario_stream.is_stream(scenarios_path):
+        data = scenario_stream.load(scenarios_path)
+    elif scenarios_path.suffix == ".jsonl":
+        from scenario_generator import iter_scenarios
+        data = next(iter_scenarios(scenarios_path))
+    else:
+        with open(scenarios_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     log_action("Cenários carregados com sucesso")
     return data
 
 
-def execute_test_flow(driver, scenarios):
-    """Executa fluxo de testes baseado nos cenários"""
-    user_data = scenarios["user"]
-    flow = scenarios["test_flow"]["steps"]
+def execute_test_flow(driver, scenarios, flow=None, user=None, start_index=1, counters=None, hooks=(), lane=None):
+    """
+    Executa fluxo de testes baseado nos cenários
+    
+    O fluxo é compilado em um plano (engine.compile_plan) e executado pelo
+    motor de passos. flow/user/start_index/counters permitem executar apenas
+    um segmento do fluxo (usado pelo runner paralelo; counters indica quantos
+    hábitos/afazeres do cenário já foram consumidos). hooks são objetos com
+    before_step e after_step(driver, result), chamados em volta de cada passo.
+    lane (flaky.QuarantineLane) executa em paralelo os passos em quarentena.
+    Retorna lista com o resultado de cada passo.
+    """
+    flow = flow if flow is not None else scenarios["test_flow"]["steps"]
+    plan = engine.compile_plan(scenarios, flow, start_index, counters)
     
     log_action("========================================")
     log_action("INICIANDO DEMONSTRAÇÃO DAILYQUEST")
     log_action("========================================")
     wait(0.3)
     
-    # Contadores para criar múltiplos items
-    habit_counter = 0
-    task_counter = 0
+    results = engine.run_plan(
+        driver, plan, scenarios, user or scenarios["user"],
+        total=len(scenarios["test_flow"]["steps"]), hooks=hooks, lane=lane
+    )
     
-    for idx, step in enumerate(flow, 1):
-        action = step["action"]
-        description = step["description"]
-        
-        log_action("========================================")
-        log_action(f"PASSO {idx}/{len(flow)}: {description}")
-        log_action("========================================")
-        
-        try:
-            if action == "login":
-                auth.login(driver, user_data["username"], user_data["password"])
-            
-            elif action == "verify_dashboard":
-                dashboard.verify_dashboard_elements(driver)
-            
-            elif action == "scroll_dashboard" or action == "final_scroll":
-                dashboard.scroll_dashboard(driver)
-            
-            elif action == "open_achievements":
-                achievements.open_achievements_modal(driver)
+    log_action("========================================")
+    log_action("DEMONSTRAÇÃO CONCLUÍDA")
+    log_action("========================================")
+    return results
 
-            elif action == "create_habit":
-                # Cria um hábito a partir do próximo habit do cenário
-                habits_list = scenarios.get("habits", [])
-                if habit_counter < len(habits_list):
-                    habit = habits_list[habit_counter]
-                    habits.create_habit(driver, habit.get("name", f"Hábito Demo {habit_counter+1}"), habit.get("description", ""))
-                    habit_counter += 1
-                else:
-                    # Se não tiver mais hábitos definidos, cria um genérico
-                    habits.create_habit(driver, f"Hábito Demo {habit_counter+1}", "Descrição padrão")
-                    habit_counter += 1
 
-            elif action == "create_habit_specific_days":
-                # Cria um hábito com dias específicos da semana
-                days = step.get("days", [1, 3, 5])  # Default: Seg, Qua, Sex
-                habits_list = scenarios.get("habits", [])
-                
-                # Procura o próximo hábito com frequência SPECIFIC_DAYS
-                habit_data = None
-                for h in habits_list[habit_counter:]:
-                    if h.get("frequency") == "SPECIFIC_DAYS":
-                        habit_data = h
-                        break
-                
-                if habit_data:
-                    habits.create_habit_with_specific_days(
-                        driver, 
-                        habit_data.get("name", f"Hábito Dias Específicos {habit_counter+1}"),
-                        habit_data.get("description", ""),
-                        habit_data.get("difficulty", "medium"),
-                        habit_data.get("days", days)
-                    )
-                else:
-                    habits.create_habit_with_specific_days(
-                        driver,
-                        f"Hábito Dias Específicos {habit_counter+1}",
-                        "Hábito com dias específicos",
-                        "medium",
-                        days
-                    )
-                habit_counter += 1
+def driver_logs(args):
+    """Logs do chromedriver exigidos pelos hooks: performance (waterfall, HAR) e console (artefatos)"""
+    return {"performance_log": bool(args.waterfall or args.artifacts), "console_log": bool(args.artifacts)}
 
-            elif action == "manage_tags":
-                # Demonstra CRUD completo de tags
-                habits.manage_tags_full_crud(driver)
 
-            elif action == "create_todo":
-                # Cria um afazer (todo) usando o próximo task do cenário
-                tasks_list = scenarios.get("tasks", [])
-                if task_counter < len(tasks_list):
-                    task = tasks_list[task_counter]
-                    habits.create_todo(driver, task.get("title", f"Afazer Demo {task_counter+1}"), task.get("description", ""))
-                    task_counter += 1
-                else:
-                    # Se não tiver mais tasks definidas, cria uma genérica
-                    habits.create_todo(driver, f"Afazer Demo {task_counter+1}", "Descrição padrão")
-                    task_counter += 1
-            
-            elif action == "complete_habit":
-                habits.complete_first_habit(driver)
-            
-            elif action == "complete_2_habits":
-                habits.complete_multiple_habits(driver, 2)
-            
-            elif action == "uncomplete_habit":
-                habits.uncomplete_first_habit(driver)
-            
-            elif action == "switch_to_todos":
-                habits.switch_to_todos_tab(driver)
-            
-            elif action == "use_filter":
-                filter_name = step.get("filter_name", "Todas")
-                habits.use_filter(driver, filter_name)
-            
-            elif action == "scroll_achievements":
-                achievements.scroll_achievements(driver)
-            
-            elif action == "close_achievements":
-                achievements.close_achievements_modal(driver)
-            
-            elif action == "open_profile":
-                profile.open_profile_modal(driver)
-            
-            elif action == "close_profile":
-                profile.close_profile_modal(driver)
-            
-            elif action == "view_profile":
-                profile.verify_user_stats(driver)
-            
-            elif action == "calendar_next":
-                profile.navigate_calendar_next(driver)
-            
-            elif action == "calendar_previous":
-                profile.navigate_calendar_previous(driver)
-            
-            elif action == "edit_character":
-                # Edita o avatar/personagem do usuário
-                avatar_index = step.get("avatar_index", None)
-                profile.edit_character(driver, avatar_index)
-            
-            else:
-                log_action(f"Ação não implementada: {action}")
-            
-            wait(0.2)
-            
-        except Exception as e:
-            log_action(f"Erro no passo {idx}: {str(e)[:100]}")
-            wait(0.3)
-    
-    log_action("========================================")
-    log_action("DEMONSTRAÇÃO CONCLUÍDA")
-    log_action("========================================")
+def run_stream(args, hooks=()):
+    """Executa um cenário em streaming (scenario_stream.py) enquanto o arquivo é lido"""
+    driver = setup_driver(offline=args.offline, profile=args.profile, **driver_logs(args))
+    try:
+        navigate_first(driver)
+        started = time.perf_counter()
+        summary = scenario_stream.execute(driver, args.scenarios, hooks=hooks)
+        elapsed = time.perf_counter() - started
+        profiles.print_speedup(driver.profile, elapsed)
+        profiles.record_run(driver.profile, elapsed, summary["steps"], summary["error"])
+    finally:
+        log_action("Fechando navegador")
+        driver.quit()
+    return 0 if not summary["error"] else 1
+
+
+def quarantine_lane(args):
+    """Pista paralela para as ações em quarentena pelo histórico de flakiness (None se não houver)"""
+    actions = flaky.quarantined()
+    if not actions:
+        log_action("Nenhuma ação em quarentena", "pista paralela não iniciada")
+        return None
+
+    def open_driver():
+        # Sem quiescência: as esperas do fluxo principal continuam no driver dele
+        driver = setup_driver(headless=True, offline=args.offline, profile=args.profile, install_quiescence=False)
+        navigate_first(driver)
+        return driver
+
+    return flaky.QuarantineLane(actions, open_driver)
 
 
-def main():
+def run_async_checks(driver):
+    """Verificações independentes (dashboard, conquistas, perfil) em abas paralelas do mesmo Chrome"""
+    import cdp_async
+    from actions import dashboard, achievements, profile
+    return cdp_async.run_concurrently(driver, {
+        "verify_dashboard": dashboard.verify_dashboard_elements_async,
+        "count_achievements": achievements.count_achievements_async,
+        "open_profile": profile.open_profile_modal_async,
+    })
+
+
+def parse_args(argv=None):
+    """Lê argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(description="Demonstração automatizada DailyQuest")
+    parser.add_argument(
+        "--scenarios", metavar="FILE",
+        help="Arquivo de cenários (padrão: data/scenarios.json; .jsonl gerado por scenario_generator.py "
+             "ou no formato de streaming de scenario_stream.py, executado enquanto é lido)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Número de workers Chrome headless (>1 ativa o runner paralelo)"
+    )
+    parser.add_argument(
+        "--profile", choices=sorted(BROWSER_PROFILES), default=DEFAULT_PROFILE,
+        help="Perfil de navegador: demo (apresentação) ou throughput (headless, sem imagens/animações/pausas)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, metavar="N",
+        help="Executa o fluxo N vezes seguidas no mesmo Chrome, com reset de contexto entre os runs"
+    )
+    parser.add_argument(
+        "--offline", action="store_true", default=DRIVER_OFFLINE,
+        help="Não usa webdriver-manager (apenas chromedriver em cache ou no PATH)"
+    )
+    parser.add_argument(
+        "--trace", metavar="DIR",
+        help="Grava trace por passo (trace.json e trace.chrome.json) no diretório"
+    )
+    parser.add_argument(
+        "--benchmark", type=int, metavar="K",
+        help="Executa o fluxo K vezes, grava p50/p95/p99 por ação e compara com o histórico"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=BENCHMARK_THRESHOLD,
+        help="Aumento relativo do p95 considerado regressão no benchmark (padrão: 0.20)"
+    )
+    parser.add_argument(
+        "--load", type=int, metavar="USERS",
+        help="Modo de carga HTTP: USERS usuários virtuais executando o cenário direto na API (sem navegador)"
+    )
+    parser.add_argument(
+        "--duration", type=int, default=LOAD_DURATION,
+        help="Duração da carga em segundos (padrão: 60)"
+    )
+    parser.add_argument(
+        "--mock", action="store_true",
+        help="Sobe o backend simulado em processo (mock_backend.py) nas portas da API e do auth"
+    )
+    parser.add_argument(
+        "--mock-latency", type=int, default=MOCK_LATENCY_MS, metavar="MS",
+        help="Latência injetada em cada resposta do backend simulado (ms)"
+    )
+    parser.add_argument(
+        "--locators", action="store_true",
+        help="Imprime tempo de resolução por locator, sondagem das estratégias e seletores CSS sugeridos"
+    )
+    parser.add_argument(
+        "--async-checks", action="store_true",
+        help="Após o fluxo, executa verificações somente leitura em paralelo em abas via CDP assíncrono"
+    )
+    parser.add_argument(
+        "--stress", type=lambda value: [int(n) for n in value.split(",")], nargs="?", const=STRESS_SIZES,
+        metavar="N1,N2,...",
+        help="Teste de escala do DOM: mede as views com N hábitos/afazeres (padrão: 10,100,1000,10000)"
+    )
+    parser.add_argument(
+        "--network-matrix", type=lambda value: value.split(","), nargs="?", const=list(NETWORK_PROFILES),
+        metavar="PERFIS",
+        help="Executa o fluxo sob cada condição de rede/CPU (padrão: baseline,3g,4g,high_latency,cpu_4x)"
+    )
+    parser.add_argument(
+        "--waterfall", metavar="FILE",
+        help="Registra as requisições de cada passo, sinaliza chamadas repetidas à API e grava o waterfall em FILE"
+    )
+    parser.add_argument(
+        "--vitals", metavar="FILE",
+        help="Coleta Web Vitals, Navigation/Resource Timing e heap JS por passo e grava em FILE (JSON)"
+    )
+    parser.add_argument(
+        "--quarantine", action="store_true",
+        help="Executa as ações instáveis pelo histórico (benchmarks/flakes.jsonl) em um Chrome headless paralelo"
+    )
+    parser.add_argument(
+        "--artifacts", metavar="DIR",
+        help="Em cada passo com erro grava screenshot, DOM, console, HAR e traceback em DIR (em segundo plano)"
+    )
+    parser.add_argument(
+        "--log-format", choices=log_pipeline.FORMATS, default=LOG_FORMAT,
+        help="Saída dos logs no terminal: text ([HH:MM:SS] ação: detalhe) ou json (um objeto por linha)"
+    )
+    parser.add_argument(
+        "--log-level", default=LOG_LEVEL, type=str.upper, choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Nível mínimo dos logs (DEBUG inclui os caminhos alternativos das ações)"
+    )
+    parser.add_argument(
+        "--log-file", metavar="FILE",
+        help="Grava também todos os logs em FILE (JSON lines, com worker, cenário e passo)"
+    )
+    parser.set_defaults(backend=None)
+    args = parser.parse_args(argv)
+    # Esses modos não executam os hooks de passo no navegador (os workers só o tracer)
+    if not (args.benchmark or args.network_matrix):
+        if (args.waterfall or args.artifacts or args.vitals) and (args.stress or args.load or args.workers > 1):
+            parser.error("--waterfall, --artifacts e --vitals não são suportados com --stress, --load ou --workers")
+        if args.trace and (args.stress or args.load):
+            parser.error("--trace não é suportado com --stress ou --load")
+    return args
+
+
+def main(argv=None):
     """Função principal"""
+    args = parse_args(argv)
+    log_pipeline.configure(args.log_format, args.log_level, args.log_file)
+    if args.mock:
+        import mock_backend
+        with mock_backend.MockBackend(latency_ms=args.mock_latency) as backend:
+            args.backend = backend
+            if scenario_stream.is_stream(args.scenarios):
+                backend.add_user(scenario_stream.read_header(args.scenarios)["user"])
+            elif args.scenarios and args.scenarios.endswith(".jsonl"):
+                from scenario_generator import iter_scenarios
+                backend.load_scenarios(iter_scenarios(args.scenarios))
+            else:
+                backend.add_user(load_scenarios(args.scenarios)["user"])
+            return run(args)
+    return run(args)
+
+
+def run(args):
+    """Executa o modo selecionado pelos argumentos"""
+    hooks = []
+    if args.trace:
+        tracing.enable()
+        hooks.append(tracing.tracer)
+    metrics = None
+    if args.vitals:
+        metrics = vitals.VitalsHook()
+        hooks.append(metrics)
+    network = None
+    if args.waterfall:
+        network = waterfall.WaterfallHook()
+        hooks.append(network)
+    # Depois do waterfall: usa a rede já anexada ao resultado do passo
+    artifact_hook = artifacts.ArtifactHook(args.artifacts) if args.artifacts else None
+    if artifact_hook:
+        hooks.append(artifact_hook)
+    try:
+        return run_mode(args, hooks)
+    finally:
+        if artifact_hook:
+            artifact_hook.close()
+        # Vale para todos os modos com hooks (fluxo, streaming, --benchmark, --network-matrix e --repeat);
+        # com --workers cada worker grava o próprio trace
+        if args.trace and tracing.tracer.steps:
+            tracing.print_summary()
+            log_action("Trace gravado", str(tracing.tracer.write(args.trace)))
+        if metrics and metrics.results:
+            vitals.print_summary(metrics.results)
+            log_action("Web Vitals gravados", vitals.write(metrics.results, args.vitals))
+        if network and network.results:
+            waterfall.print_summary(network.results)
+            log_action("Waterfall de rede gravado", waterfall.write(network.results, args.waterfall))
+
+
+def run_mode(args, hooks):
+    """Executa o modo selecionado com os hooks de passo já montados"""
+    if args.benchmark:
+        import benchmark
+        return benchmark.run_benchmark(
+            load_scenarios(args.scenarios), args.benchmark, threshold=args.threshold, offline=args.offline,
+            hooks=hooks, profile=args.profile, **driver_logs(args)
+        )
+    
+    if args.network_matrix:
+        import throttling
+        return throttling.run(
+            load_scenarios(args.scenarios), args.network_matrix, offline=args.offline, profile=args.profile,
+            hooks=hooks, **driver_logs(args)
+        )
+    
+    if args.stress:
+        import stress
+        return stress.run(
+            load_scenarios(args.scenarios), args.stress, backend=args.backend, offline=args.offline,
+            profile=args.profile
+        )
+    
+    if args.load:
+        import loadtest
+        return loadtest.run(load_scenarios(args.scenarios), users=args.load, duration=args.duration)
+    
+    if args.workers > 1:
+        import parallel
+        scenarios = load_scenarios(args.scenarios)
+        results = parallel.run_parallel(
+            scenarios, args.workers, offline=args.offline, trace_dir=args.trace, profile=args.profile
+        )
+        return 0 if all(r["status"] != "error" for r in results) else 1
+    
+    if args.repeat > 1:
+        import driver_pool
+        with driver_pool.DriverPool(offline=args.offline, profile=args.profile, **driver_logs(args)) as pool:
+            results = driver_pool.run_repeated(load_scenarios(args.scenarios), args.repeat, pool, hooks=hooks)
+        flaky.record(results)
+        flaky.print_report(results)
+        return 0 if all(r["status"] != "error" for r in results) else 1
+    
+    if scenario_stream.is_stream(args.scenarios):
+        return run_stream(args, hooks)
+    
     driver = None
     
     try:
         # Setup
-        driver = setup_driver()
-        scenarios = load_scenarios()
+        driver = setup_driver(offline=args.offline, profile=args.profile, **driver_logs(args))
+        scenarios = load_scenarios(args.scenarios)
         
         # Navega para aplicação
         log_action("Navegando para DailyQuest", BASE_URL)
-        driver.get(BASE_URL)
+        navigate_first(driver)
         wait(DEFAULT_DELAY)
         
         # Executa fluxo de testes
-        execute_test_flow(driver, scenarios)
+        started = time.perf_counter()
+        lane = quarantine_lane(args) if args.quarantine else None
+        results = execute_test_flow(driver, scenarios, hooks=hooks, lane=lane)
+        elapsed = time.perf_counter() - started
+        profiles.print_speedup(driver.profile, elapsed)
+        profiles.record_run(
+            driver.profile, elapsed, len(results), sum(1 for r in results if r["status"] == "error")
+        )
+        flaky.record(results)
+        flaky.print_report(results)
+        
+        if args.async_checks:
+            run_async_checks(driver)
+        
+        if args.locators:
+            locators.print_report()
+        
+        if quiescence.active():
+            stats = quiescence.summary()
+            log_action(
+                "Esperas por quiescência",
+                f"{stats['waits']} esperas, {stats['elapsed']:.2f}s (fixo {stats['baseline']:.2f}s, "
+                f"economia {stats['saved']:.2f}s, {stats['timeouts']} sem estabilizar)"
+            )
+        
+        # Mantém navegador aberto por alguns segundos (pausa de demonstração, não sincronização)
+        keep_alive = driver.profile["keep_alive"]
+        if keep_alive:
+            log_action(f"Mantendo navegador aberto por {keep_alive} segundos...")
+            time.sleep(keep_alive)
         
-        # Mantém navegador aberto por alguns segundos
-        log_action("Mantendo navegador aberto por 3 segundos...")
-        wait(3)
+        return 0 if all(r["status"] != "error" for r in results) else 1
         
     except KeyboardInterrupt:
         log_action("Interrompido pelo usuário")
+        return 1
     
     except Exception as e:
-        log_action("ERRO CRÍTICO", str(e))
+        log_action("ERRO CRÍTICO", str(e), logging.ERROR)
         import traceback
         traceback.print_exc()
+        return 1
     
     finally:
         if driver:
@@ -291,4 +475,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,664 @@
+"""
+Backend simulado - DailyQuest
+Servidor HTTP em processo (stdlib) que implementa os endpoints usados pelo
+frontend (lib/api-service.ts e lib/api-service-complete.ts) com estado em
+memória e latência opcional. Permite medir só o frontend e rodar vários
+workers sem disputar o mesmo banco de dados.
+"""
+import email.parser
+import json
+import random
+import re
+import secrets
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from config import API_URL, AUTH_URL, MOCK_HOST, MOCK_LATENCY_MS, MOCK_JITTER_MS
+from utils import log_action
+
+# XP por dificuldade e XP por nível (lib/api-types-complete.ts)
+DIFFICULTY_XP = {"EASY": 10, "MEDIUM": 20, "HARD": 30}
+LEVEL_XP = 100
+
+ACHIEVEMENTS = [
+    {"requirement_key": "FIRST_LOGIN", "name": "Primeiro Acesso", "description": "Fez login pela primeira vez",
+     "icon": "🎉", "category": "Geral", "rarity": "common"},
+    {"requirement_key": "FIRST_HABIT", "name": "Criador de Hábitos", "description": "Criou o primeiro hábito",
+     "icon": "🌱", "category": "Hábitos", "rarity": "common"},
+    {"requirement_key": "FIRST_TODO", "name": "Planejador", "description": "Criou o primeiro afazer",
+     "icon": "📝", "category": "Afazeres", "rarity": "common"},
+    {"requirement_key": "TASK_COMPLETE_5", "name": "Produtivo", "description": "Completou 5 tarefas",
+     "icon": "✅", "category": "Progresso", "rarity": "rare", "target": 5},
+    {"requirement_key": "LEVEL_UP", "name": "Subindo de Nível", "description": "Alcançou o nível 2",
+     "icon": "⭐", "category": "Progresso", "rarity": "epic"},
+]
+
+
+class MockError(Exception):
+    """Erro HTTP devolvido como {"detail": ...}"""
+
+    def __init__(self, status, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class MockState:
+    """Estado em memória (usuários, tokens, tarefas, tags e conclusões)"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.users = {}
+        self.passwords = {}
+        self.tokens = {}
+        self.tasks = {}
+        self.tags = {}
+        self.completions = []
+        self.unlocked = {}
+        self.catalog = [dict(a, id=str(i)) for i, a in enumerate(ACHIEVEMENTS, 1)]
+
+    # ===== Usuários =====
+
+    def register(self, body):
+        username, password = body.get("username"), body.get("password")
+        if not username or not password:
+            raise MockError(422, "username e password são obrigatórios")
+        if username in self.passwords:
+            raise MockError(400, "Username already registered")
+        user = {
+            "id": str(uuid.uuid4()), "username": username, "email": body.get("email", ""),
+            "xp": 0, "level": 1, "coins": 0, "streak": 0, "theme": "light", "created_at": _now(),
+        }
+        self.users[user["id"]] = user
+        self.passwords[username] = (password, user["id"])
+        return user
+
+    def login(self, username, password):
+        stored = self.passwords.get(username)
+        if not stored or stored[0] != password:
+            raise MockError(401, "Incorrect username or password")
+        token = secrets.token_urlsafe(24)
+        self.tokens[token] = stored[1]
+        self._unlock(stored[1], "FIRST_LOGIN")
+        return {"access_token": token, "token_type": "bearer"}
+
+    def authenticate(self, header):
+        token = (header or "").removeprefix("Bearer ").strip()
+        user_id = self.tokens.get(token)
+        if user_id is None:
+            raise MockError(401, "Could not validate credentials")
+        return self.users[user_id]
+
+    def _unlock(self, user_id, key):
+        unlocked = self.unlocked.setdefault(user_id, {})
+        if key not in unlocked:
+            unlocked[key] = _now()
+
+    def import_scenario(self, scenario):
+        """
+        Carrega usuário, tags, hábitos, afazeres, histórico e conquistas de um cenário
+
+        Diferente da API, aceita conclusões com data passada ("history" dos
+        cenários gerados por scenario_generator.py) e conquistas fora do
+        catálogo padrão ("achievements", desbloqueadas para o usuário).
+        """
+        try:
+            user = self.register(scenario["user"])
+        except MockError:
+            user = self.users[self.passwords[scenario["user"]["username"]][1]]
+        tag_ids = {t["name"]: self.create_tag(user, t)["id"] for t in scenario.get("tags", [])}
+        habits = []
+        for habit in scenario.get("habits", []):
+            habits.append(self.create_task(user, {
+                "title": habit["name"], "description": habit.get("description", ""),
+                "difficulty": habit.get("difficulty", "MEDIUM"),
+                "frequency_type": habit.get("frequency", "DAILY"), "frequency_days": habit.get("days", []),
+                "tag_ids": [tag_ids[n] for n in habit.get("tags", []) if n in tag_ids],
+            }, "habit"))
+        for task in scenario.get("tasks", []):
+            self.create_task(user, {
+                "title": task["title"], "description": task.get("description", ""),
+                "difficulty": task.get("difficulty", "MEDIUM"), "deadline": task.get("deadline"),
+                "tag_ids": [tag_ids[n] for n in task.get("tags", []) if n in tag_ids],
+            }, "todo")
+
+        today = datetime.now().date().isoformat()
+        for entry in scenario.get("history", []):
+            task = habits[entry["habit"]]
+            xp = DIFFICULTY_XP.get(task["difficulty"], 20)
+            self.completions.append({
+                "id": str(uuid.uuid4()), "task_id": task["id"], "user_id": user["id"],
+                "completed_at": f"{entry['date']}T12:00:00", "completed_date": entry["date"], "xp_earned": xp,
+            })
+            user["xp"] += xp
+            user["coins"] += xp // 2
+            task["last_completed_at"] = f"{entry['date']}T12:00:00"
+            task["completed"] = entry["date"] == today
+        user["level"] = 1 + user["xp"] // LEVEL_XP
+
+        keys = {a["requirement_key"] for a in self.catalog}
+        for achievement in scenario.get("achievements", []):
+            if achievement["requirement_key"] not in keys:
+                self.catalog.append(dict(achievement, id=str(len(self.catalog) + 1)))
+                keys.add(achievement["requirement_key"])
+            self._unlock(user["id"], achievement["requirement_key"])
+        return user
+
+    # ===== Tarefas =====
+
+    def owned_task(self, user, task_id):
+        task = self.tasks.get(task_id)
+        if not task or task["user_id"] != user["id"]:
+            raise MockError(404, "Task not found")
+        return task
+
+    def create_task(self, user, body, task_type=None):
+        task_type = task_type or body.get("task_type", "todo")
+        if not body.get("title"):
+            raise MockError(422, "title é obrigatório")
+        task = {
+            "id": str(uuid.uuid4()), "user_id": user["id"], "task_type": task_type,
+            "title": body["title"], "description": body.get("description", ""),
+            "difficulty": str(body.get("difficulty", "MEDIUM")).upper(),
+            "completed": False, "created_at": _now(), "tags": [],
+        }
+        if task_type == "habit":
+            task.update({
+                "frequency_type": body.get("frequency_type", "DAILY"),
+                "frequency_days": body.get("frequency_days", []),
+                "frequency_target_times": body.get("frequency_target_times"),
+                "current_streak": 0, "best_streak": 0, "last_completed_at": None,
+            })
+            self._unlock(user["id"], "FIRST_HABIT")
+        else:
+            task.update({"deadline": body.get("deadline"), "completed_at": None})
+            self._unlock(user["id"], "FIRST_TODO")
+        self.tasks[task["id"]] = task
+        for tag_id in body.get("tag_ids") or []:
+            self.associate(user, task["id"], tag_id)
+        return task
+
+    def update_task(self, user, task_id, body):
+        task = self.owned_task(user, task_id)
+        for field in ("title", "description", "frequency_type", "frequency_days",
+                      "frequency_target_times", "deadline"):
+            if field in body:
+                task[field] = body[field]
+        if "difficulty" in body:
+            task["difficulty"] = str(body["difficulty"]).upper()
+        if "tag_ids" in body:
+            task["tags"] = []
+            for tag_id in body["tag_ids"] or []:
+                self.associate(user, task_id, tag_id)
+        task["updated_at"] = _now()
+        return task
+
+    def delete_task(self, user, task_id):
+        self.owned_task(user, task_id)
+        del self.tasks[task_id]
+
+    def complete(self, user, task_id):
+        task = self.owned_task(user, task_id)
+        today = datetime.now().date().isoformat()
+        if task["completed"] and (task.get("last_completed_at") or task.get("completed_at") or "")[:10] == today:
+            raise MockError(400, "Task already completed today")
+
+        xp = DIFFICULTY_XP.get(task["difficulty"], 20)
+        previous_level = user["level"]
+        user["xp"] += xp
+        user["coins"] += xp // 2
+        user["level"] = 1 + user["xp"] // LEVEL_XP
+        task["completed"] = True
+        completion = {
+            "id": str(uuid.uuid4()), "task_id": task_id, "user_id": user["id"],
+            "completed_at": _now(), "completed_date": today, "xp_earned": xp,
+        }
+        self.completions.append(completion)
+
+        response = {"message": "Task completed", "user": user, "task_completion": completion,
+                    "level_up": user["level"] > previous_level, "previous_level": previous_level}
+        if task["task_type"] == "habit":
+            task["current_streak"] += 1
+            task["best_streak"] = max(task["best_streak"], task["current_streak"])
+            task["last_completed_at"] = completion["completed_at"]
+            user["streak"] = max(user["streak"], task["current_streak"])
+            response["streak_info"] = {k: task[k] for k in ("current_streak", "best_streak", "last_completed_at")}
+        else:
+            task["completed_at"] = completion["completed_at"]
+
+        if sum(1 for c in self.completions if c["user_id"] == user["id"]) >= 5:
+            self._unlock(user["id"], "TASK_COMPLETE_5")
+        if response["level_up"]:
+            self._unlock(user["id"], "LEVEL_UP")
+        return response
+
+    def uncomplete(self, user, task_id):
+        task = self.owned_task(user, task_id)
+        today = datetime.now().date().isoformat()
+        for completion in reversed(self.completions):
+            if completion["task_id"] == task_id and completion["completed_date"] == today:
+                self.completions.remove(completion)
+                break
+        else:
+            raise MockError(400, "Task not completed today")
+        xp = completion["xp_earned"]
+        user["xp"] = max(user["xp"] - xp, 0)
+        user["coins"] = max(user["coins"] - xp // 2, 0)
+        user["level"] = 1 + user["xp"] // LEVEL_XP
+        task["completed"] = False
+        if task["task_type"] == "habit":
+            task["current_streak"] = max(task["current_streak"] - 1, 0)
+            task["last_completed_at"] = None
+        else:
+            task["completed_at"] = None
+        return {"message": "Completion removed", "xp_removed": xp}
+
+    # ===== Tags =====
+
+    def owned_tag(self, user, tag_id):
+        tag = self.tags.get(tag_id)
+        if not tag or tag["user_id"] != user["id"]:
+            raise MockError(404, "Tag not found")
+        return tag
+
+    def create_tag(self, user, body):
+        if not body.get("name"):
+            raise MockError(422, "name é obrigatório")
+        tag = {"id": str(uuid.uuid4()), "user_id": user["id"], "name": body["name"],
+               "color": body.get("color", "#3b82f6"), "created_at": _now()}
+        self.tags[tag["id"]] = tag
+        return tag
+
+    def associate(self, user, task_id, tag_id):
+        task = self.owned_task(user, task_id)
+        tag = self.owned_tag(user, tag_id)
+        if all(t["id"] != tag_id for t in task["tags"]):
+            task["tags"].append(tag)
+        return task
+
+    def dissociate(self, user, task_id, tag_id):
+        task = self.owned_task(user, task_id)
+        task["tags"] = [t for t in task["tags"] if t["id"] != tag_id]
+        return task
+
+    def delete_tag(self, user, tag_id):
+        self.owned_tag(user, tag_id)
+        del self.tags[tag_id]
+        for task in self.tasks.values():
+            task["tags"] = [t for t in task["tags"] if t["id"] != tag_id]
+
+    # ===== Dashboard e conquistas =====
+
+    def user_completions(self, user, days=None):
+        since = (datetime.now().date() - timedelta(days=days)).isoformat() if days else ""
+        return [c for c in self.completions if c["user_id"] == user["id"] and c["completed_date"] >= since]
+
+    def stats(self, user):
+        today = datetime.now().date()
+        completions = self.user_completions(user)
+        def since(days):
+            start = (today - timedelta(days=days)).isoformat()
+            return sum(1 for c in completions if c["completed_date"] > start)
+        return {
+            "total_xp": user["xp"], "current_level": user["level"],
+            "total_tasks_completed": len(completions), "current_streak": user["streak"],
+            "tasks_completed_today": since(1), "tasks_completed_this_week": since(7),
+            "tasks_completed_this_month": since(30),
+        }
+
+    def weekly_progress(self, user):
+        today = datetime.now().date()
+        completions = self.user_completions(user, 7)
+        return [
+            {"date": day, "tasks_completed": sum(1 for c in completions if c["completed_date"] == day)}
+            for day in ((today - timedelta(days=offset)).isoformat() for offset in range(6, -1, -1))
+        ]
+
+    def user_achievements(self, user):
+        unlocked = self.unlocked.get(user["id"], {})
+        return [
+            {"unlocked_at": unlocked[a["requirement_key"]], "achievement": a}
+            for a in self.catalog if a["requirement_key"] in unlocked
+        ]
+
+
+# Rotas: (método, regex do caminho sem /api/v1 e sem barra final, handler, requer login)
+ROUTES = []
+
+
+def route(method, pattern, auth=True):
+    def decorator(func):
+        ROUTES.append((method, re.compile(f"^{pattern}$"), func, auth))
+        return func
+    return decorator
+
+
+@route("GET", "/health", auth=False)
+def _health(state, request):
+    return {"status": "ok"}
+
+
+@route("POST", "/users", auth=False)
+def _register(state, request):
+    return 201, state.register(request.json())
+
+
+@route("POST", "/login", auth=False)
+def _login(state, request):
+    form = request.form()
+    return state.login(form.get("username"), form.get("password"))
+
+
+@route("GET", "/(?:login|users)/me")
+def _me(state, request):
+    return request.user
+
+
+@route("PUT", "/users/me")
+def _update_me(state, request):
+    body = request.json()
+    for field in ("email", "theme", "avatar_url"):
+        if field in body:
+            request.user[field] = body[field]
+    return request.user
+
+
+@route("GET", "/tasks")
+def _list_tasks(state, request):
+    task_type = request.query.get("type")
+    return [
+        t for t in state.tasks.values()
+        if t["user_id"] == request.user["id"] and (not task_type or t["task_type"] == task_type)
+    ]
+
+
+@route("POST", "/tasks")
+def _create_task(state, request):
+    return 201, state.create_task(request.user, request.json())
+
+
+@route("POST", "/tasks/(habits|todos)")
+def _create_typed_task(state, request, kind):
+    return 201, state.create_task(request.user, request.json(), kind[:-1])
+
+
+@route("GET", "/tasks/by-tag/([\\w-]+)")
+def _tasks_by_tag(state, request, tag_id):
+    state.owned_tag(request.user, tag_id)
+    return [
+        t for t in state.tasks.values()
+        if t["user_id"] == request.user["id"] and any(tag["id"] == tag_id for tag in t["tags"])
+    ]
+
+
+@route("GET", "/tasks/([\\w-]+)")
+def _get_task(state, request, task_id):
+    return state.owned_task(request.user, task_id)
+
+
+@route("PUT", "/tasks(?:/habits|/todos)?/([\\w-]+)")
+def _update_task(state, request, task_id):
+    return state.update_task(request.user, task_id, request.json())
+
+
+@route("DELETE", "/tasks(?:/habits|/todos)?/([\\w-]+)")
+def _delete_task(state, request, task_id):
+    state.delete_task(request.user, task_id)
+    return 204, None
+
+
+@route("POST", "/(?:tasks/([\\w-]+)/complete|task-completions/complete/([\\w-]+))")
+def _complete(state, request, task_id, completion_task_id):
+    return state.complete(request.user, task_id or completion_task_id)
+
+
+@route("DELETE", "/tasks/([\\w-]+)/complete")
+def _uncomplete(state, request, task_id):
+    return state.uncomplete(request.user, task_id)
+
+
+@route("POST", "/tasks/([\\w-]+)/tags/([\\w-]+)")
+def _associate(state, request, task_id, tag_id):
+    return state.associate(request.user, task_id, tag_id)
+
+
+@route("DELETE", "/tasks/([\\w-]+)/tags/([\\w-]+)")
+def _dissociate(state, request, task_id, tag_id):
+    return state.dissociate(request.user, task_id, tag_id)
+
+
+@route("GET", "/tags")
+def _list_tags(state, request):
+    return [t for t in state.tags.values() if t["user_id"] == request.user["id"]]
+
+
+@route("POST", "/tags")
+def _create_tag(state, request):
+    return 201, state.create_tag(request.user, request.json())
+
+
+@route("PUT", "/tags/([\\w-]+)")
+def _update_tag(state, request, tag_id):
+    tag = state.owned_tag(request.user, tag_id)
+    body = request.json()
+    tag.update({k: body[k] for k in ("name", "color") if k in body})
+    return tag
+
+
+@route("DELETE", "/tags/([\\w-]+)")
+def _delete_tag(state, request, tag_id):
+    state.delete_tag(request.user, tag_id)
+    return 204, None
+
+
+@route("GET", "/achievements", auth=False)
+def _achievements(state, request):
+    return state.catalog
+
+
+@route("GET", "/achievements/(?:user|me)")
+def _user_achievements(state, request):
+    return state.user_achievements(request.user)
+
+
+@route("GET", "/dashboard(?:/stats)?")
+def _stats(state, request):
+    return state.stats(request.user)
+
+
+@route("GET", "/dashboard/history")
+def _history(state, request):
+    days = int(request.query.get("days", 30))
+    return state.user_completions(request.user, days)
+
+
+@route("GET", "/dashboard/weekly-progress")
+def _weekly(state, request):
+    return state.weekly_progress(request.user)
+
+
+class Request:
+    """Dados da requisição já lidos do handler"""
+
+    def __init__(self, handler, body):
+        self.headers = handler.headers
+        self.body = body
+        self.query = {k: v[-1] for k, v in parse_qs(urlsplit(handler.path).query).items()}
+        self.user = None
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"{}")
+        except ValueError:
+            raise MockError(422, "JSON inválido")
+
+    def form(self):
+        """Form urlencoded (lib/api-service.ts) ou multipart (FormData em api-service-complete.ts)"""
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/form-data"):
+            message = email.parser.BytesParser().parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + self.body
+            )
+            return {
+                part.get_param("name", header="content-disposition"): part.get_payload(decode=True).decode()
+                for part in message.get_payload()
+            }
+        return {k: v[-1] for k, v in parse_qs(self.body.decode()).items()}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Despacha para ROUTES com CORS liberado e latência injetada"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload=None):
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", self.headers.get("Origin") or "*")
+        self.send_header("Access-Control-Allow-Credentials", "true")
+        self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS")
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_OPTIONS(self):
+        self._send(204)
+
+    def _dispatch(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        request = Request(self, self.rfile.read(length) if length else b"")
+        delay = server.latency_ms + random.uniform(0, server.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+        path = urlsplit(self.path).path.removeprefix("/api/v1").rstrip("/") or "/"
+        allowed = False
+        for method, pattern, handler, needs_auth in ROUTES:
+            match = pattern.match(path)
+            if not match:
+                continue
+            allowed = True
+            if method != self.command:
+                continue
+            # Resposta serializada ainda sob o lock: o payload referencia o estado vivo
+            with server.state.lock:
+                try:
+                    if needs_auth:
+                        request.user = server.state.authenticate(self.headers.get("Authorization"))
+                    result = handler(server.state, request, *match.groups())
+                except MockError as e:
+                    return self._send(e.status, {"detail": e.detail})
+                status, payload = result if isinstance(result, tuple) else (200, result)
+                return self._send(status, payload)
+        if allowed:
+            return self._send(405, {"detail": "Method Not Allowed"})
+        self._send(404, {"detail": "Not Found"})
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+def _port(url):
+    return urlsplit(url).port or 80
+
+
+class MockServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer com fila de conexões para muitos workers/usuários simultâneos"""
+
+    # O padrão (5) recusa conexões em rajadas (ConnectionResetError, retransmissão de SYN)
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class MockBackend:
+    """
+    Sobe o mock nas portas de API_URL e AUTH_URL (estado compartilhado)
+
+    Uso: with MockBackend(latency_ms=50): ... ou start()/stop().
+    """
+
+    def __init__(self, latency_ms=MOCK_LATENCY_MS, jitter_ms=MOCK_JITTER_MS, host=MOCK_HOST,
+                 ports=None):
+        self.state = MockState()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.host = host
+        self.ports = sorted(set(ports or (_port(API_URL), _port(AUTH_URL))))
+        self.servers = []
+
+    def start(self):
+        for port in self.ports:
+            server = MockServer((self.host, port), MockHandler)
+            server.state = self.state
+            server.latency_ms = self.latency_ms
+            server.jitter_ms = self.jitter_ms
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers.append(server)
+        log_action(
+            "Backend simulado ativo",
+            f"portas {', '.join(str(p) for p in self.ports)}, latência {self.latency_ms}ms (+{self.jitter_ms}ms)"
+        )
+        return self
+
+    def add_user(self, user):
+        """Cadastra um usuário de cenário (ignora se já existir)"""
+        with self.state.lock:
+            try:
+                self.state.register(user)
+            except MockError:
+                pass
+
+    def load_scenarios(self, scenarios):
+        """Importa cenários (ex: scenario_generator.iter_scenarios) no estado do mock"""
+        count = 0
+        for scenario in scenarios:
+            with self.state.lock:
+                self.state.import_scenario(scenario)
+            count += 1
+        log_action("Cenários importados no backend simulado", f"{count} usuário(s)")
+        return count
+
+    def stop(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.servers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backend simulado DailyQuest")
+    parser.add_argument("--latency", type=int, default=MOCK_LATENCY_MS, help="Latência injetada (ms)")
+    parser.add_argument("--jitter", type=int, default=MOCK_JITTER_MS, help="Variação aleatória (ms)")
+    parser.add_argument("--scenarios", help="Cenários gerados (JSON lines) a importar na subida")
+    args = parser.parse_args()
+    backend = MockBackend(args.latency, args.jitter).start()
+    if args.scenarios:
+        from scenario_generator import iter_scenarios
+        backend.load_scenarios(iter_scenarios(args.scenarios))
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        backend.stop()
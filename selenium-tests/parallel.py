@@ -0,0 +1,277 @@
+"""
+Runner paralelo - DailyQuest
+Divide o test_flow em segmentos independentes (grupos de passos iniciados
+por um login, cortados também entre passos sem dependência entre si) e
+distribui os segmentos entre N workers Chrome headless.
+"""
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import driver_cache
+import engine
+import log_pipeline
+import seeding
+import steps  # noqa: F401 - registra as ações do cenário no motor de passos
+import tracing
+from config import PARALLEL_USER_SUFFIX, DEFAULT_PROFILE
+from utils import wait, log_action, report
+
+
+def _substantive(spec):
+    """Passo que justifica um worker: não é login nem só leitura (idempotente sem provides)"""
+    return engine.SESSION not in spec.provides and not (spec.idempotent and not spec.provides)
+
+
+def _safe_cuts(segment):
+    """
+    Posições em que o segmento pode ser cortado
+
+    Um corte antes do passo k é seguro se nenhum passo a partir de k exige
+    (requires, fora a sessão) algo que os passos anteriores fornecem: dados
+    criados antes, modal aberto, aba selecionada. O novo segmento começa com
+    um login próprio, então cada lado precisa ter ao menos um passo
+    substantivo (um corte logo depois do login deixaria um worker só logando).
+    """
+    specs = [engine.STEPS.get(step["action"]) for step in segment["steps"]]
+    if None in specs:
+        return []
+    cuts = []
+    for k in range(1, len(specs)):
+        if engine.SESSION in specs[k].provides:
+            continue
+        if not any(map(_substantive, specs[:k])) or not any(map(_substantive, specs[k:])):
+            continue
+        provided_before = set().union(*(spec.provides for spec in specs[:k]))
+        needs = set().union(*(spec.requires for spec in specs[k:])) - {engine.SESSION}
+        if not needs & provided_before:
+            cuts.append(k)
+    return cuts
+
+
+def _cut(segment, k):
+    """Divide o segmento antes do passo k; o segundo segmento faz login antes de começar"""
+    counters = dict(segment["counters"])
+    for step in segment["steps"][:k]:
+        spec = engine.STEPS.get(step["action"])
+        if spec and spec.consumes:
+            counters[spec.consumes] = counters.get(spec.consumes, 0) + 1
+    head = dict(segment, steps=segment["steps"][:k])
+    tail = {"start_index": segment["start_index"] + k, "counters": counters,
+            "steps": segment["steps"][k:], "login": True}
+    return head, tail
+
+
+def split_segments(flow, workers=1):
+    """
+    Divide os passos em segmentos com escopo de login
+
+    Cada segmento começa em um passo que fornece a sessão (login); passos
+    anteriores ao primeiro login formam um segmento próprio. Guarda o índice
+    global do primeiro passo e quantos itens de cada lista do cenário
+    (metadado consumes do motor de passos) já foram consumidos, para que cada
+    segmento use os mesmos dados que usaria na execução sequencial.
+
+    Com menos segmentos que workers, o maior segmento é cortado no corte
+    seguro (_safe_cuts) mais próximo do meio, até haver um por worker ou não
+    restar corte seguro.
+    """
+    segments = []
+    current = None
+    positions = {}
+
+    for idx, step in enumerate(flow, 1):
+        spec = engine.STEPS.get(step["action"])
+        if current is None or (spec and engine.SESSION in spec.provides and current["steps"]):
+            current = {
+                "start_index": idx,
+                "counters": dict(positions),
+                "steps": [],
+            }
+            segments.append(current)
+
+        current["steps"].append(step)
+        if spec and spec.consumes:
+            positions[spec.consumes] = positions.get(spec.consumes, 0) + 1
+
+    while len(segments) < workers:
+        candidates = [(segment, _safe_cuts(segment)) for segment in segments]
+        candidates = [(segment, cuts) for segment, cuts in candidates if cuts]
+        if not candidates:
+            break
+        segment, cuts = max(candidates, key=lambda c: len(c[0]["steps"]))
+        middle = len(segment["steps"]) / 2
+        k = min(cuts, key=lambda cut: abs(cut - middle))
+        position = segments.index(segment)
+        segments[position:position + 1] = _cut(segment, k)
+
+    return segments
+
+
+def build_user_pool(base_user, size, suffix=PARALLEL_USER_SUFFIX):
+    """Gera um usuário por worker a partir do usuário do cenário"""
+    local, _, domain = base_user["email"].partition("@")
+    pool = []
+    for i in range(1, size + 1):
+        tag = f"{suffix}{i}"
+        pool.append({
+            "username": f"{base_user['username']}{tag}",
+            "email": f"{local}+{tag.strip('_')}@{domain}",
+            "password": base_user["password"],
+        })
+    return pool
+
+
+def assign_segments(segments, workers):
+    """Distribui segmentos entre workers (maiores primeiro, worker menos carregado)"""
+    buckets = [[] for _ in range(workers)]
+    loads = [0] * workers
+
+    for segment in sorted(segments, key=lambda s: len(s["steps"]), reverse=True):
+        target = loads.index(min(loads))
+        buckets[target].append(segment)
+        loads[target] += len(segment["steps"])
+
+    return [bucket for bucket in buckets if bucket]
+
+
+def _ensure_user(user):
+    """Registra o usuário do worker via API (ignora se já existir)"""
+    client = seeding.SeedClient()
+    try:
+        client.register_user(user["username"], user["email"], user["password"])
+    except Exception as e:
+        log_action("Registro do worker ignorado", str(e)[:80])
+    finally:
+        client.close()
+
+
+def _login(driver, scenarios, user, index):
+    """Volta à página inicial e faz login antes de um segmento cortado no meio do fluxo"""
+    from main import navigate_first
+
+    navigate_first(driver)
+    item = engine.compile_item({"action": "login", "description": "Login do segmento"}, index, scenarios, {})
+    ctx = engine.FlowContext(scenarios, user, 1)
+    try:
+        return engine.run_item(driver, item, ctx)
+    finally:
+        ctx.close()
+
+
+def _run_worker(worker_id, segments, user, scenarios, offline=False, trace_dir=None, profile=DEFAULT_PROFILE,
+                driver_path=None):
+    """Executa os segmentos atribuídos a um worker em um Chrome headless próprio"""
+    from main import setup_driver, navigate_first, execute_test_flow
+
+    driver = None
+    results = []
+    hooks = []
+    log_pipeline.set_context(worker=worker_id)
+    if trace_dir:
+        tracing.enable()
+        hooks.append(tracing.tracer)
+
+    try:
+        _ensure_user(user)
+        driver = setup_driver(headless=True, offline=offline, profile=profile, driver_path=driver_path)
+        navigate_first(driver)
+        wait(0.3)
+
+        for segment in sorted(segments, key=lambda s: s["start_index"]):
+            if segment.get("login"):
+                login = _login(driver, scenarios, user, segment["start_index"])
+                if login["status"] != "ok":
+                    error = f"login do segmento falhou: {login['error']}"
+                    results.extend(
+                        {"index": segment["start_index"] + offset, "action": step["action"],
+                         "description": step["description"], "status": "skipped", "error": error,
+                         "duration": 0.0}
+                        for offset, step in enumerate(segment["steps"])
+                    )
+                    continue
+            segment_results = execute_test_flow(
+                driver,
+                scenarios,
+                flow=segment["steps"],
+                user=user,
+                start_index=segment["start_index"],
+                counters=segment["counters"],
+                hooks=hooks,
+            )
+            results.extend(segment_results)
+    except Exception as e:
+        log_action(f"Worker {worker_id} falhou", str(e)[:100], logging.ERROR)
+        done = {r["index"] for r in results}
+        for segment in segments:
+            for offset, step in enumerate(segment["steps"]):
+                idx = segment["start_index"] + offset
+                if idx not in done:
+                    results.append({
+                        "index": idx,
+                        "action": step["action"],
+                        "description": step["description"],
+                        "status": "error",
+                        "error": str(e)[:100],
+                        "duration": 0.0,
+                    })
+    finally:
+        if driver:
+            driver.quit()
+        if trace_dir:
+            tracing.tracer.write(trace_dir, suffix=f"-w{worker_id}")
+
+    for result in results:
+        result["worker"] = worker_id
+    return results
+
+
+def print_report(results, wall_time):
+    """Imprime relatório consolidado de todos os workers"""
+    results = sorted(results, key=lambda r: r["index"])
+    step_time = sum(r["duration"] for r in results)
+    failures = [r for r in results if r["status"] == "error"]
+
+    log_action("========================================")
+    log_action("RELATÓRIO CONSOLIDADO (RUNNER PARALELO)")
+    log_action("========================================")
+    for r in results:
+        line = f"{r['index']:>3} w{r['worker']} {r['status']:<7} {r['duration']:6.2f}s  {r['action']}"
+        if r["error"]:
+            line += f" - {r['error']}"
+        report(line)
+
+    log_action("Passos", f"{len(results)} ({len(failures)} com erro)")
+    log_action("Tempo total dos passos", f"{step_time:.2f}s")
+    log_action("Tempo de parede", f"{wall_time:.2f}s")
+    if wall_time > 0:
+        log_action("Aceleração efetiva", f"{step_time / wall_time:.2f}x")
+
+
+def run_parallel(scenarios, workers, offline=False, trace_dir=None, profile=DEFAULT_PROFILE):
+    """Executa o fluxo de testes distribuído entre workers e imprime relatório"""
+    segments = split_segments(scenarios["test_flow"]["steps"], workers)
+    assignments = assign_segments(segments, workers)
+    users = build_user_pool(scenarios["user"], len(assignments))
+
+    log_action("Runner paralelo", f"{len(segments)} segmento(s) em {len(assignments)} worker(s)")
+    if len(segments) == 1:
+        log_action("Apenas um segmento sem corte seguro - sem ganho de paralelismo")
+
+    # Resolvido uma vez aqui: com o cache frio os workers não disputam o download/cópia
+    driver_path = driver_cache.resolve_driver(offline=offline)
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=len(assignments)) as pool:
+        futures = [
+            pool.submit(_run_worker, worker_id, bucket, user, scenarios, offline, trace_dir, profile, driver_path)
+            for worker_id, (bucket, user) in enumerate(zip(assignments, users), 1)
+        ]
+        for future in futures:
+            results.extend(future.result())
+
+    print_report(results, time.perf_counter() - started)
+    if trace_dir:
+        tracing.print_summary(results)
+    return results
@@ -0,0 +1,101 @@
+"""
+Perfis de navegador - DailyQuest
+"demo" mantém a apresentação (janela grande, animações, digitação lenta);
+"throughput" roda headless com viewport menor, imagens e fontes bloqueadas via
+CDP, animações desligadas por uma folha de estilo injetada e sem pausas de
+demonstração. Cada run é gravado no histórico para calcular a aceleração.
+"""
+import statistics
+import time
+
+import benchmark
+import utils
+from config import (
+    BROWSER_PROFILES,
+    DEFAULT_PROFILE,
+    BLOCKED_URL_PATTERNS,
+    CHROME_OPTIONS,
+    HEADLESS_OPTION,
+    PROFILE_HISTORY,
+    BENCHMARK_WINDOW,
+)
+
+# Zera animações e transições em todo documento novo
+NO_ANIMATIONS_SCRIPT = """
+(function () {
+  if (window.__dqNoAnimations) return;
+  window.__dqNoAnimations = true;
+  var css = '*, *::before, *::after {' +
+    'animation-duration: 0s !important; animation-delay: 0s !important;' +
+    'transition-duration: 0s !important; transition-delay: 0s !important;' +
+    'scroll-behavior: auto !important; caret-color: transparent !important; }';
+  function add() {
+    var style = document.createElement('style');
+    style.id = 'dq-no-animations';
+    style.textContent = css;
+    (document.head || document.documentElement).appendChild(style);
+  }
+  if (document.documentElement) add();
+  else document.addEventListener('DOMContentLoaded', add);
+})();
+"""
+
+
+def get(name=None):
+    """Configuração do perfil (nome inválido levanta ValueError)"""
+    name = name or DEFAULT_PROFILE
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Perfil desconhecido: {name} (opções: {', '.join(BROWSER_PROFILES)})")
+    return dict(BROWSER_PROFILES[name], name=name)
+
+
+def chrome_arguments(profile, headless=False):
+    """Argumentos do Chrome para o perfil (headless força o modo headless)"""
+    arguments = [option for option in CHROME_OPTIONS if not option.startswith("--window-size")]
+    arguments.append(f"--window-size={profile['window_size']}")
+    if headless or profile["headless"]:
+        arguments.append(HEADLESS_OPTION)
+    if profile["block_resources"]:
+        arguments += ["--blink-settings=imagesEnabled=false", "--mute-audio", "--disable-extensions"]
+    return arguments
+
+
+def install(driver, profile):
+    """Aplica bloqueio de recursos, animações e ritmo de pausas do perfil"""
+    if profile["block_resources"]:
+        utils.cdp_setup(driver, "Network.enable")
+        utils.cdp_setup(driver, "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    if profile["disable_animations"]:
+        utils.cdp_setup(driver, "Emulation.setEmulatedMedia", {
+            "features": [{"name": "prefers-reduced-motion", "value": "reduce"}]
+        })
+        utils.add_init_script(driver, NO_ANIMATIONS_SCRIPT)
+    utils.set_pacing(profile["pause_scale"], profile["typing"])
+
+
+def record_run(profile, seconds, steps, errors):
+    """Grava a duração do fluxo no histórico de perfis"""
+    benchmark.append_history({
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "profile": profile["name"],
+        "seconds": round(seconds, 3),
+        "steps": steps,
+        "errors": errors,
+    }, PROFILE_HISTORY)
+
+
+def print_speedup(profile, seconds):
+    """Compara a duração do run com a mediana dos runs recentes dos outros perfis"""
+    history = benchmark.load_history(PROFILE_HISTORY)
+    utils.log_action(f"Perfil {profile['name']}", f"fluxo em {seconds:.2f}s")
+    for other in BROWSER_PROFILES:
+        if other == profile["name"]:
+            continue
+        previous = [run["seconds"] for run in history if run.get("profile") == other][-BENCHMARK_WINDOW:]
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        utils.log_action(
+            f"Aceleração vs {other}",
+            f"{baseline / seconds:.2f}x (mediana de {len(previous)} run(s): {baseline:.2f}s)"
+        )
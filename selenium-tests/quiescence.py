@@ -0,0 +1,195 @@
+"""
+Motor de quiescência - DailyQuest
+Espera até a página estabilizar (sem fetches pendentes para a API, sem
+transições CSS em andamento, sem mutações no DOM e com o React ocioso) em vez
+de pausar por um tempo fixo.
+
+O alvo das esperas é por thread: utils.wait() numa thread só consulta o
+driver instalado (ou selecionado com use()) nessa mesma thread.
+"""
+import json
+import logging
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+import utils
+from tracing import tracer
+from config import QUIESCENCE_TIMEOUT, QUIESCENCE_MAX_FACTOR, QUIESCENCE_QUIET_MS, QUIESCENCE_TRACKED_PATHS
+
+# Instalado em cada documento novo: conta fetch/XHR pendentes para os endpoints
+# monitorados e registra o instante da última atividade (rede, transição, DOM)
+INSTRUMENTATION_SCRIPT = """
+(function (paths) {
+  if (window.__dqQuiescence) return;
+  var state = {pending: 0, last: performance.now()};
+  window.__dqQuiescence = state;
+  function touch() { state.last = performance.now(); }
+  function tracked(url) {
+    url = String(url || '');
+    return paths.some(function (p) { return url.indexOf(p) !== -1; });
+  }
+  var originalFetch = window.fetch;
+  if (originalFetch) {
+    window.fetch = function (input) {
+      var url = typeof input === 'string' ? input : (input && input.url);
+      if (!tracked(url)) return originalFetch.apply(this, arguments);
+      state.pending++; touch();
+      return originalFetch.apply(this, arguments).finally(function () {
+        state.pending--; touch();
+      });
+    };
+  }
+  var originalOpen = XMLHttpRequest.prototype.open;
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__dqTracked = tracked(url);
+    return originalOpen.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.send = function () {
+    if (this.__dqTracked) {
+      state.pending++; touch();
+      this.addEventListener('loadend', function () { state.pending--; touch(); });
+    }
+    return originalSend.apply(this, arguments);
+  };
+  ['transitionrun', 'transitionend', 'animationstart', 'animationend'].forEach(function (type) {
+    document.addEventListener(type, touch, true);
+  });
+  new MutationObserver(touch).observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+  });
+})(%s);
+"""
+
+# Resolve quando a página está estável por QUIESCENCE_QUIET_MS e o navegador
+# concede um período ocioso (requestIdleCallback), ou quando o timeout estoura
+WAIT_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0], quietMs = arguments[1];
+var start = performance.now();
+function busy(state) {
+  if (state && state.pending > 0) return true;
+  if (!document.getAnimations) return false;
+  return document.getAnimations().some(function (a) {
+    if (a.playState !== 'running' || !a.effect) return false;
+    return a.effect.getComputedTiming().endTime !== Infinity;
+  });
+}
+function finish() {
+  var idle = window.requestIdleCallback || function (cb) { setTimeout(cb, 0); };
+  idle(function () {
+    done({settled: true, elapsed: performance.now() - start});
+  }, {timeout: 50});
+}
+(function check() {
+  var state = window.__dqQuiescence;
+  var now = performance.now();
+  if (now - start > timeoutMs) {
+    return done({settled: false, elapsed: now - start, pending: state ? state.pending : 0});
+  }
+  var last = Math.max(state ? state.last : start, start);
+  if (!busy(state) && now - last >= quietMs) return finish();
+  setTimeout(check, 16);
+})();
+"""
+
+_state = threading.local()
+_stats = {"waits": 0, "elapsed": 0.0, "baseline": 0.0, "timeouts": 0}
+
+
+def install(driver):
+    """Instala a instrumentação no driver e o torna o alvo das esperas da thread atual"""
+    script = INSTRUMENTATION_SCRIPT % json.dumps(QUIESCENCE_TRACKED_PATHS)
+    utils.add_init_script(driver, script)
+    driver.quiescence = True
+    _state.driver = driver
+    utils.log_action("Espera por quiescência ativada")
+
+
+def use(driver):
+    """Torna o driver (se instrumentado) o alvo das esperas da thread atual"""
+    _state.driver = driver if getattr(driver, "quiescence", False) else None
+
+
+def uninstall():
+    """Volta a usar pausas fixas na thread atual"""
+    _state.driver = None
+
+
+def _target():
+    return getattr(_state, "driver", None)
+
+
+def active():
+    """Indica se as esperas da thread atual estão usando quiescência"""
+    return _target() is not None
+
+
+def _run_wait(driver, timeout):
+    """Executa WAIT_SCRIPT; o script timeout do driver só é ampliado durante a espera e depois restaurado"""
+    previous = driver.timeouts.script  # None = sem limite
+    needed = timeout + 2
+    if previous is None or previous >= needed:
+        return driver.execute_async_script(WAIT_SCRIPT, int(timeout * 1000), QUIESCENCE_QUIET_MS)
+    driver.set_script_timeout(needed)
+    try:
+        return driver.execute_async_script(WAIT_SCRIPT, int(timeout * 1000), QUIESCENCE_QUIET_MS)
+    finally:
+        driver.set_script_timeout(previous)
+
+
+def settle(baseline, driver=None):
+    """
+    Espera a página estabilizar
+
+    baseline: pausa fixa que esta espera substitui (usada no log de economia);
+    a espera dura no máximo QUIESCENCE_MAX_FACTOR vezes essa pausa, limitada
+    a QUIESCENCE_TIMEOUT. Só esperas que não estabilizam são registradas no
+    log; o total vai para summary().
+    Retorna False se não for possível esperar por quiescência (sem driver
+    instalado, alerta aberto, navegação em andamento...); nesse caso o
+    chamador deve usar a pausa fixa.
+    """
+    driver = driver or _target()
+    if driver is None:
+        return False
+
+    timeout = min(QUIESCENCE_TIMEOUT, max(baseline * QUIESCENCE_MAX_FACTOR, 2 * QUIESCENCE_QUIET_MS / 1000))
+    started = time.perf_counter()
+    try:
+        with tracer.command_category("wait"):
+            outcome = _run_wait(driver, timeout)
+    except WebDriverException:
+        return False
+    elapsed = time.perf_counter() - started
+
+    _stats["waits"] += 1
+    _stats["elapsed"] += elapsed
+    _stats["baseline"] += baseline
+    if not outcome or not outcome.get("settled"):
+        _stats["timeouts"] += 1
+        utils.log_action(
+            "Quiescência não atingida",
+            f"{elapsed:.2f}s (requisições pendentes: {(outcome or {}).get('pending', '?')})"
+        )
+        return True
+
+    utils.log_action(
+        "Quiescência",
+        f"{elapsed:.2f}s (fixo {baseline:.2f}s, economia {baseline - elapsed:+.2f}s)",
+        logging.DEBUG
+    )
+    return True
+
+
+def summary():
+    """Retorna estatísticas acumuladas das esperas"""
+    return {
+        "waits": _stats["waits"],
+        "elapsed": round(_stats["elapsed"], 3),
+        "baseline": round(_stats["baseline"], 3),
+        "saved": round(_stats["baseline"] - _stats["elapsed"], 3),
+        "timeouts": _stats["timeouts"],
+    }
@@ -0,0 +1,244 @@
+"""
+Gerador de cenários sintéticos - DailyQuest
+Gera cenários reproduzíveis (mesma semente e mesma data base = mesmo arquivo)
+com quantos usuários, hábitos, afazeres, tags e dias de histórico forem
+pedidos. A saída é JSON lines, um cenário por usuário no formato de
+data/scenarios.json (mais "history"), gravado item a item: nem o arquivo nem
+um usuário inteiro ficam em memória. O arquivo alimenta o runner de UI
+(main.py --scenarios), o seeding em lote via API e o backend simulado.
+"""
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+from config import (
+    GENERATOR_SEED,
+    GENERATOR_USERS,
+    GENERATOR_HABITS,
+    GENERATOR_TODOS,
+    GENERATOR_TAGS,
+    GENERATOR_HISTORY_DAYS,
+    GENERATOR_COMPLETION_RATE,
+    GENERATOR_USER_SUFFIX,
+)
+from utils import log_action
+
+BASE_SCENARIOS = Path(__file__).parent / "data" / "scenarios.json"
+
+HABIT_NAMES = [
+    "Beber 2 litros de água", "Ler 20 páginas", "Meditar 10 minutos", "Caminhar 30 minutos",
+    "Estudar inglês", "Revisar anotações", "Alongar pela manhã", "Dormir antes da meia-noite",
+    "Praticar violão", "Escrever no diário", "Fazer flexões", "Organizar a mesa",
+]
+TODO_NAMES = [
+    "Pagar conta de luz", "Enviar relatório", "Marcar consulta", "Comprar presente",
+    "Renovar documento", "Responder e-mails", "Preparar apresentação", "Revisar contrato",
+    "Lavar o carro", "Atualizar currículo", "Estudar para prova", "Entregar trabalho",
+]
+DESCRIPTIONS = ["", "Prioridade da semana", "Lembrar de anotar o progresso", "Meta pessoal", "Pedido da equipe"]
+TAG_NAMES = ["Saúde", "Estudos", "Trabalho", "Casa", "Finanças", "Lazer", "Família", "Esporte"]
+DIFFICULTIES = [("EASY", 3), ("MEDIUM", 5), ("HARD", 2)]
+
+def _rng(seed, user_index, section):
+    """Gerador próprio por usuário e seção: o conteúdo de uma seção não depende do tamanho das outras"""
+    return random.Random(f"{seed}:{user_index}:{section}")
+
+
+def _difficulty(rng):
+    names, weights = zip(*DIFFICULTIES)
+    return rng.choices(names, weights)[0]
+
+
+def build_user(base_user, index, suffix=GENERATOR_USER_SUFFIX):
+    """Usuário sintético derivado do usuário do cenário base (testuser_gen1, ...)"""
+    local, _, domain = base_user["email"].partition("@")
+    tag = f"{suffix}{index}"
+    return {
+        "username": f"{base_user['username']}{tag}",
+        "email": f"{local}+{tag.strip('_')}@{domain}",
+        "password": base_user["password"],
+    }
+
+
+def iter_tags(seed, user_index, count):
+    rng = _rng(seed, user_index, "tags")
+    for i in range(count):
+        name = TAG_NAMES[i % len(TAG_NAMES)]
+        if i >= len(TAG_NAMES):
+            name = f"{name} {i // len(TAG_NAMES) + 1}"
+        yield {"name": name, "color_index": rng.randrange(16)}
+
+
+def _tag_sample(rng, tags):
+    return rng.sample(tags, min(len(tags), rng.choice((0, 0, 1, 1, 2))))
+
+
+def iter_habits(seed, user_index, count, tags=()):
+    rng = _rng(seed, user_index, "habits")
+    tags = list(tags)
+    for i in range(count):
+        habit = {
+            "name": f"{rng.choice(HABIT_NAMES)} #{i + 1}",
+            "description": rng.choice(DESCRIPTIONS),
+            "difficulty": _difficulty(rng),
+            "frequency": "DAILY",
+            "tags": _tag_sample(rng, tags),
+        }
+        if rng.random() < 0.3:
+            habit["frequency"] = "SPECIFIC_DAYS"
+            habit["days"] = sorted(rng.sample(range(7), rng.randint(2, 4)))  # 0 = segunda
+        yield habit
+
+
+def iter_todos(seed, user_index, count, anchor, tags=()):
+    rng = _rng(seed, user_index, "todos")
+    tags = list(tags)
+    for i in range(count):
+        deadline = None
+        if rng.random() >= 0.1:
+            deadline = (anchor + timedelta(days=rng.randint(-15, 45))).isoformat()
+        yield {
+            "title": f"{rng.choice(TODO_NAMES)} #{i + 1}",
+            "description": rng.choice(DESCRIPTIONS),
+            "difficulty": _difficulty(rng),
+            "deadline": deadline,
+            "tags": _tag_sample(rng, tags),
+        }
+
+
+def iter_history(seed, user_index, habits, days, anchor, rate=GENERATOR_COMPLETION_RATE):
+    """
+    Conclusões de hábitos nos `days` dias até a data base (inclusive)
+
+    habits é uma lista de (índice, dias da semana ou None). Cada entrada
+    é {"habit": índice do hábito, "date": "AAAA-MM-DD"}.
+    """
+    rng = _rng(seed, user_index, "history")
+    for offset in range(days - 1, -1, -1):
+        day = anchor - timedelta(days=offset)
+        weekday = day.weekday()  # Convenção do frontend: 0 = segunda, 6 = domingo
+        for index, scheduled in habits:
+            if scheduled is not None and weekday not in scheduled:
+                continue
+            if rng.random() < rate:
+                yield {"habit": index, "date": day.isoformat()}
+
+
+def _habit_schedule(seed, user_index, count, tags):
+    """(índice, dias) de cada hábito, regenerado em streaming para o histórico"""
+    for index, habit in enumerate(iter_habits(seed, user_index, count, tags)):
+        yield index, habit.get("days")
+
+
+def _write_list(out, key, items):
+    out.write(f', "{key}": [')
+    count = 0
+    for item in items:
+        if count:
+            out.write(", ")
+        out.write(json.dumps(item, ensure_ascii=False))
+        count += 1
+    out.write("]")
+    return count
+
+
+def generate(path, users=GENERATOR_USERS, habits=GENERATOR_HABITS, todos=GENERATOR_TODOS,
+             tags=GENERATOR_TAGS, history_days=GENERATOR_HISTORY_DAYS, seed=GENERATOR_SEED,
+             anchor=None, base=BASE_SCENARIOS):
+    """
+    Grava `users` cenários em `path` (JSON lines) e retorna os totais gerados
+
+    anchor é a data base do histórico e dos prazos (padrão: hoje); fixe-a
+    para obter exatamente o mesmo arquivo em outro dia.
+    """
+    anchor = date.fromisoformat(anchor) if isinstance(anchor, str) else (anchor or date.today())
+    with open(base, "r", encoding="utf-8") as f:
+        template = json.load(f)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    totals = {"users": 0, "habits": 0, "tasks": 0, "tags": 0, "history": 0}
+    with open(path, "w", encoding="utf-8") as out:
+        for index in range(1, users + 1):
+            tag_names = [t["name"] for t in iter_tags(seed, index, tags)]
+            header = {
+                "config": template.get("config", {}),
+                "user": build_user(template["user"], index),
+                "generator": {
+                    "seed": seed, "index": index, "anchor": anchor.isoformat(), "habits": habits,
+                    "todos": todos, "tags": tags, "history_days": history_days,
+                },
+                "test_flow": template["test_flow"],
+            }
+            out.write(json.dumps(header, ensure_ascii=False)[:-1])
+            totals["tags"] += _write_list(out, "tags", iter_tags(seed, index, tags))
+            totals["habits"] += _write_list(out, "habits", iter_habits(seed, index, habits, tag_names))
+            totals["tasks"] += _write_list(out, "tasks", iter_todos(seed, index, todos, anchor, tag_names))
+            schedule = list(_habit_schedule(seed, index, habits, tag_names))
+            totals["history"] += _write_list(
+                out, "history", iter_history(seed, index, schedule, history_days, anchor)
+            )
+            out.write("}\n")
+            totals["users"] += 1
+
+    log_action(
+        "Cenários gerados",
+        f"{path}: {totals['users']} usuário(s), {totals['habits']} hábitos, {totals['tasks']} afazeres, "
+        f"{totals['tags']} tags, {totals['history']} conclusões"
+    )
+    return totals
+
+
+def iter_scenarios(path):
+    """Lê os cenários gerados um a um (um usuário em memória por vez)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def seed_file(path):
+    """Registra cada usuário do arquivo e cria seus dados via API, um usuário por vez"""
+    import seeding
+
+    seeded = 0
+    for scenario in iter_scenarios(path):
+        client = seeding.SeedClient()
+        try:
+            client.ensure_user(scenario["user"])
+            client.seed_scenario(scenario)
+            seeded += 1
+        except seeding.SeedError as e:
+            log_action(f"Seeding de {scenario['user']['username']} falhou", str(e)[:100])
+        finally:
+            client.close()
+    log_action("Seeding do arquivo concluído", f"{seeded} usuário(s)")
+    return seeded
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gerador de cenários sintéticos DailyQuest")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="Gera o arquivo de cenários (JSON lines)")
+    gen.add_argument("output", help="Arquivo de saída (ex: data/generated.jsonl)")
+    gen.add_argument("--users", type=int, default=GENERATOR_USERS)
+    gen.add_argument("--habits", type=int, default=GENERATOR_HABITS, help="Hábitos por usuário")
+    gen.add_argument("--todos", type=int, default=GENERATOR_TODOS, help="Afazeres por usuário")
+    gen.add_argument("--tags", type=int, default=GENERATOR_TAGS, help="Tags por usuário")
+    gen.add_argument("--history-days", type=int, default=GENERATOR_HISTORY_DAYS, help="Dias de histórico")
+    gen.add_argument("--seed", type=int, default=GENERATOR_SEED)
+    gen.add_argument("--anchor", help="Data base AAAA-MM-DD (padrão: hoje)")
+
+    seed = commands.add_parser("seed", help="Cria os usuários e dados do arquivo via API")
+    seed.add_argument("input", help="Arquivo gerado")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        generate(args.output, args.users, args.habits, args.todos, args.tags, args.history_days,
+                 args.seed, args.anchor)
+    else:
+        seed_file(args.input)
@@ -0,0 +1,225 @@
+"""
+Cenários em streaming - DailyQuest
+Formato JSON lines com um registro por linha, lido e executado à medida que
+o arquivo é lido: o primeiro passo roda assim que a primeira linha de passo
+é lida e a memória não cresce com o tamanho da suíte.
+
+    {"kind": "header", "config": {...}, "user": {...}, "steps": 2000000}
+    {"kind": "habit", "name": "...", ...}
+    {"kind": "task", "title": "...", ...}
+    {"kind": "step", "action": "create_habit", "description": "..."}
+    {"kind": "steps", "items": [{...}, {...}]}     # bloco (também "habits"/"tasks")
+
+Hábitos e afazeres devem vir antes dos passos que os consomem; depois de
+associados a um passo são descartados. "steps" no cabeçalho é opcional
+(só é usado no contador "PASSO i/N").
+"""
+import json
+from collections import deque
+from pathlib import Path
+
+import engine
+from config import STREAM_KEEP_ERRORS, STREAM_PROGRESS_EVERY
+from utils import log_action, report
+
+HEADER = "header"
+# Tipo de registro -> lista do cenário
+DATA_KINDS = {"habit": "habits", "task": "tasks"}
+CHUNK_KINDS = {"habits": "habit", "tasks": "task", "steps": "step"}
+
+
+class StreamError(Exception):
+    """Arquivo de cenário em streaming malformado"""
+    pass
+
+
+class _Window:
+    """
+    Janela de itens ainda não consumidos, indexada pela posição absoluta
+
+    Se comporta como a lista scenarios["habits"]/["tasks"] para as funções
+    bind dos passos (len, índice e fatia a partir da posição atual).
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._offset = 0
+
+    def append(self, item):
+        self._items.append(item)
+
+    def release(self, position):
+        """Descarta os itens antes de position (já associados a passos)"""
+        while self._offset < position and self._items:
+            self._items.popleft()
+            self._offset += 1
+
+    def __len__(self):
+        return self._offset + len(self._items)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start = max((key.start or 0) - self._offset, 0)
+            return list(self._items)[start:]
+        if key < self._offset:
+            raise IndexError(f"Item {key} já descartado do stream")
+        return self._items[key - self._offset]
+
+
+def _records(path):
+    """(tipo, registro) de cada linha, com os blocos expandidos"""
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise StreamError(f"{path}:{number}: JSON inválido ({e.msg})")
+            kind = record.pop("kind", None)
+            if kind in CHUNK_KINDS:
+                for item in record.get("items", []):
+                    yield CHUNK_KINDS[kind], item
+            elif kind == HEADER or kind in DATA_KINDS or kind == "step":
+                yield kind, record
+            else:
+                raise StreamError(f"{path}:{number}: tipo de registro desconhecido: {kind!r}")
+
+
+def read_header(path):
+    """Cabeçalho do arquivo (primeira linha), sem ler o restante"""
+    with open(path, "r", encoding="utf-8") as f:
+        record = json.loads(f.readline() or "{}")
+    if record.pop("kind", None) != HEADER:
+        raise StreamError(f"{path}: a primeira linha deve ser o cabeçalho (\"kind\": \"header\")")
+    return record
+
+
+def is_stream(path):
+    """Arquivo .jsonl no formato de streaming (primeira linha com "kind": "header")"""
+    if not path or Path(path).suffix != ".jsonl":
+        return False
+    try:
+        read_header(path)
+    except (StreamError, json.JSONDecodeError):
+        return False
+    return True
+
+
+def open_stream(path):
+    """
+    Retorna (cenário, passos)
+
+    cenário é o dict do cabeçalho com "habits"/"tasks" como janelas; passos
+    é um gerador que lê o arquivo sob demanda, guardando na janela os
+    hábitos e afazeres encontrados no caminho.
+    """
+    records = _records(path)
+    kind, header = next(records, (None, None))
+    if kind != HEADER:
+        raise StreamError(f"{path}: a primeira linha deve ser o cabeçalho (\"kind\": \"header\")")
+    scenario = dict(header, habits=_Window(), tasks=_Window())
+
+    def steps():
+        for kind, record in records:
+            if kind == "step":
+                yield record
+            elif kind in DATA_KINDS:
+                scenario[DATA_KINDS[kind]].append(record)
+            else:
+                raise StreamError(f"{path}: cabeçalho repetido")
+
+    return scenario, steps()
+
+
+def load(path):
+    """Materializa o arquivo no formato de data/scenarios.json (para os modos que precisam do fluxo inteiro)"""
+    scenario = read_header(path)
+    scenario.update(habits=[], tasks=[], test_flow={"steps": []})
+    for kind, record in _records(path):
+        if kind == "step":
+            scenario["test_flow"]["steps"].append(record)
+        elif kind in DATA_KINDS:
+            scenario[DATA_KINDS[kind]].append(record)
+    return scenario
+
+
+def iter_items(scenario, steps, start_index=1):
+    """Compila os passos um a um, liberando os dados já associados"""
+    positions = {}
+    for index, raw in enumerate(steps, start_index):
+        item = engine.compile_item(raw, index, scenario, positions)
+        for key, position in positions.items():
+            scenario[key].release(position)
+        yield item
+
+
+def execute(driver, path, hooks=()):
+    """
+    Executa o arquivo passo a passo enquanto ele é lido
+
+    Guarda só os contadores por status e os primeiros STREAM_KEEP_ERRORS
+    passos com erro. Retorna {"ok", "error", "skipped", "steps", "errors"}.
+    """
+    scenario, steps = open_stream(path)
+    summary = {"ok": 0, "error": 0, "skipped": 0, "steps": 0, "errors": []}
+    results = engine.run_stream(
+        driver, iter_items(scenario, steps), scenario, scenario["user"],
+        total=scenario.get("steps", "?"), hooks=hooks
+    )
+    for result in results:
+        summary["steps"] += 1
+        summary[result["status"]] += 1
+        if result["status"] == "error" and len(summary["errors"]) < STREAM_KEEP_ERRORS:
+            summary["errors"].append(result)
+        if summary["steps"] % STREAM_PROGRESS_EVERY == 0:
+            log_action(
+                "Progresso do stream",
+                f"{summary['steps']} passos, {summary['error']} erro(s), {summary['skipped']} pulado(s)"
+            )
+    log_action(
+        "Stream concluído",
+        f"{summary['steps']} passos: {summary['ok']} ok, {summary['error']} erro(s), {summary['skipped']} pulado(s)"
+    )
+    for result in summary["errors"]:
+        report(f"  {result['index']:>8} {result['action']:<28} {result['error']}")
+    return summary
+
+
+def convert(source, path, repeat=1):
+    """
+    Converte um cenário JSON (data/scenarios.json) para o formato de streaming
+
+    repeat > 1 repete o fluxo (sem repetir o login); os passos além dos
+    hábitos/afazeres do cenário usam os dados genéricos das funções bind.
+    """
+    with open(source, "r", encoding="utf-8") as f:
+        scenario = json.load(f)
+    flow = scenario["test_flow"]["steps"]
+    repeated = [step for step in flow if step["action"] != "login"]
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = {key: value for key, value in scenario.items() if key not in ("habits", "tasks", "test_flow")}
+    count = len(flow) + len(repeated) * (repeat - 1)
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(json.dumps(dict(header, kind=HEADER, steps=count), ensure_ascii=False) + "\n")
+        for kind, key in DATA_KINDS.items():
+            for item in scenario.get(key, []):
+                out.write(json.dumps(dict(item, kind=kind), ensure_ascii=False) + "\n")
+        for round_ in range(repeat):
+            for step in (flow if round_ == 0 else repeated):
+                out.write(json.dumps(dict(step, kind="step"), ensure_ascii=False) + "\n")
+    log_action("Cenário convertido para streaming", f"{path}: {count} passos")
+    return count
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Conversão de cenários DailyQuest para o formato de streaming")
+    parser.add_argument("source", help="Cenário JSON (ex: data/scenarios.json)")
+    parser.add_argument("output", help="Arquivo de saída (ex: data/suite.jsonl)")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetições do fluxo (sem o login)")
+    args = parser.parse_args()
+    convert(args.source, args.output, args.repeat)
@@ -0,0 +1,272 @@
+"""
+Seeding via API - DailyQuest
+Cria usuários, hábitos, afazeres e tags direto nos endpoints que o frontend
+já usa (lib/api-service.ts), para preparar pré-condições sem dirigir modais.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import API_BASE_URL, AUTH_URL, SEED_POOL_SIZE, SEED_WORKERS, SEED_TIMEOUT
+from utils import log_action
+from validators import compile_rules, validate_records, validate_title, validate_description
+
+# Paleta do gerenciador de tags (components/tag-manager-modal.tsx)
+TAG_COLORS = [
+    "#ef4444", "#f97316", "#f59e0b", "#eab308",
+    "#84cc16", "#22c55e", "#10b981", "#14b8a6",
+    "#06b6d4", "#0ea5e9", "#3b82f6", "#6366f1",
+    "#8b5cf6", "#a855f7", "#d946ef", "#ec4899",
+]
+
+# Validação em lote antes do seeding. Prazos ficam de fora: afazeres
+# atrasados (prazo no passado) fazem parte da massa gerada.
+HABIT_RULES = compile_rules({
+    "name": (validate_title, {"field_name": "Nome do hábito"}),
+    "description": (validate_description, {"field_name": "Descrição do hábito"}),
+})
+TODO_RULES = compile_rules({
+    "title": (validate_title, {"field_name": "Título do afazer"}),
+    "description": (validate_description, {"field_name": "Descrição do afazer"}),
+})
+
+
+class SeedError(Exception):
+    """Erro retornado pela API durante o seeding"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class SeedClient:
+    """Cliente HTTP com uma única sessão (pool de conexões) para seeding"""
+
+    def __init__(self, api_url=API_BASE_URL, auth_url=AUTH_URL, token=None):
+        self.api_url = api_url.rstrip("/")
+        self.auth_url = auth_url.rstrip("/")
+        self.session = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=SEED_POOL_SIZE, max_retries=retries
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if token:
+            self.set_token(token)
+
+    def set_token(self, token):
+        """Usa o token em todas as requisições seguintes"""
+        self.token = token
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def _request(self, method, url, **kwargs):
+        """Executa requisição e retorna o JSON (ou None), levantando SeedError em falha"""
+        kwargs.setdefault("timeout", SEED_TIMEOUT)
+        response = self.session.request(method, url, **kwargs)
+        if not response.ok:
+            try:
+                detail = response.json().get("detail", response.text)
+            except ValueError:
+                detail = response.text
+            raise SeedError(f"{method} {url} -> {response.status_code}: {str(detail)[:100]}", response.status_code)
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    # ===== Autenticação =====
+
+    def register_user(self, username, email, password):
+        """Cria usuário (POST /users); retorna None se já existir"""
+        try:
+            return self._request("POST", f"{self.api_url}/users", json={
+                "username": username, "email": email, "password": password
+            })
+        except SeedError as e:
+            if e.status in (400, 409):
+                return None
+            raise
+
+    def login(self, username, password):
+        """Login OAuth2 (form data) no serviço de auth; guarda o token na sessão"""
+        data = self._request("POST", f"{self.auth_url}/login", data={
+            "username": username, "password": password
+        })
+        self.set_token(data["access_token"])
+        return data["access_token"]
+
+    def current_user(self):
+        """Dados do usuário autenticado (GET /login/me)"""
+        return self._request("GET", f"{self.auth_url}/login/me")
+
+    def ensure_user(self, user):
+        """Registra o usuário (se necessário) e faz login"""
+        self.register_user(user["username"], user["email"], user["password"])
+        return self.login(user["username"], user["password"])
+
+    # ===== Tarefas =====
+
+    def create_habit(self, title, description="", difficulty="medium", frequency="DAILY", days=None, tag_ids=None):
+        """Cria hábito (POST /tasks)"""
+        return self._request("POST", f"{self.api_url}/tasks", json=habit_body(
+            title, description, difficulty, frequency, days, tag_ids
+        ))
+
+    def create_todo(self, title, description="", difficulty="medium", deadline=None, tag_ids=None):
+        """Cria afazer (POST /tasks); deadline None cria o afazer sem prazo"""
+        return self._request("POST", f"{self.api_url}/tasks", json=todo_body(
+            title, description, difficulty, deadline, tag_ids
+        ))
+
+    def create_tag(self, name, color_index=0):
+        """Cria tag (POST /tags) usando a cor da paleta do frontend"""
+        return self._request("POST", f"{self.api_url}/tags", json={
+            "name": name, "color": TAG_COLORS[color_index % len(TAG_COLORS)]
+        })
+
+    def complete_task(self, task_id):
+        """Completa tarefa (POST /task-completions/complete/{id})"""
+        return self._request("POST", f"{self.api_url}/task-completions/complete/{task_id}")
+
+    # ===== Em lote =====
+
+    def bulk(self, func, items):
+        """
+        Aplica func(**item) a cada item em paralelo sobre a mesma sessão
+
+        Retorna lista de resultados na ordem dos itens (SeedError no lugar
+        dos itens que falharam).
+        """
+        def run(item):
+            try:
+                return func(**item)
+            except (SeedError, requests.RequestException) as e:
+                return e if isinstance(e, SeedError) else SeedError(str(e))
+
+        with ThreadPoolExecutor(max_workers=SEED_WORKERS) as pool:
+            results = list(pool.map(run, items))
+
+        failures = [r for r in results if isinstance(r, SeedError)]
+        log_action(f"Seeding em lote: {func.__name__}", f"{len(items) - len(failures)}/{len(items)} ok")
+        return results
+
+    def seed_scenario(self, scenario):
+        """
+        Cria tags, hábitos e afazeres do cenário, com as tags associadas
+
+        Hábitos e afazeres são validados em lote antes do envio; os inválidos
+        são pulados. A API só registra conclusões na data atual: das entradas
+        de "history" (cenários de scenario_generator.py) apenas as de hoje são
+        enviadas (o backend simulado importa todas).
+        """
+        created_tags = self.bulk(self.create_tag, [
+            {"name": t["name"], "color_index": t.get("color_index", 0)} for t in scenario.get("tags", [])
+        ])
+        tag_ids = {
+            tag["name"]: result["id"]
+            for tag, result in zip(scenario.get("tags", []), created_tags)
+            if isinstance(result, dict)
+        }
+
+        def with_tags(payload, item):
+            payload["tag_ids"] = [tag_ids[name] for name in item.get("tags", []) if name in tag_ids]
+            return payload
+
+        habit_items = scenario.get("habits", [])
+        habit_rows = _valid_items(habit_items, HABIT_RULES, "hábito")
+        created_habits = self.bulk(self.create_habit, [
+            with_tags(habit_payload(habit_items[row]), habit_items[row]) for row in habit_rows
+        ])
+        # Índice no cenário -> hábito criado (o histórico referencia o índice original)
+        habits = dict(zip(habit_rows, created_habits))
+        todo_items = scenario.get("tasks", [])
+        todos = self.bulk(self.create_todo, [
+            with_tags(todo_payload(todo_items[row]), todo_items[row])
+            for row in _valid_items(todo_items, TODO_RULES, "afazer")
+        ])
+
+        today = date.today().isoformat()
+        completions = [
+            {"task_id": habits[entry["habit"]]["id"]}
+            for entry in scenario.get("history", [])
+            if entry["date"] == today and isinstance(habits.get(entry["habit"]), dict)
+        ]
+        if completions:
+            self.bulk(self.complete_task, completions)
+        return {"tags": created_tags, "habits": created_habits, "todos": todos, "completions": len(completions)}
+
+    def close(self):
+        """Fecha as conexões da sessão"""
+        self.session.close()
+
+
+def register_users(users):
+    """Registra usuários via API (POST /users), ignorando os que já existem"""
+    client = SeedClient()
+    try:
+        for user in users:
+            client.register_user(user["username"], user["email"], user["password"])
+    finally:
+        client.close()
+
+
+def _valid_items(items, rules, kind):
+    """Índices dos itens que passam nas regras; os inválidos são reportados e pulados"""
+    report = validate_records(items, rules)
+    if not report.valid:
+        log_action(f"{len(report.errors)} {kind}(s) inválido(s) ignorado(s)", report.messages()[0][:100])
+    return report.valid_rows()
+
+
+def habit_body(title, description="", difficulty="medium", frequency="DAILY", days=None, tag_ids=None):
+    """Corpo JSON de criação de hábito (CreateTaskRequest)"""
+    body = {
+        "title": title,
+        "description": description,
+        "task_type": "habit",
+        "difficulty": difficulty.lower(),
+        "frequency_type": frequency,
+        "tag_ids": tag_ids or [],
+    }
+    if frequency == "SPECIFIC_DAYS":
+        body["frequency_days"] = sorted(days or [])
+    return body
+
+
+def todo_body(title, description="", difficulty="medium", deadline=None, tag_ids=None):
+    """Corpo JSON de criação de afazer (CreateTaskRequest); deadline None = sem prazo"""
+    return {
+        "title": title,
+        "description": description,
+        "task_type": "todo",
+        "difficulty": difficulty.lower(),
+        "deadline": deadline,
+        "tag_ids": tag_ids or [],
+    }
+
+
+def habit_payload(habit):
+    """Converte hábito do cenário nos argumentos de create_habit"""
+    return {
+        "title": habit["name"],
+        "description": habit.get("description", ""),
+        "difficulty": habit.get("difficulty", "medium"),
+        "frequency": habit.get("frequency", "DAILY"),
+        "days": habit.get("days"),
+    }
+
+
+def todo_payload(task):
+    """Converte task do cenário nos argumentos de create_todo"""
+    return {
+        "title": task["title"],
+        "description": task.get("description", ""),
+        "difficulty": task.get("difficulty", "medium"),
+        "deadline": task.get("deadline"),
+    }
@@ -0,0 +1,126 @@
+"""
+Cache de sessão autenticada - DailyQuest
+Salva o estado do navegador após o login (token e usuário no localStorage,
+como em lib/auth.ts, e cookies), valida o token em /login/me e o injeta em
+drivers novos, evitando o login pelo formulário.
+"""
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+import seeding
+from config import BASE_URL, SESSION_CACHE_DIR, SESSION_MAX_AGE
+from utils import wait, wait_for_url_contains, log_action
+
+# Chaves usadas por lib/auth.ts
+TOKEN_KEY = "dailyquest_token"
+USER_KEY = "dailyquest_user"
+
+
+def _cache_path(username):
+    """Arquivo de cache do usuário"""
+    safe_name = re.sub(r"[^\w\-]", "_", username)
+    return Path(SESSION_CACHE_DIR) / f"{safe_name}.json"
+
+
+def save(driver, username):
+    """Salva token, usuário e cookies do navegador autenticado"""
+    state = driver.execute_script(
+        "return {token: localStorage.getItem(arguments[0]), user: localStorage.getItem(arguments[1])};",
+        TOKEN_KEY, USER_KEY
+    )
+    if not state or not state.get("token"):
+        log_action("Sessão não salva (token ausente no localStorage)")
+        return False
+
+    path = _cache_path(username)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "username": username,
+        "token": state["token"],
+        "user": state.get("user"),
+        "cookies": driver.get_cookies(),
+        "saved_at": time.time(),
+    }
+    # Token é credencial: arquivo legível apenas pelo dono
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    log_action("Sessão salva em cache", username)
+    return True
+
+
+def load(username):
+    """Lê a sessão em cache (None se não existir ou estiver expirada)"""
+    try:
+        with open(_cache_path(username), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("saved_at", 0) > SESSION_MAX_AGE:
+        invalidate(username)
+        return None
+    return entry
+
+
+def invalidate(username):
+    """Remove a sessão do cache"""
+    try:
+        _cache_path(username).unlink()
+    except OSError:
+        pass
+
+
+def is_valid(entry):
+    """Confere o token contra /login/me"""
+    client = seeding.SeedClient(token=entry["token"])
+    try:
+        user = client.current_user()
+    except Exception:
+        return False
+    finally:
+        client.close()
+    return bool(user) and user.get("username", entry["username"]) == entry["username"]
+
+
+def restore(driver, username):
+    """
+    Injeta a sessão em cache no driver
+
+    Retorna True se o dashboard abriu autenticado; em caso de cache ausente,
+    expirado ou rejeitado retorna False (e o chamador faz login pela UI).
+    """
+    entry = load(username)
+    if entry is None:
+        return False
+    if not is_valid(entry):
+        log_action("Sessão em cache expirada", username)
+        invalidate(username)
+        return False
+
+    # localStorage e cookies só podem ser definidos estando na origem do app
+    if not driver.current_url.startswith(BASE_URL):
+        driver.get(BASE_URL)
+    driver.execute_script(
+        "localStorage.setItem(arguments[0], arguments[1]);"
+        "if (arguments[2] !== null) localStorage.setItem(arguments[3], arguments[2]);",
+        TOKEN_KEY, entry["token"], entry.get("user"), USER_KEY
+    )
+    for cookie in entry.get("cookies", []):
+        cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+
+    driver.get(f"{BASE_URL}/dashboard")
+    wait(0.3)  # Rota protegida redireciona para /login no cliente se o token for recusado
+    if not wait_for_url_contains(driver, "/dashboard", timeout=5) or "/login" in driver.current_url:
+        log_action("Sessão em cache rejeitada pelo app", username)
+        invalidate(username)
+        return False
+
+    log_action("Sessão restaurada do cache", username)
+    return True
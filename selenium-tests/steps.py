@@ -0,0 +1,228 @@
+"""
+Ações do cenário - DailyQuest
+Registra cada ação de data/scenarios.json no motor de passos (engine.py),
+com metadados de dependência e, quando possível, a execução via API.
+
+Além dos dados, requires/provides descrevem o estado da tela: modais
+abertos ("achievements_modal", "profile_modal") e a aba de afazeres
+("todos_tab"). Assim o motor não separa de quem abriu um modal ou trocou de
+aba os passos que dependem disso (pista de quarentena, segmentos paralelos).
+"""
+from datetime import datetime, timedelta
+
+from engine import SESSION, step, seeder
+from actions import auth, dashboard, achievements, profile, habits
+from validators import parse_deadline
+
+
+# ===== Associação de dados do cenário (feita na compilação do plano) =====
+
+def bind_habit(raw, scenarios, position):
+    """Próximo hábito do cenário (ou um genérico se a lista acabou)"""
+    habits_list = scenarios.get("habits", [])
+    if position < len(habits_list):
+        habit = habits_list[position]
+        return {
+            "title": habit.get("name", f"Hábito Demo {position+1}"),
+            "description": habit.get("description", ""),
+            "difficulty": habit.get("difficulty", "medium"),
+        }
+    return {"title": f"Hábito Demo {position+1}", "description": "Descrição padrão", "difficulty": "medium"}
+
+
+def bind_specific_days(raw, scenarios, position):
+    """Próximo hábito SPECIFIC_DAYS do cenário a partir da posição atual"""
+    days = raw.get("days", [1, 3, 5])  # Default: Seg, Qua, Sex
+    habit = next(
+        (h for h in scenarios.get("habits", [])[position:] if h.get("frequency") == "SPECIFIC_DAYS"),
+        None
+    )
+    if habit:
+        return {
+            "title": habit.get("name", f"Hábito Dias Específicos {position+1}"),
+            "description": habit.get("description", ""),
+            "difficulty": habit.get("difficulty", "medium"),
+            "days": habit.get("days", days),
+        }
+    return {
+        "title": f"Hábito Dias Específicos {position+1}",
+        "description": "Hábito com dias específicos",
+        "difficulty": "medium",
+        "days": days,
+    }
+
+
+def bind_todo(raw, scenarios, position):
+    """
+    Próximo afazer do cenário (ou um genérico se a lista acabou)
+
+    Sem deadline no cenário usa amanhã (DD-MM-YYYY), como habits.create_todo:
+    o frontend exige prazo para afazeres, então o passo via API cria o mesmo dado.
+    """
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%d-%m-%Y")
+    tasks_list = scenarios.get("tasks", [])
+    if position < len(tasks_list):
+        task = tasks_list[position]
+        return {
+            "title": task.get("title", f"Afazer Demo {position+1}"),
+            "description": task.get("description", ""),
+            "difficulty": task.get("difficulty", "medium"),
+            "deadline": task.get("deadline") or tomorrow,
+        }
+    return {"title": f"Afazer Demo {position+1}", "description": "Descrição padrão",
+            "difficulty": "medium", "deadline": tomorrow}
+
+
+# ===== Sessão e dashboard =====
+
+@step("login", needs_login=False, idempotent=True, provides=(SESSION,))
+def login(driver, item, ctx):
+    user = ctx.user
+    return auth.login(driver, user["username"], user["password"])
+
+
+@step("verify_dashboard", idempotent=True)
+def verify_dashboard(driver, item, ctx):
+    return dashboard.verify_dashboard_elements(driver)
+
+
+@step("scroll_dashboard", "final_scroll", idempotent=True)
+def scroll_dashboard(driver, item, ctx):
+    return dashboard.scroll_dashboard(driver)
+
+
+# ===== Hábitos, afazeres e tags =====
+
+@step("create_habit", parallel_safe=True, consumes="habits", bind=bind_habit, provides=("habit",))
+def create_habit(driver, item, ctx):
+    data = item["data"]
+    return habits.create_habit(driver, data["title"], data["description"])
+
+
+@step("create_habit_specific_days", parallel_safe=True, consumes="habits", bind=bind_specific_days,
+      provides=("habit",))
+def create_habit_specific_days(driver, item, ctx):
+    data = item["data"]
+    return habits.create_habit_with_specific_days(
+        driver, data["title"], data["description"], data["difficulty"], data["days"]
+    )
+
+
+@step("manage_tags", parallel_safe=True, provides=("tags",))
+def manage_tags(driver, item, ctx):
+    return habits.manage_tags_full_crud(driver)
+
+
+@step("create_todo", parallel_safe=True, consumes="tasks", bind=bind_todo, provides=("todo",))
+def create_todo(driver, item, ctx):
+    data = item["data"]
+    return habits.create_todo(driver, data["title"], data["description"])
+
+
+@step("complete_habit", requires=("habit",))
+def complete_habit(driver, item, ctx):
+    return habits.complete_first_habit(driver)
+
+
+@step("complete_2_habits", requires=("habit",))
+def complete_2_habits(driver, item, ctx):
+    return habits.complete_multiple_habits(driver, 2)
+
+
+@step("uncomplete_habit", requires=("habit",))
+def uncomplete_habit(driver, item, ctx):
+    return habits.uncomplete_first_habit(driver)
+
+
+@step("switch_to_todos", idempotent=True, provides=("todos_tab",))
+def switch_to_todos(driver, item, ctx):
+    return habits.switch_to_todos_tab(driver)
+
+
+@step("use_filter", idempotent=True, requires=("todos_tab",))
+def use_filter(driver, item, ctx):
+    return habits.use_filter(driver, item["step"].get("filter_name", "Todas"))
+
+
+# ===== Conquistas =====
+
+@step("open_achievements", idempotent=True, provides=("achievements_modal",))
+def open_achievements(driver, item, ctx):
+    return achievements.open_achievements_modal(driver)
+
+
+@step("scroll_achievements", idempotent=True, requires=("achievements_modal",))
+def scroll_achievements(driver, item, ctx):
+    return achievements.scroll_achievements(driver)
+
+
+@step("close_achievements", idempotent=True, requires=("achievements_modal",))
+def close_achievements(driver, item, ctx):
+    return achievements.close_achievements_modal(driver)
+
+
+# ===== Perfil =====
+
+@step("open_profile", idempotent=True, provides=("profile_modal",))
+def open_profile(driver, item, ctx):
+    return profile.open_profile_modal(driver)
+
+
+@step("close_profile", idempotent=True, requires=("profile_modal",))
+def close_profile(driver, item, ctx):
+    return profile.close_profile_modal(driver)
+
+
+@step("view_profile", idempotent=True, requires=("profile_modal",))
+def view_profile(driver, item, ctx):
+    return profile.verify_user_stats(driver)
+
+
+@step("calendar_next", requires=("profile_modal",))
+def calendar_next(driver, item, ctx):
+    return profile.navigate_calendar_next(driver)
+
+
+@step("calendar_previous", requires=("profile_modal",))
+def calendar_previous(driver, item, ctx):
+    return profile.navigate_calendar_previous(driver)
+
+
+@step("edit_character", requires=("profile_modal",))
+def edit_character(driver, item, ctx):
+    # Edita o avatar/personagem do usuário
+    return profile.edit_character(driver, item["step"].get("avatar_index", None))
+
+
+# ===== Execução via API (passos "seed": true) =====
+
+@seeder("create_habit")
+def seed_habit(client, item, ctx):
+    data = item["data"]
+    client.create_habit(data["title"], data["description"], data["difficulty"])
+
+
+@seeder("create_habit_specific_days")
+def seed_habit_specific_days(client, item, ctx):
+    data = item["data"]
+    client.create_habit(
+        data["title"], data["description"], data["difficulty"], frequency="SPECIFIC_DAYS", days=data["days"]
+    )
+
+
+@seeder("create_todo")
+def seed_todo(client, item, ctx):
+    data = item["data"]
+    # A API recebe o prazo em YYYY-MM-DD
+    deadline = parse_deadline(data["deadline"])
+    client.create_todo(
+        data["title"], data["description"], data["difficulty"], deadline.isoformat() if deadline else data["deadline"]
+    )
+
+
+@seeder("manage_tags")
+def seed_tags(client, item, ctx):
+    client.bulk(client.create_tag, [
+        {"name": t["name"], "color_index": t.get("color_index", 0)}
+        for t in ctx.scenarios.get("tags", [])
+    ])
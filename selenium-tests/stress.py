@@ -0,0 +1,352 @@
+"""
+Teste de escala do DOM - DailyQuest
+Para cada N de STRESS_SIZES cria um usuário com N hábitos, N afazeres, N
+conquistas desbloqueadas (só no backend simulado; a API não cria conquistas) e
+meses de histórico e mede, por view: time-to-interactive do dashboard, latência de
+troca de aba e de abertura de modais, taxa de quadros no scroll e custo de
+find_elements. No final ajusta uma reta log-log (métrica ~ N^k) por métrica.
+Uma medição que falha em qualquer N faz o run retornar 1.
+"""
+import json
+import math
+import time
+from datetime import date
+from pathlib import Path
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+import batch
+import driver_pool
+import scenario_generator
+import ui_selectors as selectors
+from actions import auth, achievements, profile
+from config import (
+    BASE_URL,
+    DEFAULT_TIMEOUT,
+    DEFAULT_PROFILE,
+    LOCATOR_PROBE_ROUNDS,
+    STRESS_SIZES,
+    STRESS_HISTORY_DAYS,
+    STRESS_HISTORY_HABITS,
+    STRESS_QUIET_MS,
+    STRESS_SCROLL_MS,
+    STRESS_TIMEOUT,
+    STRESS_OUTPUT,
+)
+from utils import log_action, report
+
+# Checkbox de qualquer item da lista (hábito ou afazer, completo ou não)
+ITEM_CHECKBOX = (By.CSS_SELECTOR, "button.rounded-full.border-2")
+
+# Lista renderizada (N itens ou contagem estável) e nenhuma long task por quietMs.
+# TTI em ms desde o início da navegação (performance.now).
+TTI_SCRIPT = batch.LOCATE_JS + """
+var done = arguments[arguments.length - 1];
+var cmd = arguments[0], expected = arguments[1], quietMs = arguments[2], timeoutMs = arguments[3];
+var lastLongTask = 0, count = -1, lastChange = performance.now(), ready = null;
+try {
+  new PerformanceObserver(function (list) {
+    list.getEntries().forEach(function (e) { lastLongTask = Math.max(lastLongTask, e.startTime + e.duration); });
+  }).observe({type: 'longtask', buffered: true});
+} catch (e) {}
+var started = performance.now();
+(function frame() {
+  var now = performance.now(), current = locate(cmd).length;
+  if (current !== count) { count = current; lastChange = now; ready = null; }
+  if (ready === null && count > 0 && (count >= expected || now - lastChange >= quietMs)) ready = lastChange;
+  if (ready !== null && now - Math.max(ready, lastLongTask) >= quietMs) {
+    return done({tti: Math.max(ready, lastLongTask), items: count});
+  }
+  if (now - started > timeoutMs) return done({tti: null, items: count});
+  requestAnimationFrame(frame);
+})();
+"""
+
+# Clica no elemento e mede até o primeiro quadro após a última mutação do DOM
+# (sem mutações por quietMs e, se informado, com waitCmd presente)
+INTERACTION_SCRIPT = batch.LOCATE_JS + """
+var done = arguments[arguments.length - 1];
+var cmd = arguments[0], index = arguments[1], waitCmd = arguments[2], quietMs = arguments[3], timeoutMs = arguments[4];
+var nodes = locate(cmd), node = nodes[index < 0 ? nodes.length + index : index];
+if (!node) return done({latency: null, found: false});
+var mutated = false, settled = null;
+var observer = new MutationObserver(function () { mutated = true; });
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+var start = performance.now();
+activate(node);
+(function frame() {
+  var now = performance.now();
+  if (mutated) { mutated = false; settled = now; }
+  var present = !waitCmd || locate(waitCmd).length > 0;
+  if (present && settled !== null && now - settled >= quietMs) {
+    observer.disconnect();
+    return done({latency: settled - start, found: true});
+  }
+  if (now - start > timeoutMs) { observer.disconnect(); return done({latency: null, found: true}); }
+  requestAnimationFrame(frame);
+})();
+"""
+
+# Rola o maior contêiner rolável (página ou dentro de root) por durationMs e mede os quadros
+SCROLL_SCRIPT = batch.LOCATE_JS + """
+var done = arguments[arguments.length - 1];
+var rootCmd = arguments[0], durationMs = arguments[1];
+var root = rootCmd ? locate(rootCmd)[0] : null;
+var target = document.scrollingElement;
+if (root) {
+  target = null;
+  [root].concat(Array.prototype.slice.call(root.querySelectorAll('*'))).forEach(function (el) {
+    var style = getComputedStyle(el);
+    if (el.scrollHeight > el.clientHeight + 1 && /auto|scroll/.test(style.overflowY) &&
+        (!target || el.scrollHeight > target.scrollHeight)) target = el;
+  });
+}
+if (!target || target.scrollHeight <= target.clientHeight + 1) return done({fps: null, scrollable: false});
+var distance = target.scrollHeight - target.clientHeight;
+var frames = [], start = performance.now(), last = start;
+target.scrollTop = 0;
+requestAnimationFrame(function frame(now) {
+  frames.push(now - last);
+  last = now;
+  var progress = Math.min(1, (now - start) / durationMs);
+  target.scrollTop = distance * progress;
+  if (progress < 1) return requestAnimationFrame(frame);
+  frames.shift();
+  frames.sort(function (a, b) { return a - b; });
+  var elapsed = now - start;
+  done({
+    fps: frames.length / (elapsed / 1000),
+    p95_frame: frames[Math.floor(frames.length * 0.95)] || null,
+    dropped: frames.filter(function (f) { return f > 1000 / 60 * 1.5; }).length,
+    scrollable: true
+  });
+});
+"""
+
+# Métricas por view (ordem das colunas no relatório)
+METRICS = {
+    "habits": ["tti_ms", "scroll_fps", "find_xpath_ms", "find_css_ms", "items"],
+    "todos": ["tab_ms", "scroll_fps", "find_css_ms", "items"],
+    "achievements": ["open_ms", "scroll_fps", "items"],
+    "calendar": ["open_ms", "next_ms"],
+}
+
+
+# Raridades aceitas pelo modal de conquistas (components/achievements-modal.tsx)
+RARITIES = ["common", "rare", "epic", "legendary"]
+
+
+def iter_achievements(count):
+    """Conquistas sintéticas STRESS_<i> (desbloqueadas pelo import do backend simulado)"""
+    for i in range(count):
+        yield {
+            "requirement_key": f"STRESS_{i}", "name": f"Conquista {i + 1}",
+            "description": "Conquista do teste de escala", "icon": "🏅", "category": "Escala",
+            "rarity": RARITIES[i % len(RARITIES)],
+        }
+
+
+def build_scenario(size, base_user, run_id="", history_days=STRESS_HISTORY_DAYS, seed=0):
+    """
+    Cenário com `size` hábitos, afazeres e conquistas e histórico nos primeiros STRESS_HISTORY_HABITS hábitos
+
+    run_id entra no nome do usuário (testuser_stress<run_id>_<N>) para não
+    somar itens de runs anteriores contra uma API real.
+    """
+    anchor = date.today()
+    tags = [t["name"] for t in scenario_generator.iter_tags(seed, size, 8)]
+    habits = list(scenario_generator.iter_habits(seed, size, size, tags))
+    schedule = [(i, h.get("days")) for i, h in enumerate(habits[:STRESS_HISTORY_HABITS])]
+    return {
+        "user": scenario_generator.build_user(base_user, size, suffix=f"_stress{run_id}_"),
+        "tags": list(scenario_generator.iter_tags(seed, size, 8)),
+        "habits": habits,
+        "tasks": list(scenario_generator.iter_todos(seed, size, size, anchor, tags)),
+        "history": list(scenario_generator.iter_history(seed, size, schedule, history_days, anchor)),
+        "achievements": list(iter_achievements(size)),
+    }
+
+
+def load_user(scenario, backend=None):
+    """Carrega o cenário no backend simulado (histórico completo) ou via API"""
+    if backend is not None:
+        backend.load_scenarios([scenario])
+        return
+    import seeding
+    log_action("Conquistas não são criadas via API", "o modal terá só as conquistas do usuário")
+    client = seeding.SeedClient()
+    try:
+        client.ensure_user(scenario["user"])
+        client.seed_scenario(scenario)
+    finally:
+        client.close()
+
+
+def _ms(value):
+    return round(value, 1) if value is not None else None
+
+
+def find_cost(driver, locator):
+    """Menor tempo de find_elements (ms) com implicit wait 0 e quantos elementos"""
+    driver.implicitly_wait(0)
+    try:
+        best, found = None, 0
+        for _ in range(LOCATOR_PROBE_ROUNDS):
+            started = time.perf_counter()
+            found = len(driver.find_elements(*locator))
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return round(best, 2), found
+    finally:
+        driver.implicitly_wait(DEFAULT_TIMEOUT)
+
+
+def interaction(driver, locator, wait_locator=None, index=0, **options):
+    outcome = driver.execute_async_script(
+        INTERACTION_SCRIPT, batch.command(locator, **options), index,
+        batch.command(wait_locator) if wait_locator else None, STRESS_QUIET_MS, STRESS_TIMEOUT * 1000
+    )
+    if not outcome["found"]:
+        raise NoSuchElementException(f"Elemento não encontrado: {locator[1][:80]}")
+    if outcome["latency"] is None:
+        raise TimeoutException(f"Interação não estabilizou em {STRESS_TIMEOUT}s: {locator[1][:80]}")
+    return _ms(outcome["latency"])
+
+
+def scroll_fps(driver, root=None):
+    outcome = driver.execute_async_script(
+        SCROLL_SCRIPT, batch.command(root) if root else None, STRESS_SCROLL_MS
+    )
+    return round(outcome["fps"], 1) if outcome["fps"] else None
+
+
+def measure_habits(driver, size):
+    driver.get(f"{BASE_URL}/dashboard")
+    outcome = driver.execute_async_script(
+        TTI_SCRIPT, batch.command(ITEM_CHECKBOX), size, STRESS_QUIET_MS, STRESS_TIMEOUT * 1000
+    )
+    if outcome["tti"] is None:
+        raise TimeoutException(f"Dashboard não ficou interativo em {STRESS_TIMEOUT}s ({outcome['items']} itens)")
+    xpath_ms, _ = find_cost(driver, selectors.HABIT_UNCHECKED)
+    css_ms, items = find_cost(driver, ITEM_CHECKBOX)
+    return {
+        "tti_ms": _ms(outcome["tti"]), "scroll_fps": scroll_fps(driver),
+        "find_xpath_ms": xpath_ms, "find_css_ms": css_ms, "items": items,
+    }
+
+
+def measure_todos(driver, size):
+    tab_ms = interaction(driver, selectors.TODOS_TAB)
+    css_ms, items = find_cost(driver, ITEM_CHECKBOX)
+    return {"tab_ms": tab_ms, "scroll_fps": scroll_fps(driver), "find_css_ms": css_ms, "items": items}
+
+
+def measure_achievements(driver, size):
+    driver.get(f"{BASE_URL}/dashboard")
+    open_ms = interaction(driver, selectors.ACHIEVEMENTS_BUTTON, selectors.MODAL_DIALOG)
+    fps = scroll_fps(driver, selectors.MODAL_DIALOG)
+    _, items = find_cost(driver, selectors.ACHIEVEMENT_CARDS)
+    achievements.close_achievements_modal(driver)
+    return {"open_ms": open_ms, "scroll_fps": fps, "items": items}
+
+
+def measure_calendar(driver, size):
+    driver.get(f"{BASE_URL}/dashboard")
+    profile.open_profile_modal(driver)
+    open_ms = interaction(driver, selectors.PROGRESS_TAB)
+    next_ms = interaction(driver, selectors.CALENDAR_NAV_BUTTONS, index=-1, has_svg=True)
+    profile.close_profile_modal(driver)
+    return {"open_ms": open_ms, "next_ms": next_ms}
+
+
+VIEWS = {
+    "habits": measure_habits,
+    "todos": measure_todos,
+    "achievements": measure_achievements,
+    "calendar": measure_calendar,
+}
+
+
+def loglog_slope(sizes, values):
+    """Expoente k de valor ~ N^k (mínimos quadrados em log-log); None com menos de 2 pontos"""
+    points = [(math.log(n), math.log(v)) for n, v in zip(sizes, values) if v]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / spread, 2)
+
+
+def run_sweep(driver, base_user, sizes=STRESS_SIZES, backend=None):
+    """
+    Mede todas as views para cada N
+
+    Retorna {"sizes", "views": {view: {métrica: [valores]}}, "slopes", "failures"};
+    failures lista {"view", "size", "error"} das medições que falharam.
+    """
+    failures = []
+    views = {view: {metric: [] for metric in metrics} for view, metrics in METRICS.items()}
+    run_id = time.strftime("%H%M%S")
+    for size in sizes:
+        log_action("Stress", f"N = {size}")
+        scenario = build_scenario(size, base_user, run_id)
+        load_user(scenario, backend)
+        driver_pool.reset(driver)
+        auth.login(driver, scenario["user"]["username"], scenario["user"]["password"])
+        for view, measure in VIEWS.items():
+            try:
+                values = measure(driver, size)
+            except Exception as e:
+                log_action(f"Medição {view} falhou (N = {size})", str(e)[:100])
+                failures.append({"view": view, "size": size, "error": str(e)[:100]})
+                values = {}
+            for metric in METRICS[view]:
+                views[view][metric].append(values.get(metric))
+    slopes = {
+        view: {metric: loglog_slope(sizes, values) for metric, values in metrics.items() if metric != "items"}
+        for view, metrics in views.items()
+    }
+    return {"sizes": list(sizes), "views": views, "slopes": slopes, "failures": failures}
+
+
+def print_report(sweep):
+    """Curva de escala por view e expoente log-log de cada métrica"""
+    sizes = sweep["sizes"]
+    for view, metrics in sweep["views"].items():
+        log_action(f"Escala: {view}")
+        report(f"  {'métrica':<16}" + "".join(f"{'N=' + str(n):>12}" for n in sizes) + f"{'~N^k':>8}")
+        for metric, values in metrics.items():
+            cells = "".join(f"{'-' if v is None else v:>12}" for v in values)
+            slope = sweep["slopes"][view].get(metric)
+            report(f"  {metric:<16}{cells}{'' if slope is None else slope:>8}")
+    if sweep["failures"]:
+        log_action("Medições com falha", f"{len(sweep['failures'])}")
+        for failure in sweep["failures"]:
+            report(f"  {failure['view']:<16}{'N=' + str(failure['size']):>8}  {failure['error']}")
+
+
+def write(sweep, path=STRESS_OUTPUT):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(sweep, indent=2), encoding="utf-8")
+    return str(path)
+
+
+def run(scenarios, sizes=STRESS_SIZES, backend=None, offline=False, profile=DEFAULT_PROFILE):
+    """Executa o sweep em um driver próprio, imprime o relatório e grava STRESS_OUTPUT (1 se alguma medição falhou)"""
+    from main import setup_driver, navigate_first
+
+    driver = setup_driver(offline=offline, profile=profile)
+    driver.set_script_timeout(STRESS_TIMEOUT + 5)
+    try:
+        navigate_first(driver)
+        sweep = run_sweep(driver, scenarios["user"], sizes, backend)
+    finally:
+        driver.quit()
+    print_report(sweep)
+    log_action("Curva de escala gravada", write(sweep))
+    return 1 if sweep["failures"] else 0
@@ -17,6 +17,10 @@ from validators import (
     validate_deadline,
     validate_frequency,
     validate_category,
+    parse_deadline,
+    compile_rules,
+    validate_columns,
+    validate_records,
     ValidationError
 )
 
@@ -263,6 +267,84 @@ def test_description():
             print(f"✓ Descrição falhou corretamente ({reason})")
 
 
+def test_deadline_formats():
+    """Testa a detecção de formato do deadline"""
+    print("\n=== Testando Formatos de Deadline ===")
+    
+    from datetime import date
+    
+    cases = [
+        ("31-12-2025", date(2025, 12, 31)),
+        ("2025-12-31", date(2025, 12, 31)),
+        ("31/12/2025", date(2025, 12, 31)),
+        ("2025/12/31", date(2025, 12, 31)),
+        ("1-2-2025", date(2025, 2, 1)),
+        ("2025-12/31", None),  # separadores diferentes
+        ("29-02-2025", None),  # data inexistente
+        ("12-2025-31", None),
+    ]
+    
+    for deadline, expected in cases:
+        result = parse_deadline(deadline)
+        if result == expected:
+            print(f"✓ '{deadline}' -> {result}")
+        else:
+            print(f"✗ '{deadline}' esperado {expected}, obtido {result}")
+
+
+def test_batch():
+    """Testa a validação em lote contra os validadores individuais"""
+    print("\n=== Testando Validação em Lote ===")
+    
+    rules = compile_rules({
+        "username": "username",
+        "email": validate_email,
+        "title": (validate_title, {"field_name": "Nome do hábito"}),
+    })
+    records = [
+        {"username": "testuser", "email": "Test@Example.com", "title": "Estudar Python"},
+        {"username": "ab", "email": "not-an-email", "title": "Ler"},
+        {"username": "user_123", "email": "user@domain.co.uk"},
+    ]
+    
+    report = validate_records(records, rules)
+    
+    expected_errors = {1: {"username", "email"}, 2: {"title"}}
+    actual_errors = {row: set(fields) for row, fields in report.errors.items()}
+    if actual_errors == expected_errors:
+        print(f"✓ Erros por linha: {actual_errors}")
+    else:
+        print(f"✗ Erros por linha esperados {expected_errors}, obtidos {actual_errors}")
+    
+    if report.record(0) == {"username": "testuser", "email": "test@example.com", "title": "Estudar Python"}:
+        print(f"✓ Linha 0 validada: {report.record(0)}")
+    else:
+        print(f"✗ Linha 0 com valores inesperados: {report.record(0)}")
+    
+    for message in report.messages():
+        print(f"  {message}")
+    
+    # Mesmo resultado com entrada em colunas
+    columns = {field: [record.get(field) for record in records] for field in ("username", "email", "title")}
+    if validate_columns(columns, rules).errors == report.errors:
+        print("✓ Entrada em colunas equivalente à entrada por registros")
+    else:
+        print("✗ Entrada em colunas divergiu da entrada por registros")
+    
+    # Valores não hasheáveis (listas de dias) são validados sem cache
+    days_report = validate_columns({"days": [[0, 2], [0, 2], None]}, {"days": lambda value: value or []})
+    if days_report.columns["days"] == [[0, 2], [0, 2], []]:
+        print(f"✓ Coluna de listas validada: {days_report.columns['days']}")
+    else:
+        print(f"✗ Coluna de listas com valores inesperados: {days_report.columns['days']}")
+    
+    try:
+        report.raise_for_errors()
+        print("✗ raise_for_errors deveria falhar mas passou")
+    except ValidationError as e:
+        print(f"✓ raise_for_errors falhou corretamente ({len(report.messages())} erros)")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("TESTANDO VALIDADORES - DAILYQUEST")
@@ -275,6 +357,8 @@ if __name__ == "__main__":
     test_deadline()
     test_frequency()
     test_description()
+    test_deadline_formats()
+    test_batch()
     
     print("\n" + "=" * 60)
     print("TESTES CONCLUÍDOS")
@@ -0,0 +1,163 @@
+"""
+Matriz de condições de rede - DailyQuest
+Executa o mesmo cenário sob cada perfil de NETWORK_PROFILES (3G, 4G, alta
+latência, CPU 4x), emulados via CDP, e reporta a latência de cada passo por
+perfil. Cada perfil usa um usuário novo, para que todos partam do mesmo
+estado (o fluxo cria hábitos e afazeres). Passos cuja duração cresce com a latência indicam cadeias de
+requisições sequenciais (candidatas a batching/cache no app).
+"""
+import json
+import time
+from pathlib import Path
+
+import driver_pool
+import scenario_generator
+import seeding
+from config import NETWORK_PROFILES, NETWORK_MATRIX_OUTPUT, DEFAULT_PROFILE
+from utils import cdp_setup, log_action, report
+
+BASELINE = "baseline"
+LATENCY_PROFILE = "high_latency"
+THROTTLING_COMMANDS = ("Network.emulateNetworkConditions", "Emulation.setCPUThrottlingRate")
+
+
+def apply(driver, name):
+    """Aplica o perfil de rede/CPU na aba atual (reaplicado pelo driver_pool no reset)"""
+    conditions = NETWORK_PROFILES[name]
+    # Só o perfil atual deve ser reaplicado em uma aba nova
+    driver.cdp_setups = [s for s in getattr(driver, "cdp_setups", []) if s[0] not in THROTTLING_COMMANDS]
+    cdp_setup(driver, "Network.enable")
+    cdp_setup(driver, "Network.emulateNetworkConditions", {
+        "offline": False,
+        "latency": conditions["latency"],
+        "downloadThroughput": conditions["download"],
+        "uploadThroughput": conditions["upload"],
+    })
+    cdp_setup(driver, "Emulation.setCPUThrottlingRate", {"rate": conditions["cpu"]})
+
+
+def build_users(base_user, names, run_id=""):
+    """
+    Um usuário novo por perfil (testuser_net<run_id>_<perfil>), registrado via API
+
+    run_id entra no nome para não reaproveitar o estado de runs anteriores.
+    """
+    users = {name: scenario_generator.build_user(base_user, name, suffix=f"_net{run_id}_") for name in names}
+    seeding.register_users(users.values())
+    return users
+
+
+def run_matrix(driver, scenarios, names, hooks=()):
+    """
+    Executa o fluxo uma vez por perfil, cada um com um usuário novo
+
+    Retorna {perfil: [resultados]}; cada resultado recebe "run" com o nome do perfil.
+    """
+    from main import execute_test_flow
+
+    users = build_users(scenarios["user"], names, time.strftime("%H%M%S"))
+    matrix = {}
+    for name in names:
+        log_action("Condição de rede", f"{name} ({users[name]['username']})")
+        driver_pool.reset(driver)
+        apply(driver, name)
+        matrix[name] = execute_test_flow(driver, scenarios, user=users[name], hooks=hooks)
+        for result in matrix[name]:
+            result["run"] = name
+    return matrix
+
+
+def round_trips(matrix):
+    """
+    Estimativa de round-trips sequenciais por passo
+
+    (duração em alta latência - duração base) / latência adicionada: quantas
+    vezes o passo esperou a rede em série.
+    """
+    if BASELINE not in matrix or LATENCY_PROFILE not in matrix:
+        return {}
+    added = NETWORK_PROFILES[LATENCY_PROFILE]["latency"] / 1000
+    base = {r["index"]: r for r in matrix[BASELINE]}
+    chains = {}
+    for result in matrix[LATENCY_PROFILE]:
+        reference = base.get(result["index"])
+        if reference and result["status"] == reference["status"] == "ok":
+            chains[result["index"]] = max(0.0, (result["duration"] - reference["duration"]) / added)
+    return chains
+
+
+def print_report(matrix):
+    """Tabela passo x perfil (s), com a razão sobre o baseline e os round-trips estimados"""
+    names = list(matrix)
+    chains = round_trips(matrix)
+    base = {r["index"]: r["duration"] for r in matrix.get(BASELINE, [])}
+    log_action("Latência por passo e condição de rede (s)")
+    report(f"  {'passo':<28}" + "".join(f"{name:>14}" for name in names) + f"{'RTTs':>7}")
+    rows = {}
+    for name in names:
+        for result in matrix[name]:
+            rows.setdefault(result["index"], {"action": result["action"]})[name] = result
+    for index in sorted(rows):
+        row = rows[index]
+        cells = ""
+        for name in names:
+            result = row.get(name)
+            if not result or result["status"] != "ok":
+                cells += f"{'erro' if result else '-':>14}"
+                continue
+            ratio = f" {result['duration'] / base[index]:.1f}x" if base.get(index) and name != BASELINE else ""
+            cells += f"{result['duration']:>8.2f}{ratio:>6}"
+        chain = f"{chains[index]:>7.1f}" if index in chains else f"{'-':>7}"
+        report(f"  {row['action'][:28]:<28}{cells}{chain}")
+    totals = "".join(f"{sum(r.get('duration', 0) for r in matrix[name]):>14.2f}" for name in names)
+    report(f"  {'TOTAL':<28}{totals}")
+
+
+def write(matrix, path=NETWORK_MATRIX_OUTPUT):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    chains = round_trips(matrix)
+    path.write_text(json.dumps({
+        "profiles": {name: NETWORK_PROFILES[name] for name in matrix},
+        "steps": [
+            {
+                "index": result["index"],
+                "action": result["action"],
+                "round_trips": round(chains[result["index"]], 2) if result["index"] in chains else None,
+                "duration": {
+                    name: round(r["duration"], 3) if r["status"] == "ok" else None
+                    for name in matrix
+                    for r in matrix[name] if r["index"] == result["index"]
+                },
+            }
+            for result in next(iter(matrix.values()), [])
+        ],
+    }, indent=2), encoding="utf-8")
+    return str(path)
+
+
+def run(scenarios, names=None, offline=False, profile=DEFAULT_PROFILE, hooks=(), performance_log=False,
+        console_log=False):
+    """
+    Executa a matriz em um driver próprio, imprime o relatório e grava NETWORK_MATRIX_OUTPUT
+
+    performance_log e console_log são repassados a setup_driver (exigidos
+    pelos hooks de waterfall e de artefatos).
+    """
+    from main import setup_driver, navigate_first
+
+    names = names or list(NETWORK_PROFILES)
+    unknown = [name for name in names if name not in NETWORK_PROFILES]
+    if unknown:
+        raise ValueError(f"Perfil de rede desconhecido: {', '.join(unknown)} (opções: {', '.join(NETWORK_PROFILES)})")
+    driver = setup_driver(
+        offline=offline, profile=profile, performance_log=performance_log, console_log=console_log
+    )
+    try:
+        navigate_first(driver)
+        matrix = run_matrix(driver, scenarios, names, hooks)
+    finally:
+        driver.quit()
+    print_report(matrix)
+    log_action("Matriz de rede gravada", write(matrix))
+    return 0 if all(r["status"] != "error" for results in matrix.values() for r in results) else 1
@@ -0,0 +1,205 @@
+"""
+Instrumentação de tempo por passo - DailyQuest
+Mede cada passo do execute_test_flow e cada helper de utils com timers
+monotônicos de alta resolução, separando o tempo em espera, pausa, round-trip
+WebDriver e execução de JS. Exporta trace JSON e formato Chrome Trace
+(abrir em chrome://tracing ou https://ui.perfetto.dev).
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from selenium.webdriver.remote.command import Command
+
+import log_pipeline
+
+# Categorias do detalhamento por passo ("python" = tempo próprio do passo)
+CATEGORIES = ("wait", "sleep", "webdriver", "js", "python")
+
+SCRIPT_COMMANDS = {
+    Command.W3C_EXECUTE_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT_ASYNC,
+}
+
+
+class Tracer:
+    """Coleta spans aninhados por thread e acumula tempo exclusivo por categoria"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.steps = []
+        self.origin_ns = time.perf_counter_ns()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, name, category, args=None):
+        """Abre um span (use span() sempre que possível)"""
+        # [nome, categoria, início, tempo dos filhos, args]
+        self._stack().append([name, category, time.perf_counter_ns(), 0, args or {}])
+
+    def end(self):
+        """Fecha o span mais recente e retorna sua duração (ns)"""
+        end_ns = time.perf_counter_ns()
+        stack = self._stack()
+        name, category, start_ns, children_ns, args = stack.pop()
+        duration = end_ns - start_ns
+        if stack:
+            stack[-1][3] += duration
+
+        totals = getattr(self._local, "step_totals", None)
+        if totals is not None:
+            key = "python" if category == "step" else category
+            totals[key] = totals.get(key, 0) + duration - children_ns
+
+        self.events.append((name, category, start_ns, duration, threading.get_ident(), args))
+        return duration
+
+    @contextmanager
+    def span(self, name, category, **args):
+        """Span com medição de tempo; no-op se o tracer estiver desligado"""
+        if not self.enabled:
+            yield
+            return
+        self.begin(name, category, args)
+        try:
+            yield
+        finally:
+            self.end()
+
+    @contextmanager
+    def command_category(self, category):
+        """Classifica comandos WebDriver do bloco em outra categoria (ex: espera via JS)"""
+        previous = getattr(self._local, "override", None)
+        self._local.override = category
+        try:
+            yield
+        finally:
+            self._local.override = previous
+
+    # ===== Hook de passos (execute_test_flow) =====
+
+    def before_step(self, driver, result):
+        """Abre o span do passo e zera o acumulador por categoria"""
+        if not self.enabled:
+            return
+        self._local.step_totals = {}
+        self.begin(f"{result['index']}. {result['action']}", "step", {"description": result["description"]})
+
+    def after_step(self, driver, result):
+        """Fecha o span do passo e anexa o detalhamento de tempo ao resultado"""
+        if not self.enabled or getattr(self._local, "step_totals", None) is None:
+            return
+        self.end()
+        totals = self._local.step_totals
+        self._local.step_totals = None
+        result["timing"] = {
+            category: round(totals.get(category, 0) / 1e9, 6) for category in CATEGORIES
+        }
+        self.steps.append(dict(result))
+
+    # ===== Exportação =====
+
+    def write(self, directory, suffix=""):
+        """Grava trace.json (passos + spans) e trace.chrome.json (Chrome Trace Format)"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        pid = os.getpid()
+
+        spans = [
+            {
+                "name": name,
+                "cat": category,
+                "start_ms": round((start - self.origin_ns) / 1e6, 3),
+                "duration_ms": round(duration / 1e6, 3),
+                "thread": tid,
+                "args": args,
+            }
+            for name, category, start, duration, tid, args in self.events
+        ]
+        with open(directory / f"trace{suffix}.json", "w", encoding="utf-8") as f:
+            json.dump({"steps": self.steps, "spans": spans}, f, indent=2, ensure_ascii=False)
+
+        chrome_events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin_ns) / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+            for name, category, start, duration, tid, args in self.events
+        ]
+        with open(directory / f"trace{suffix}.chrome.json", "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": chrome_events, "displayTimeUnit": "ms"}, f)
+
+        return directory
+
+
+tracer = Tracer()
+
+
+def enable():
+    """Liga a coleta de spans"""
+    tracer.enabled = True
+
+
+def traced(category, name=None):
+    """Decorator que mede a função como um span da categoria"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(label, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_driver(driver):
+    """
+    Mede cada comando WebDriver do driver
+
+    Todos os comandos (inclusive os de WebElement) passam por driver.execute;
+    scripts contam como "js" e os demais como round-trip "webdriver".
+    """
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        if not tracer.enabled:
+            return original_execute(driver_command, params)
+        category = getattr(tracer._local, "override", None)
+        if category is None:
+            category = "js" if driver_command in SCRIPT_COMMANDS else "webdriver"
+        with tracer.span(driver_command, category):
+            return original_execute(driver_command, params)
+
+    driver.execute = execute
+    return driver
+
+
+def print_summary(steps=None):
+    """Imprime os passos mais lentos com o detalhamento por categoria"""
+    import utils
+
+    steps = sorted(steps or tracer.steps, key=lambda r: r.get("duration", 0), reverse=True)
+    utils.log_action("Passos mais lentos (wait / sleep / webdriver / js / python)")
+    for result in steps[:10]:
+        timing = result.get("timing", {})
+        breakdown = " / ".join(f"{timing.get(c, 0):.2f}" for c in CATEGORIES)
+        log_pipeline.report(f"  {result['index']:>3} {result['action']:<28} {result.get('duration', 0):6.2f}s  {breakdown}")
@@ -1,40 +1,198 @@
 """Predefinição de seletores usados pelos scripts Selenium (nome sem conflito com stdlib)
+
+Locators XPath são registrados (locators.register) para passar pela sondagem
+e pelo cache de estratégias; CSS e ID já são rápidos e ficam como tuplas.
+Locators montados com dados do cenário (título, tag) ficam nas ações.
 """
 from selenium.webdriver.common.by import By
 
+from locators import register
+
 # Login page
 USERNAME = (By.ID, "username")
 PASSWORD = (By.ID, "password")
 LOGIN_SUBMIT = (By.CSS_SELECTOR, "form button[type='submit']")
+SUBMIT_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+# Registro (o campo do nome é "name", não "username")
+REGISTER_NAME = (By.ID, "name")
+EMAIL = (By.ID, "email")
+PROFILE_BUTTON = (By.CSS_SELECTOR, "button[aria-label='Profile']")
+LOGOUT_BUTTON = register(
+    "logout_button",
+    By.XPATH,
+    "//button[contains(text(), 'Sair') or contains(text(), 'Logout')]"
+)
 
 # Create Habit / Task modal
 MODAL_DIALOG = (By.CSS_SELECTOR, "[role='dialog']")
+MODAL = (By.CSS_SELECTOR, "[role='dialog'], [class*='modal']")
 MODAL_SUBMIT = (By.CSS_SELECTOR, "[role='dialog'] button[type='submit']")
 TITLE = (By.ID, "title")
 DESCRIPTION = (By.ID, "description")
 DEADLINE = (By.ID, "deadline")
 FREQUENCY_TIMES = (By.ID, "frequency_target_times")
+SPECIFIC_DAYS_OPTION = register(
+    "specific_days_option",
+    By.XPATH,
+    "//div[contains(., 'Dias específicos') and contains(@class, 'cursor-pointer')]"
+)
+# Botões de dia da semana no modal de criação
+DAY_BUTTONS = register(
+    "day_buttons",
+    By.XPATH, "//div[@role='dialog']//div[contains(@class, 'grid-cols-7')]//button[not(@disabled)]",
+    (By.CSS_SELECTOR, "[role='dialog'] .grid-cols-7 button:not([disabled])"),
+)
 
 # Dashboard quick buttons
-NEW_TASK_BUTTON = (
+NEW_TASK_BUTTON = register(
+    "new_task_button",
     By.XPATH,
     "//button[.//text()[contains(., 'Nova Tarefa')] or normalize-space(.)='Nova Tarefa']"
 )
+NEW_TASK_FALLBACK = register("new_task_fallback", By.XPATH, "//button[contains(., 'Nova')]")
+CREATE_TASK_BUTTON = register(
+    "create_task_button",
+    By.XPATH,
+    "//button[contains(text(), 'Nova Tarefa') or contains(text(), 'Criar Tarefa') or contains(text(), 'Add Task')]"
+)
+
+# Lista de hábitos e afazeres
+HABIT_UNCHECKED = register(
+    "habit_unchecked",
+    By.XPATH,
+    "//button[contains(@class, 'rounded-full') and contains(@class, 'border-2') and not(contains(@class, 'bg-green'))]"
+)
+HABIT_CHECKED = register("habit_checked", By.XPATH, "//button[contains(@class, 'bg-green-500')]")
+TODOS_TAB = register("todos_tab", By.XPATH, "//button[@role='tab' and contains(., 'Afazeres')]")
+TASK_UNCHECKED = register("task_unchecked", By.XPATH, "//input[@type='checkbox' and not(@checked)]")
+TASK_CHECKBOXES = (By.CSS_SELECTOR, "input[type='checkbox']")
+CONFIRM_DELETE_BUTTON = register(
+    "confirm_delete_button",
+    By.XPATH,
+    "//button[contains(text(), 'Confirmar') or contains(text(), 'Deletar') or contains(text(), 'Delete')]"
+)
+
+# Gerenciador de tags
+MANAGE_TAGS_BUTTON = register(
+    "manage_tags_button",
+    By.XPATH,
+    "//button[contains(., 'Gerenciar') or contains(., 'Gerenciar Tags')]"
+)
+TAG_NAME = (By.ID, "tag-name")
+CREATE_TAG_BUTTON = register("create_tag_button", By.XPATH, "//button[contains(., 'Criar Tag')]")
+UPDATE_TAG_BUTTON = register("update_tag_button", By.XPATH, "//button[contains(., 'Atualizar Tag')]")
+# Paleta de cores do gerenciador de tags
+COLOR_BUTTONS = register(
+    "color_buttons",
+    By.XPATH, "//div[@role='dialog']//button[contains(@class, 'rounded-full') and contains(@class, 'w-8')]",
+    (By.CSS_SELECTOR, "[role='dialog'] button.rounded-full.w-8"),
+)
+# Botões com ícone (editar, deletar) dentro de uma linha de tag (relativo à linha: não é sondado)
+ROW_ICON_BUTTONS = (By.XPATH, ".//button[.//*[name()='svg']]")
 
 # Habit/Todo type cards inside modal (use visible text)
-TYPE_HABIT = (By.XPATH, "//div[contains(., 'Hábito') and contains(@class, 'cursor-pointer')]")
-TYPE_TODO = (By.XPATH, "//div[contains(., 'Afazer') and contains(@class, 'cursor-pointer')]")
+TYPE_HABIT = register(
+    "type_habit",
+    By.XPATH, "//div[contains(., 'Hábito') and contains(@class, 'cursor-pointer')]",
+    (By.CSS_SELECTOR, "[role='dialog'] .grid-cols-2 > .cursor-pointer:nth-child(1)"),
+)
+TYPE_TODO = register(
+    "type_todo",
+    By.XPATH, "//div[contains(., 'Afazer') and contains(@class, 'cursor-pointer')]",
+    (By.CSS_SELECTOR, "[role='dialog'] .grid-cols-2 > .cursor-pointer:nth-child(2)"),
+)
+
+# Cards do modal de conquistas (components/achievements-modal.tsx lista só as desbloqueadas)
+ACHIEVEMENT_CARDS = (By.CSS_SELECTOR, "[role='dialog'] .space-y-2 > .cursor-pointer")
+ACHIEVEMENTS_LOADING = (By.CSS_SELECTOR, "[role='dialog'] .animate-spin")
+ACHIEVEMENT_ITEMS = (By.CSS_SELECTOR, "[class*='achievement'], [data-achievement]")
+UNLOCKED_ACHIEVEMENTS = register(
+    "unlocked_achievements",
+    By.XPATH,
+    "//div[contains(@class, 'achievement') and not(contains(@class, 'locked')) and not(contains(@class, 'grayscale'))]"
+)
+ACHIEVEMENT_SEARCH = (
+    By.CSS_SELECTOR,
+    "input[type='search'], input[placeholder*='Buscar'], input[placeholder*='Search']"
+)
+CLOSE_BUTTON = register(
+    "close_button",
+    By.XPATH,
+    "//button[contains(@aria-label, 'Close') or contains(@aria-label, 'Fechar') or contains(text(), '×')]"
+)
 
 # Achievement & profile triggers
-ACHIEVEMENTS_BUTTON = (
+ACHIEVEMENTS_BUTTON = register(
+    "achievements_button",
     By.XPATH,
     "//button[contains(text(), 'Ver Todas') or contains(text(), 'Ver todas')]"
 )
+ACHIEVEMENTS_BUTTON_FALLBACK = register(
+    "achievements_button_fallback",
+    By.XPATH,
+    "//button[contains(., 'Conquistas') or contains(., 'Achievements') or contains(., 'Ver Todas')]"
+)
+ACHIEVEMENTS_LINK = register(
+    "achievements_link",
+    By.XPATH,
+    "//a[contains(., 'Conquistas') or contains(., 'Achievements')]"
+)
 PROFILE_DROPDOWN = (
     By.CSS_SELECTOR,
     "[role='button'][class*='Avatar']"
 )
-PROFILE_MENU_ITEM = (
+# Avatar do header (SPAN com as iniciais) que abre o menu do perfil
+AVATAR = register(
+    "avatar",
+    By.XPATH,
+    "//span[contains(@class, 'cursor-pointer') and contains(@class, 'rounded-full') and contains(@class, 'border-2')]"
+)
+AVATAR_FALLBACK = register(
+    "avatar_fallback",
+    By.XPATH,
+    "//span[string-length(text())=2 and contains(@class, 'rounded-full')]"
+)
+PROFILE_MENU_ITEM = register(
+    "profile_menu_item",
     By.XPATH,
     "//div[contains(text(), 'Ver Perfil')]"
 )
+PROFILE_MENU_ITEM_FALLBACK = register(
+    "profile_menu_item_fallback",
+    By.XPATH,
+    "//div[.//svg and contains(., 'Ver Perfil')]"
+)
+
+# Profile modal
+PROFILE_CLOSE_BUTTON = register(
+    "profile_close_button",
+    By.XPATH,
+    "//button[contains(@aria-label, 'Close') or contains(@aria-label, 'Fechar') or contains(text(), '×') "
+    "or @data-state='open']"
+)
+THEME_BUTTON = register(
+    "theme_button",
+    By.XPATH,
+    "//button[contains(@aria-label, 'theme') or contains(@aria-label, 'tema') or contains(@title, 'Theme')]"
+)
+PROGRESS_TAB = register("progress_tab", By.XPATH, "//button[contains(text(), 'Progresso')]")
+# Botões pequenos do modal (navegação do calendário: filtrados pelos que têm ícone SVG)
+CALENDAR_NAV_BUTTONS = (By.CSS_SELECTOR, "[role='dialog'] button[class*='p-1']")
+SETTINGS_TAB = register(
+    "settings_tab",
+    By.XPATH,
+    "//button[@role='tab' and (contains(text(), 'Config') or contains(text(), 'Configurações'))]"
+)
+EDIT_BUTTON = register("edit_button", By.XPATH, "//button[contains(., 'Editar')]")
+SAVE_BUTTON = register("save_button", By.XPATH, "//button[contains(., 'Salvar')]")
+PROFILE_NAME = (By.ID, "name")
+AVATAR_OPTIONS = register(
+    "avatar_options",
+    By.XPATH,
+    "//div[@role='dialog']//button[contains(@class, 'rounded-lg') and contains(@class, 'border-2')]"
+)
+AVATAR_OPTIONS_FALLBACK = register(
+    "avatar_options_fallback",
+    By.XPATH,
+    "//div[@role='dialog']//div[contains(@class, 'grid')]//button"
+)
@@ -1,6 +1,7 @@
 """
 Utilitários para testes Selenium - DailyQuest
 """
+import logging
 import time
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
@@ -8,29 +9,93 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 
+import locators
+import log_pipeline
+import quiescence
+from tracing import tracer, traced
 
+# Ritmo das pausas de demonstração (ajustado pelo perfil de navegador)
+_pacing = {"scale": 1.0, "typing": True}
+
+
+def set_pacing(pause_scale=1.0, typing=True):
+    """Escala das pausas fixas e digitação caractere a caractere (profiles.install)"""
+    _pacing["scale"] = pause_scale
+    _pacing["typing"] = typing
+
+
+@traced("sleep")
 def wait(seconds=2.0):
-    """Pausa para esperar animações de UI"""
-    time.sleep(seconds)
+    """Espera a UI estabilizar (quiescência) ou pausa fixa como fallback"""
+    seconds *= _pacing["scale"]
+    if not quiescence.settle(seconds):
+        time.sleep(seconds)
+
+
+def cdp_setup(driver, method, params=None):
+    """
+    Executa um comando CDP de configuração da aba e o guarda em driver.cdp_setups
+
+    Comandos CDP valem só para a aba atual: driver_pool.reset os reaplica
+    quando troca o driver para uma aba em um contexto novo.
+    """
+    params = params or {}
+    result = driver.execute_cdp_cmd(method, params)
+    if not hasattr(driver, "cdp_setups"):
+        driver.cdp_setups = []
+    driver.cdp_setups.append((method, params))
+    return result
+
+
+def add_init_script(driver, source):
+    """Injeta script em todo documento novo (CDP) e na página atual"""
+    cdp_setup(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": source})
+    try:
+        driver.execute_script(source)
+    except Exception:
+        pass
 
 
+def _wait_located(driver, locator, condition, timeout):
+    """
+    WebDriverWait usando a estratégia resolvida pelo registro de locators
+
+    Uma alternativa validada nesta URL usa o timeout inteiro (se ela não
+    casar, o original também não casaria). Uma alternativa em cache de outra
+    URL recebe metade do timeout; se não casar, o locator original tenta com
+    o restante, sem estourar o tempo total.
+    """
+    strategy, validated = locators.resolve_checked(driver, locator)
+    started = time.perf_counter()
+    try:
+        if validated:
+            return WebDriverWait(driver, timeout).until(condition(strategy))
+        try:
+            return WebDriverWait(driver, timeout / 2).until(condition(strategy))
+        except TimeoutException:
+            locators.forget(locator)
+            strategy = tuple(locator)
+            remaining = max(0.0, timeout - (time.perf_counter() - started))
+            return WebDriverWait(driver, remaining).until(condition(strategy))
+    finally:
+        locators.record(locator, strategy, time.perf_counter() - started)
+
+
+@traced("wait")
 def wait_for_element(driver, locator, timeout=5):
     """Espera elemento ser visível"""
-    element = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located(locator)
-    )
-    return element
+    return _wait_located(driver, locator, EC.visibility_of_element_located, timeout)
 
 
+@traced("wait")
 def wait_for_clickable(driver, locator, timeout=5):
     """Espera elemento ser clicável"""
-    element = WebDriverWait(driver, timeout).until(
-        EC.element_to_be_clickable(locator)
-    )
-    time.sleep(0.2)
+    element = _wait_located(driver, locator, EC.element_to_be_clickable, timeout)
+    wait(0.2)
     return element
 
 
+@traced("wait")
 def wait_for_url_contains(driver, snippet, timeout=5):
     """Espera URL conter determinado texto"""
     try:
@@ -40,6 +105,7 @@ def wait_for_url_contains(driver, snippet, timeout=5):
         return False
 
 
+@traced("wait")
 def wait_for_invisibility(driver, locator, timeout=3):
     """Espera elemento desaparecer"""
     try:
@@ -50,39 +116,66 @@ def wait_for_invisibility(driver, locator, timeout=3):
         pass
 
 
+@traced("python")
 def safe_click(driver, locator, timeout=5):
     """Clique seguro com scroll e espera"""
     element = wait_for_clickable(driver, locator, timeout)
     driver.execute_script("arguments[0].scrollIntoView(true);", element)
-    time.sleep(0.2)
+    wait(0.2)
     element.click()
     return element
 
 
+@traced("python")
 def slow_type(element: WebElement, text: str, delay: float = 0.1):
-    """Digita devagar caractere por caractere"""
+    """Digita devagar caractere por caractere (de uma vez com quiescência ativa)"""
     try:
+        if not _pacing["typing"]:
+            element.send_keys(text)
+            return
+        if quiescence.active():
+            element.send_keys(text)
+            wait(delay * len(text))
+            return
         for character in text:
             element.send_keys(character)
-            time.sleep(delay)
+            with tracer.span("sleep", "sleep"):
+                time.sleep(delay)
     except Exception as e:
-        print(f"[Utils] Erro ao digitar: {e}")
+        log_action("[Utils] Erro ao digitar", str(e), logging.WARNING)
+
+
+@traced("wait")
+def find_element(driver, locator, timeout=5):
+    """Espera o elemento estar presente (TimeoutException se não aparecer)"""
+    return _wait_located(driver, locator, EC.presence_of_element_located, timeout)
+
 
+@traced("wait")
+def find_elements(driver, locator):
+    """driver.find_elements pela estratégia do registro de locators"""
+    strategy, validated = locators.resolve_checked(driver, locator)
+    elements = driver.find_elements(*strategy)
+    if not elements and not validated:
+        locators.forget(locator)
+        elements = driver.find_elements(*locator)
+    return elements
 
+
+@traced("wait")
 def find_element_safe(driver, locator, timeout=2):
     """Tenta encontrar elemento, retorna None se não existir"""
     try:
-        return WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
+        return _wait_located(driver, locator, EC.presence_of_element_located, timeout)
     except (TimeoutException, NoSuchElementException):
         return None
 
 
-def log_action(action, detail=""):
-    """Log formatado de ações"""
-    timestamp = time.strftime("%H:%M:%S")
-    if detail:
-        print(f"[{timestamp}] {action}: {detail}")
-    else:
-        print(f"[{timestamp}] {action}")
+def log_action(action, detail="", level=logging.INFO):
+    """Log formatado de ações (gravado em segundo plano por log_pipeline.py)"""
+    log_pipeline.emit(action, detail, level)
+
+
+def report(line=""):
+    """Linha de tabela dos relatórios (fora do stdout no modo de log JSON)"""
+    log_pipeline.report(line)
@@ -2,7 +2,18 @@
 Validadores para campos de entrada - DailyQuest
 """
 import re
-from datetime import datetime
+from datetime import date, timedelta
+from functools import partial
+
+# Padrões compilados uma única vez (reutilizados a cada chamada)
+USERNAME_PATTERN = re.compile(r'^[\w\s\-]+$', re.UNICODE)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# DD-MM-YYYY, DD/MM/YYYY, YYYY-MM-DD ou YYYY/MM/DD (mesmo separador nas duas posições)
+DEADLINE_PATTERN = re.compile(
+    r'^(?:(?P<day>\d{1,2})(?P<sep>[-/])(?P<month>\d{1,2})(?P=sep)(?P<year>\d{4})'
+    r'|(?P<iso_year>\d{4})(?P<iso_sep>[-/])(?P<iso_month>\d{1,2})(?P=iso_sep)(?P<iso_day>\d{1,2}))$'
+)
 
 
 class ValidationError(Exception):
@@ -31,7 +42,7 @@ def validate_username(username):
         raise ValidationError(f"Username muito longo (máximo 50 caracteres): '{username}'")
     
     # Permite letras, números, underscores, hífens e espaços
-    if not re.match(r'^[\w\s\-]+$', username, re.UNICODE):
+    if not USERNAME_PATTERN.match(username):
         raise ValidationError(f"Username contém caracteres inválidos: '{username}'")
     
     return username.strip()
@@ -53,9 +64,7 @@ def validate_email(email):
     if len(email) > 100:
         raise ValidationError(f"Email muito longo (máximo 100 caracteres): '{email}'")
     
-    # Regex básico para validar email
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not EMAIL_PATTERN.match(email):
         raise ValidationError(f"Email com formato inválido: '{email}'")
     
     return email
@@ -123,6 +132,29 @@ def validate_description(description, field_name="Descrição", required=False):
     return description
 
 
+def parse_deadline(deadline_str):
+    """
+    Converte o deadline em date, detectando o formato pela posição do ano
+    
+    Returns:
+        date, ou None se o formato ou a data forem inválidos
+    """
+    match = DEADLINE_PATTERN.match(deadline_str)
+    if not match:
+        return None
+    
+    parts = match.groupdict()
+    if parts["year"]:
+        year, month, day = parts["year"], parts["month"], parts["day"]
+    else:
+        year, month, day = parts["iso_year"], parts["iso_month"], parts["iso_day"]
+    
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
 def validate_deadline(deadline_str):
     """
     Valida deadline/prazo
@@ -135,31 +167,13 @@ def validate_deadline(deadline_str):
         raise ValidationError("Deadline não pode ser vazio")
     
     deadline_str = deadline_str.strip()
-    
-    # Tenta parsear diferentes formatos
-    date_formats = [
-        '%d-%m-%Y',  # DD-MM-YYYY
-        '%Y-%m-%d',  # YYYY-MM-DD
-        '%d/%m/%Y',  # DD/MM/YYYY
-        '%Y/%m/%d',  # YYYY/MM/DD
-    ]
-    
-    parsed_date = None
-    for date_format in date_formats:
-        try:
-            parsed_date = datetime.strptime(deadline_str, date_format)
-            break
-        except ValueError:
-            continue
+    parsed_date = parse_deadline(deadline_str)
     
     if not parsed_date:
         raise ValidationError(f"Deadline com formato inválido: '{deadline_str}'. Use DD-MM-YYYY ou YYYY-MM-DD")
     
     # Verifica se não é muito no passado (tolerância de 1 dia)
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    yesterday = today.replace(day=today.day - 1) if today.day > 1 else today
-    
-    if parsed_date.date() < yesterday.date():
+    if parsed_date < date.today() - timedelta(days=1):
         raise ValidationError(f"Deadline não pode ser no passado: '{deadline_str}'")
     
     return deadline_str
@@ -228,3 +242,139 @@ def validate_all_fields(fields_dict):
         raise ValidationError(f"Erros de validação:\n" + "\n".join(errors))
     
     return validated
+
+
+# Validadores por nome, para regras declaradas como {"campo": "email"}
+FIELD_VALIDATORS = {
+    "username": validate_username,
+    "email": validate_email,
+    "password": validate_password,
+    "title": validate_title,
+    "description": validate_description,
+    "deadline": validate_deadline,
+    "frequency": validate_frequency,
+    "category": validate_category,
+}
+
+
+class Rules:
+    """Regras compiladas: (campo, validador) já resolvidos, prontos para validar lotes"""
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+
+def compile_rules(schema):
+    """
+    Resolve as regras uma única vez
+    
+    Args:
+        schema: {campo: regra}, onde regra é o nome de um validador
+            (FIELD_VALIDATORS), a própria função ou (validador, {kwargs})
+            
+    Returns:
+        Rules reutilizável em validate_columns/validate_records
+    """
+    if isinstance(schema, Rules):
+        return schema
+    
+    fields = []
+    for field_name, rule in schema.items():
+        kwargs = {}
+        if isinstance(rule, tuple):
+            rule, kwargs = rule
+        validator = FIELD_VALIDATORS[rule] if isinstance(rule, str) else rule
+        if kwargs:
+            validator = partial(validator, **kwargs)
+        fields.append((field_name, validator))
+    return Rules(fields)
+
+
+class BatchReport:
+    """Resultado de um lote: colunas validadas e erros por linha"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.columns = {}   # campo -> valores validados (None nas linhas com erro)
+        self.errors = {}    # linha -> {campo: mensagem}
+
+    @property
+    def valid(self):
+        return not self.errors
+
+    def valid_rows(self):
+        return [row for row in range(self.rows) if row not in self.errors]
+
+    def record(self, row):
+        """Registro validado da linha"""
+        return {field_name: values[row] for field_name, values in self.columns.items()}
+
+    def messages(self):
+        return [
+            f"linha {row}: {field_name}: {message}"
+            for row in sorted(self.errors)
+            for field_name, message in self.errors[row].items()
+        ]
+
+    def raise_for_errors(self):
+        if self.errors:
+            raise ValidationError("Erros de validação:\n" + "\n".join(self.messages()))
+
+
+_MISSING = object()
+
+
+def validate_columns(columns, rules):
+    """
+    Valida colunas inteiras ({campo: [valores]}) em uma passada por campo
+    
+    Cada valor distinto de uma coluna é validado uma única vez (datas,
+    frequências e categorias se repetem muito em massas geradas); valores
+    não hasheáveis (ex: listas de dias) são validados linha a linha.
+    Colunas ausentes ou mais curtas contam como valores vazios.
+    
+    Returns:
+        BatchReport
+    """
+    rules = compile_rules(rules)
+    rows = max((len(values) for values in columns.values()), default=0)
+    report = BatchReport(rows)
+    
+    for field_name, validator in rules:
+        values = columns.get(field_name) or []
+        cache = {}
+        validated = []
+        for row in range(rows):
+            value = values[row] if row < len(values) else None
+            # O tipo entra na chave: True == 1 == 1.0 não devem compartilhar o resultado
+            key = (type(value), value)
+            try:
+                outcome = cache.get(key, _MISSING)
+            except TypeError:
+                key = outcome = _MISSING
+            if outcome is _MISSING:
+                try:
+                    outcome = (validator(value), None)
+                except ValidationError as e:
+                    outcome = (None, str(e))
+                if key is not _MISSING:
+                    cache[key] = outcome
+            validated.append(outcome[0])
+            if outcome[1] is not None:
+                report.errors.setdefault(row, {})[field_name] = outcome[1]
+        report.columns[field_name] = validated
+    
+    return report
+
+
+def validate_records(records, rules):
+    """Valida uma lista de registros (dicts) transpondo-os em colunas"""
+    rules = compile_rules(rules)
+    records = list(records)
+    return validate_columns(
+        {field_name: [record.get(field_name) for record in records] for field_name, _ in rules},
+        rules
+    )
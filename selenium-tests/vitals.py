@@ -0,0 +1,161 @@
+"""
+Web Vitals por passo - DailyQuest
+Coleta LCP, CLS, INP, long tasks, Navigation Timing, Resource Timing e heap JS
+(via CDP) durante o fluxo e anexa ao resultado de cada passo.
+"""
+import json
+
+from utils import add_init_script, cdp_setup, log_action, report
+
+# Observadores instalados em cada documento: acumulam métricas em window.__dqVitals
+OBSERVER_SCRIPT = """
+(function () {
+  if (window.__dqVitals || !window.PerformanceObserver) return;
+  var v = window.__dqVitals = {
+    lcp: null, cls: 0, inp: null, longTasks: [], interactions: {},
+    resourceIndex: 0, _session: 0, _sessionStart: 0, _sessionLast: 0
+  };
+  try { performance.setResourceTimingBufferSize(5000); } catch (e) {}
+  function observe(type, callback, options) {
+    try {
+      new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+        .observe(Object.assign({type: type, buffered: true}, options || {}));
+    } catch (e) {}
+  }
+  observe('largest-contentful-paint', function (e) { v.lcp = e.renderTime || e.loadTime || e.startTime; });
+  // CLS: maior janela de sessão (gap < 1s, janela < 5s), ignorando shifts após input
+  observe('layout-shift', function (e) {
+    if (e.hadRecentInput) return;
+    if (v._session && e.startTime - v._sessionLast < 1000 && e.startTime - v._sessionStart < 5000) {
+      v._session += e.value;
+    } else {
+      v._session = e.value; v._sessionStart = e.startTime;
+    }
+    v._sessionLast = e.startTime;
+    v.cls = Math.max(v.cls, v._session);
+  });
+  // INP: maior duração por interação (interactionId) do passo
+  observe('event', function (e) {
+    if (!e.interactionId) return;
+    var previous = v.interactions[e.interactionId] || 0;
+    v.interactions[e.interactionId] = Math.max(previous, e.duration);
+  }, {durationThreshold: 16});
+  observe('longtask', function (e) {
+    v.longTasks.push({start: Math.round(e.startTime), duration: Math.round(e.duration)});
+  });
+})();
+"""
+
+# Lê e zera os acumuladores do passo; retorna apenas os recursos novos
+COLLECT_SCRIPT = """
+var v = window.__dqVitals;
+var nav = performance.getEntriesByType('navigation')[0];
+var result = {
+  timeOrigin: performance.timeOrigin,
+  url: location.pathname,
+  navigation: nav ? nav.toJSON() : null,
+  lcp: v ? v.lcp : null,
+  cls: v ? v.cls : null,
+  inp: null,
+  longTasks: [],
+  resources: []
+};
+if (!v) return result;
+var durations = Object.keys(v.interactions).map(function (k) { return v.interactions[k]; });
+result.inp = durations.length ? Math.max.apply(null, durations) : null;
+result.longTasks = v.longTasks;
+var entries = performance.getEntriesByType('resource');
+result.resources = entries.slice(v.resourceIndex).map(function (e) {
+  return {
+    name: e.name, type: e.initiatorType, start: Math.round(e.startTime),
+    duration: Math.round(e.duration), transferSize: e.transferSize
+  };
+});
+v.resourceIndex = entries.length;
+v.interactions = {};
+v.longTasks = [];
+return result;
+"""
+
+# Métricas do CDP Performance.getMetrics anexadas a cada passo
+HEAP_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "LayoutCount", "RecalcStyleCount")
+
+NAVIGATION_FIELDS = (
+    "domainLookupStart", "connectStart", "requestStart", "responseStart",
+    "responseEnd", "domInteractive", "domContentLoadedEventEnd", "loadEventEnd",
+)
+
+
+def install(driver):
+    """Instala os observadores e habilita o domínio Performance do CDP"""
+    add_init_script(driver, OBSERVER_SCRIPT)
+    cdp_setup(driver, "Performance.enable")
+
+
+def collect(driver, last_origin=None):
+    """
+    Coleta as métricas acumuladas desde a última coleta
+
+    Navigation Timing só é incluído se houve navegação (timeOrigin mudou).
+    """
+    data = driver.execute_script(COLLECT_SCRIPT)
+    navigation = data.pop("navigation")
+    if navigation and data["timeOrigin"] != last_origin:
+        data["navigation"] = {field: round(navigation.get(field, 0), 1) for field in NAVIGATION_FIELDS}
+
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+    data["heap"] = {m["name"]: m["value"] for m in metrics if m["name"] in HEAP_METRICS}
+    return data
+
+
+class VitalsHook:
+    """Hook de passos: instala no driver na primeira vez e anexa result["vitals"]"""
+
+    def __init__(self):
+        self._installed = set()
+        self._origins = {}
+        self.results = []    # passos observados, em ordem (para print_summary/write)
+
+    def before_step(self, driver, result):
+        if id(driver) not in self._installed:
+            install(driver)
+            self._installed.add(id(driver))
+
+    def after_step(self, driver, result):
+        self.results.append(result)
+        try:
+            data = collect(driver, self._origins.get(id(driver)))
+        except Exception as e:
+            log_action("Web Vitals indisponíveis", str(e)[:80])
+            return
+        self._origins[id(driver)] = data["timeOrigin"]
+        result["vitals"] = data
+
+
+def print_summary(results):
+    """Imprime LCP/CLS/INP/long tasks/heap por passo"""
+    log_action("Web Vitals por passo (LCP ms / CLS / INP ms / long tasks / recursos / heap MB)")
+    for result in results:
+        v = result.get("vitals")
+        if not v:
+            continue
+        heap = v["heap"].get("JSHeapUsedSize", 0) / (1024 * 1024)
+        lcp = f"{v['lcp']:.0f}" if v["lcp"] is not None else "-"
+        inp = f"{v['inp']:.0f}" if v["inp"] is not None else "-"
+        report(
+            f"  {result['index']:>3} {result['action']:<28} {lcp:>6} {v['cls'] or 0:>6.3f} {inp:>5} "
+            f"{len(v['longTasks']):>3} {len(v['resources']):>4} {heap:>7.1f}"
+        )
+
+
+def write(results, path):
+    """Grava as métricas de cada passo em JSON (com "run" nos passos de --benchmark/--repeat/--network-matrix)"""
+    steps = []
+    for r in results:
+        step = {"index": r["index"], "action": r["action"], "vitals": r.get("vitals")}
+        if "run" in r:
+            step["run"] = r["run"]
+        steps.append(step)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(steps, f, indent=2, ensure_ascii=False)
+    return path
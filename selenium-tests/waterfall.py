@@ -0,0 +1,189 @@
+"""
+Waterfall de requisições por passo - DailyQuest
+Lê os eventos Network.* do log de performance do chromedriver
+(goog:loggingPrefs) ao fim de cada passo e monta a lista de requisições do
+passo (início, duração, status, bytes). Chamadas repetidas à mesma rota da
+API dentro de um passo são sinalizadas como sobre-busca (over-fetching).
+"""
+import json
+import re
+from urllib.parse import urlsplit
+
+from config import API_URL, AUTH_URL
+from utils import log_action, report
+
+API_ORIGINS = tuple(f"{urlsplit(url).scheme}://{urlsplit(url).netloc}" for url in (API_URL, AUTH_URL))
+
+# Segmentos de caminho que são identificadores (UUID ou número)
+ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$")
+
+NETWORK_EVENTS = {
+    "Network.requestWillBeSent",
+    "Network.responseReceived",
+    "Network.loadingFinished",
+    "Network.loadingFailed",
+    "Network.requestServedFromCache",
+}
+
+
+def endpoint(url):
+    """Rota normalizada: caminho com ids trocados por {id}, sem query (ex: /api/v1/tasks/{id}/complete)"""
+    path = urlsplit(url).path.rstrip("/") or "/"
+    return "/".join("{id}" if ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+def is_api(url):
+    return url.startswith(API_ORIGINS)
+
+
+class WaterfallHook:
+    """
+    Hook de passos: anexa result["network"] com as requisições iniciadas no passo
+
+    Requisições que terminam depois do fim do passo são completadas quando
+    os eventos chegam (o registro é o mesmo objeto já anexado ao passo).
+    """
+
+    def __init__(self):
+        self._pending = {}   # requestId -> registro
+        self._current = []
+        self.results = []    # passos observados, em ordem (para print_summary/write)
+
+    def _drain(self, driver):
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            log_action("Log de performance indisponível", str(e)[:80])
+            return
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") in NETWORK_EVENTS:
+                self._handle(message["method"], message.get("params", {}))
+
+    def _handle(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            previous = self._pending.get(request_id)
+            if previous and params.get("redirectResponse"):
+                previous.update(status=params["redirectResponse"].get("status"), end=params["timestamp"])
+            request = params["request"]
+            record = {
+                "url": request["url"],
+                "method": request["method"],
+                "type": params.get("type", "Other"),
+                "start": params["timestamp"],
+                "wall_time": params.get("wallTime"),
+                "end": None,
+                "status": None,
+                "bytes": 0,
+                "from_cache": False,
+                "failed": None,
+            }
+            self._pending[request_id] = record
+            self._current.append(record)
+            return
+        record = self._pending.get(request_id)
+        if record is None:
+            return
+        if method == "Network.responseReceived":
+            response = params["response"]
+            record["status"] = response.get("status")
+            record["from_cache"] = record["from_cache"] or response.get("fromDiskCache", False)
+        elif method == "Network.requestServedFromCache":
+            record["from_cache"] = True
+        elif method == "Network.loadingFinished":
+            record.update(end=params["timestamp"], bytes=params.get("encodedDataLength", 0))
+            del self._pending[request_id]
+        elif method == "Network.loadingFailed":
+            record.update(end=params["timestamp"], failed=params.get("errorText", "falha"))
+            del self._pending[request_id]
+
+    def before_step(self, driver, result):
+        # Requisições entre passos (ex: polling em segundo plano) ficam fora do passo
+        self._drain(driver)
+        self._current = []
+
+    def after_step(self, driver, result):
+        self._drain(driver)
+        result["network"] = {"requests": self._current}
+        self.results.append(result)
+        self._current = []
+
+
+def analyze(requests):
+    """Totais do passo e chamadas repetidas à API (mesmo método e rota)"""
+    calls = {}
+    for request in requests:
+        if request["method"] == "OPTIONS" or request["type"] == "Preflight" or not is_api(request["url"]):
+            continue
+        calls.setdefault((request["method"], endpoint(request["url"])), []).append(request)
+    duplicates = [
+        {
+            "method": method,
+            "endpoint": route,
+            "count": len(group),
+            "identical": len(group) - len({r["url"] for r in group}),
+        }
+        for (method, route), group in sorted(calls.items())
+        if len(group) > 1
+    ]
+    return {
+        "requests": len(requests),
+        "api_calls": sum(len(group) for group in calls.values()),
+        "bytes": sum(r["bytes"] for r in requests),
+        "duplicates": duplicates,
+    }
+
+
+def print_summary(results):
+    """Requisições, chamadas à API, bytes e rotas repetidas por passo"""
+    log_action("Rede por passo (requisições / chamadas API / KB)")
+    flagged = 0
+    for result in results:
+        network = result.get("network")
+        if not network:
+            continue
+        stats = analyze(network["requests"])
+        report(
+            f"  {result['index']:>3} {result['action']:<28} {stats['requests']:>4} {stats['api_calls']:>4} "
+            f"{stats['bytes'] / 1024:>8.1f}"
+        )
+        for duplicate in stats["duplicates"]:
+            flagged += 1
+            identical = f", {duplicate['identical']} idêntica(s)" if duplicate["identical"] else ""
+            report(f"        ⚠ {duplicate['method']} {duplicate['endpoint']} x{duplicate['count']}{identical}")
+    if flagged:
+        log_action("Chamadas repetidas à API", f"{flagged} rota(s) buscada(s) mais de uma vez no mesmo passo")
+
+
+def write(results, path):
+    """
+    Grava o waterfall de cada passo (início/fim em ms relativos à primeira requisição do passo)
+
+    Passos com "run" (iteração do --benchmark/--repeat ou perfil do
+    --network-matrix) levam o campo no arquivo.
+    """
+    steps = []
+    for result in results:
+        requests = (result.get("network") or {}).get("requests", [])
+        origin = min((r["start"] for r in requests), default=0)
+        step = {
+            "index": result["index"],
+            "action": result["action"],
+            "summary": analyze(requests),
+            "waterfall": [
+                dict(
+                    r,
+                    endpoint=endpoint(r["url"]),
+                    start=round((r["start"] - origin) * 1000, 1),
+                    end=round((r["end"] - origin) * 1000, 1) if r["end"] is not None else None,
+                )
+                for r in sorted(requests, key=lambda r: r["start"])
+            ],
+        }
+        if "run" in result:
+            step["run"] = result["run"]
+        steps.append(step)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(steps, f, indent=2, ensure_ascii=False)
+    return path